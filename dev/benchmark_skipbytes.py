@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
+
+# Run this script from the root directory of the project.
+#
+# Compares asjagged's removal of per-entry headers (skipbytes) with the basket-sized
+# mask that it used to build, for a range of header sizes, item sizes, and entry sizes.
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(""))
+
+import time
+
+import numpy
+
+from uproot3.interp.jagged import _skipheaders
+
+def mask_method(data, bytestarts, bytestops):
+    mask = numpy.zeros(len(data), dtype=numpy.int8)
+    mask[bytestarts[bytestarts < len(data)]] = 1
+    numpy.add.at(mask, bytestops[bytestops < len(data)], -1)
+    numpy.cumsum(mask, out=mask)
+    return data[mask.view(numpy.bool_)]
+
+def timeit(fcn, repeat=5):
+    fcn()
+    start = time.time()
+    for i in range(repeat):
+        fcn()
+    return (time.time() - start) / repeat
+
+basketbytes = 4000000
+
+print("{0:>8s} {1:>9s} {2:>13s} {3:>9s} {4:>10s} {5:>10s} {6:>8s}".format("itemsize", "skipbytes", "items/entry", "entries", "mask", "gather", "speedup"))
+for itemsize in [1, 4, 8]:
+    for skipbytes in [1, 6, 10]:
+        for itemsperentry in [1, 10, 100, 1000]:
+            numentries = basketbytes // (itemsperentry * itemsize + skipbytes)
+            entrybytes = numpy.random.poisson(itemsperentry, numentries) * itemsize + skipbytes
+            byteoffsets = numpy.zeros(numentries + 1, dtype=numpy.int64)
+            numpy.cumsum(entrybytes, out=byteoffsets[1:])
+            data = numpy.random.randint(0, 256, byteoffsets[-1]).astype(numpy.uint8)
+            bytestarts = byteoffsets[:-1] + skipbytes
+            bytestops = byteoffsets[1:]
+
+            assert numpy.array_equal(mask_method(data, bytestarts, bytestops), _skipheaders(data, bytestarts, bytestops, itemsize, numpy))
+
+            old = timeit(lambda: mask_method(data, bytestarts, bytestops))
+            new = timeit(lambda: _skipheaders(data, bytestarts, bytestops, itemsize, numpy))
+            print("{0:8d} {1:9d} {2:13d} {3:9d} {4:8.1f}ms {5:8.1f}ms {6:7.1f}x".format(itemsize, skipbytes, itemsperentry, numentries, old * 1000, new * 1000, old / new))
@@ -2,6 +2,8 @@
 
 # BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
 
+import pytest
+
 import uproot3
 
 class Test(object):
@@ -117,3 +119,44 @@ class Test(object):
             assert len(keycache) > 0
             assert branch.array(entrystart=entrystart, entrystop=entrystop, keycache=keycache).tolist() == expectation[entrystart:entrystop]
             keycache = {}
+
+    def test_keycache_table(self):
+        branch = uproot3.open("tests/samples/sample-6.10.05-zlib.root")["sample"]["i8"]
+        keycache = {}
+        assert branch.array(keycache=keycache).tolist() == branch.array().tolist()
+        assert len(keycache) == 1
+        keytable, = keycache.values()
+        assert len(keytable) == branch.numbaskets
+        assert keytable["loaded"].all()
+        assert keytable["fObjlen"].tolist() == [branch.basket_uncompressedbytes(i) for i in range(branch.numbaskets)]
+        assert (keytable["fNbytes"] - keytable["fKeylen"]).tolist() == [branch.basket_compressedbytes(i) for i in range(branch.numbaskets)]
+
+        keycache = {}
+        branch.basket(1, keycache=keycache)
+        keytable, = keycache.values()
+        assert keytable["loaded"].tolist() == [i == 1 for i in range(branch.numbaskets)]
+
+    def test_objectcache(self, tmp_path):
+        objectcache = uproot3.ObjectCache("1 MB")
+        f = uproot3.open("tests/samples/sample-6.10.05-zlib.root", objectcache=objectcache)
+        assert f["sample"] is f["sample"]
+        assert len(objectcache) == 1
+        with pytest.raises(TypeError):
+            objectcache["sample"] = f["sample"]
+
+        # a TTree is bound to the file handle that read it, so reopening the file must not return a closed one
+        reopened = uproot3.ObjectCache("1 MB")
+        for i in range(2):
+            with uproot3.open("tests/samples/sample-6.10.05-zlib.root", objectcache=reopened) as f:
+                assert f["sample"].array("i8").tolist() == list(range(-15, 15))
+
+        filename = str(tmp_path / "example.root")
+        with uproot3.recreate(filename, compression=None) as w:
+            w["hello"] = "world"
+        assert uproot3.open(filename, objectcache=objectcache)["hello"] == b"world"
+        assert len(objectcache) == 2
+
+        with uproot3.recreate(filename, compression=None) as w:
+            w["hello"] = "earth"
+        assert uproot3.open(filename, objectcache=objectcache)["hello"] == b"earth"
+        assert len(objectcache) == 2
@@ -118,6 +118,12 @@ class Test(object):
         assert equal(withoffsets.array("Muon_pt"), nooffsets.array("Muon_pt"))
         assert equal(withoffsets.array("event"), nooffsets.array("event"))
 
+        branches = ["Jet_jetId", "Jet_pt", "Muon_charge", "Muon_pt"]
+        for x, y in zip(withoffsets.iterate(branches, entrysteps=7),
+                        nooffsets.iterate(branches, entrysteps=7)):
+            for branch in branches:
+                assert equal(x[branch.encode()], y[branch.encode()])
+
     def test_issue57(self):
         tree = uproot3.open("tests/samples/issue57.root")["outtree"]
         for x in tree["sel_lep"].array():
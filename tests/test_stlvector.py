@@ -3,6 +3,7 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
 
 import os
+import struct
 
 import pytest
 
@@ -52,3 +53,32 @@ class Test(object):
     def test_slice(self):
         tree = uproot3.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"]
         assert tree.array("SliceI16").tolist() == [[], [1], [2, 2], [3, 3, 3], [4, 4, 4, 4], [5, 5, 5, 5, 5], [6, 6, 6, 6, 6, 6], [7, 7, 7, 7, 7, 7, 7], [8, 8, 8, 8, 8, 8, 8, 8], [9, 9, 9, 9, 9, 9, 9, 9, 9], [], [11], [12, 12], [13, 13, 13], [14, 14, 14, 14], [15, 15, 15, 15, 15], [16, 16, 16, 16, 16, 16], [17, 17, 17, 17, 17, 17, 17], [18, 18, 18, 18, 18, 18, 18, 18], [19, 19, 19, 19, 19, 19, 19, 19, 19], [], [21], [22, 22], [23, 23, 23], [24, 24, 24, 24], [25, 25, 25, 25, 25], [26, 26, 26, 26, 26, 26], [27, 27, 27, 27, 27, 27, 27], [28, 28, 28, 28, 28, 28, 28, 28], [29, 29, 29, 29, 29, 29, 29, 29, 29], [], [31], [32, 32], [33, 33, 33], [34, 34, 34, 34], [35, 35, 35, 35, 35], [36, 36, 36, 36, 36, 36], [37, 37, 37, 37, 37, 37, 37], [38, 38, 38, 38, 38, 38, 38, 38], [39, 39, 39, 39, 39, 39, 39, 39, 39], [], [41], [42, 42], [43, 43, 43], [44, 44, 44, 44], [45, 45, 45, 45, 45], [46, 46, 46, 46, 46, 46], [47, 47, 47, 47, 47, 47, 47], [48, 48, 48, 48, 48, 48, 48, 48], [49, 49, 49, 49, 49, 49, 49, 49, 49], [], [51], [52, 52], [53, 53, 53], [54, 54, 54, 54], [55, 55, 55, 55, 55], [56, 56, 56, 56, 56, 56], [57, 57, 57, 57, 57, 57, 57], [58, 58, 58, 58, 58, 58, 58, 58], [59, 59, 59, 59, 59, 59, 59, 59, 59], [], [61], [62, 62], [63, 63, 63], [64, 64, 64, 64], [65, 65, 65, 65, 65], [66, 66, 66, 66, 66, 66], [67, 67, 67, 67, 67, 67, 67], [68, 68, 68, 68, 68, 68, 68, 68], [69, 69, 69, 69, 69, 69, 69, 69, 69], [], [71], [72, 72], [73, 73, 73], [74, 74, 74, 74], [75, 75, 75, 75, 75], [76, 76, 76, 76, 76, 76], [77, 77, 77, 77, 77, 77, 77], [78, 78, 78, 78, 78, 78, 78, 78], [79, 79, 79, 79, 79, 79, 79, 79, 79], [], [81], [82, 82], [83, 83, 83], [84, 84, 84, 84], [85, 85, 85, 85, 85], [86, 86, 86, 86, 86, 86], [87, 87, 87, 87, 87, 87, 87], [88, 88, 88, 88, 88, 88, 88, 88], [89, 89, 89, 89, 89, 89, 89, 89, 89], [], [91], [92, 92], [93, 93, 93], [94, 94, 94, 94], [95, 95, 95, 95, 95], [96, 96, 96, 96, 96, 96], [97, 97, 97, 97, 97, 97, 97], [98, 98, 98, 98, 98, 98, 98, 98], [99, 99, 99, 99, 99, 99, 99, 99, 99]]
+
+    def test_stlvector_fastpath(self):
+        branch = uproot3.open("tests/samples/vectorVectorDouble.root")["t"]["x"]
+        assert isinstance(branch.interpretation, uproot3.asstlvector)
+        assert branch.array().tolist() == branch.array(uproot3.asgenobj(uproot3.STLVector(uproot3.STLVector(uproot3.asdtype(">f8"))), branch._context, 6)).tolist()
+
+        # strings of 255 bytes or more have a 4-byte length after a 255 marker
+        awkward0 = uproot3.interp.interp.Interpretation.awkward0
+        long = b"x" * 300
+        entry = struct.pack(">iB", 2, 3) + b"abc" + struct.pack(">BI", 255, len(long)) + long
+        jagged = awkward0.JaggedArray.fromcounts([4, len(entry)], awkward0.numpy.frombuffer(struct.pack(">i", 0) + entry, awkward0.numpy.uint8))
+        assert uproot3.asstlvector(uproot3.STLString(awkward0))._fromjagged(jagged).tolist() == [[], [b"abc", long]]
+
+    def test_stlmap(self):
+        branch = uproot3.open("tests/samples/issue371.root")["Model"]["Model.collimatorIndicesByName"]
+        assert isinstance(branch.interpretation, uproot3.asstlmap)
+        assert branch.array().tolist() == [{}]
+
+        # one object-wise and one member-wise map
+        awkward0 = uproot3.interp.interp.Interpretation.awkward0
+        objectwise = struct.pack(">i", 2) + b"\x01a" + struct.pack(">i", 1) + b"\x02bb" + struct.pack(">i", 2)
+        memberwise = struct.pack(">HIi", 0, 0, 2) + b"\x01c\x01d" + struct.pack(">ii", 3, 4)
+        entries = [struct.pack(">IH", 0x40000000 | (len(objectwise) + 2), 9) + objectwise, struct.pack(">IH", 0x40000000 | (len(memberwise) + 2), 0x4009) + memberwise]
+        jagged = awkward0.JaggedArray.fromcounts([len(x) for x in entries], awkward0.numpy.frombuffer(b"".join(entries), awkward0.numpy.uint8))
+        out = uproot3.asstlmap(uproot3.STLString(awkward0), uproot3.asdtype(">i4"))._fromjagged(jagged)
+        assert out["keys"].tolist() == [[b"a", b"bb"], [b"c", b"d"]]
+        assert out["values"].tolist() == [[1, 2], [3, 4]]
+        out = uproot3.asstlmap(uproot3.STLString(awkward0), uproot3.asdtype(">i4"), dicts=True)._fromjagged(jagged)
+        assert out.tolist() == [{b"a": 1, b"bb": 2}, {b"c": 3, b"d": 4}]
@@ -2,7 +2,10 @@
 
 # BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
 
+import functools
 import os
+import struct
+import threading
 from collections import namedtuple
 
 import numpy
@@ -57,6 +60,15 @@ class Test(object):
         assert numpy.array_equal(four, numpy.array([-15, -14, -13], dtype=">i8"))
         assert basest(four) is buf
 
+        bigendian = uproot3.asdtype(">i8", native=False)
+        five = branch.basket(0, bigendian)
+        assert five.dtype == numpy.dtype(">i8")
+        assert numpy.array_equal(five, numpy.array([-15, -14, -13], dtype=">i8"))
+        assert not five.flags.owndata
+        six = branch.array(bigendian, entrystart=2, entrystop=8)
+        assert six.dtype == numpy.dtype(">i8")
+        assert numpy.array_equal(six, numpy.arange(-13, -7))
+
     def test_regular_basket(self):
         branch = uproot3.open("tests/samples/sample-6.10.05-uncompressed.root")["sample"]["ai8"]
         interpretation = branch._normalize_interpretation(None, awkward0)
@@ -109,7 +121,7 @@ class Test(object):
         two = branch.basket(0, interpretation, local_entrystart, local_entrystop)
 
         assert one.tolist() == [b"hey-0", b"hey-1", b"hey-2", b"hey-3", b"hey-4", b"hey-5"]
-        assert basest(one.content.content) is not basest(two.content.content)
+        assert basest(one.content) is not basest(two.content)
 
         three = branch.basket(0)
         assert three.tolist() == [b"hey-0", b"hey-1", b"hey-2", b"hey-3", b"hey-4", b"hey-5"]
@@ -194,6 +206,85 @@ class Test(object):
         for n in 1000, 5, 6, 7:
             assert [x.tolist() for (x,) in tree.iterate("str", n, outputtype=tuple)] == [expectation[x : x + n] for x in range(0, len(expectation), n)]
 
+    def test_outputs(self):
+        tree = uproot3.open("tests/samples/sample-6.10.05-uncompressed.root")["sample"]
+        expectation = list(range(-15, 15))
+        buf = numpy.zeros(30, dtype=numpy.float64)
+        for entrystart, entrystop in [(None, None), (1, 10), (6, 13)]:
+            out = tree.array("i8", entrystart=entrystart, entrystop=entrystop, out=buf)
+            assert out.tolist() == expectation[entrystart:entrystop]
+            assert basest(out) is buf
+
+        content = numpy.zeros(100, dtype=numpy.int64)
+        out = tree.array("Ai8", entrystart=6, entrystop=13, out=content)
+        assert out.tolist() == [[-10], [-10, -8], [-10, -8, -6], [-10, -8, -6, -4], [], [-5], [-5, -3]]
+        assert basest(out.content) is content
+
+        for n in 5, 7:
+            for start, stop, arrays in tree.iterate(["i8"], n, reportentries=True, outputs={"i8": buf}):
+                assert basest(arrays[b"i8"]) is buf
+                assert arrays[b"i8"].tolist() == expectation[start:stop]
+
+    def test_memory_budget(self):
+        tree = uproot3.open("tests/samples/sample-6.10.05-uncompressed.root")["sample"]
+        budget = uproot3.MemoryBudget("2 kB")
+        result = []
+        for arrays in tree.iterate(["i8", "Ai8"], memory_budget=budget):
+            result.extend(arrays[b"i8"].tolist())
+        assert result == list(range(-15, 15))
+        assert budget.reserved == 0
+        assert 0 < budget.peak
+
+        # the key tables don't fit in the keycache made for this budget and are read again; a user's ArrayCache still refuses them
+        with pytest.raises(ValueError):
+            uproot3.ArrayCache(256)["big"] = numpy.zeros(100)
+
+    def test_prefetch(self):
+        tree = uproot3.open("tests/samples/sample-6.10.05-uncompressed.root")["sample"]
+        expectation = [(start, stop, arrays[b"Ai8"].tolist()) for start, stop, arrays in tree.iterate(["i8", "Ai8"], 4, reportentries=True)]
+        for prefetch in 1, 3, 100:
+            assert [(start, stop, arrays[b"Ai8"].tolist()) for start, stop, arrays in tree.iterate(["i8", "Ai8"], 4, reportentries=True, prefetch=prefetch)] == expectation
+
+    def test_async(self):
+        asyncio = pytest.importorskip("asyncio")
+        tree = uproot3.open("tests/samples/sample-6.10.05-uncompressed.root")["sample"]
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            i8, arrays = loop.run_until_complete(asyncio.gather(tree.array_async("i8"), tree.arrays_async(["Ai8"], entrystart=6, entrystop=13)))
+            assert i8.tolist() == list(range(-15, 15))
+            assert arrays[b"Ai8"].tolist() == [[-10], [-10, -8], [-10, -8, -6], [-10, -8, -6, -4], [], [-5], [-5, -3]]
+
+            iterator = tree.aiterate(["i8"], 7, reportentries=True)
+            steps = []
+            while True:
+                try:
+                    start, stop, arrays = loop.run_until_complete(iterator.__anext__())
+                except StopAsyncIteration:
+                    break
+                steps.append((start, stop, arrays[b"i8"].tolist()))
+            assert steps == [(start, stop, list(range(-15, 15))[start:stop]) for start, stop in [(0, 7), (7, 14), (14, 21), (21, 28), (28, 30)]]
+
+            # while one read's baskets are in flight, it holds no thread: another read can use the loop's only thread
+            futures = pytest.importorskip("concurrent.futures")
+            pool, gate = futures.ThreadPoolExecutor(2), threading.Event()
+            class GatedExecutor(object):
+                def submit(self, fcn, *args):
+                    return pool.submit(lambda: gate.wait() and fcn(*args))
+                def map(self, fcn, *iterables):
+                    return (x.result() for x in [self.submit(fcn, *args) for args in zip(*iterables)])
+            loop.set_default_executor(futures.ThreadPoolExecutor(1))
+            async_first = asyncio.ensure_future(tree.array_async("i8", executor=GatedExecutor()), loop=loop)
+            second = loop.run_until_complete(asyncio.wait_for(tree.array_async("Ai8"), 10))
+            assert not async_first.done()
+            gate.set()
+            assert loop.run_until_complete(async_first).tolist() == list(range(-15, 15))
+            assert second.tolist() == tree.array("Ai8").tolist()
+            pool.shutdown()
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
     ###################################################### old tests
 
     def test_branch_array(self):
@@ -414,6 +505,23 @@ class Test(object):
             i += 1
             if i > 30: i = 0
 
+    def test_tree_iterator_files_ahead(self):
+        paths = ["tests/samples/foriter.root", "tests/samples/sample-6.10.05-uncompressed.root", "tests/samples/foriter.root", "tests/samples/foriter.root"]
+        expectation = [(path, start, stop, arrays[b"data"].tolist()) for path, start, stop, arrays in uproot3.iterate(paths, "foriter", "data", 7, reportpath=True, reportentries=True)]
+        assert len(expectation) == 21
+        for openahead, parallelfiles in (2, 1), (0, 2), (5, 3):
+            assert [(path, start, stop, arrays[b"data"].tolist()) for path, start, stop, arrays in uproot3.iterate(paths, "foriter", "data", 7, reportpath=True, reportentries=True, openahead=openahead, parallelfiles=parallelfiles)] == expectation
+
+    def test_partition_mapreduce(self):
+        paths = ["tests/samples/sample-6.10.05-zlib.root", "tests/samples/sample-5.30.00-uncompressed.root"]
+        assert uproot3.partition(paths, "sample", ["i8", "Ai8"], 1) == [(path, start, stop) for path in paths for start, stop in uproot3.open(path)["sample"].clusters(["i8", "Ai8"])]
+        assert uproot3.partition(paths, "sample", ["i8", "Ai8"], 400) == [(path, start, stop) for path in paths for start, stop in [(0, 15), (15, 30)]]
+        assert uproot3.partition(paths, "sample", ["i8", "Ai8"], "1 MB") == [(path, 0, 30) for path in paths]
+
+        executor = pytest.importorskip("concurrent.futures").ThreadPoolExecutor(2)
+        tasks = uproot3.partition(paths, "sample", ["i8", "Ai8"], 200)
+        assert uproot3.mapreduce(tasks, "sample", lambda tree, start, stop: tree.array("i8", entrystart=start, entrystop=stop).tolist(), lambda x, y: sorted(x + y), executor=executor) == sorted(2 * list(range(-15, 15)))
+
     def test_directories(self):
         file = uproot3.open("tests/samples/nesteddirs.root")
 
@@ -440,6 +548,35 @@ class Test(object):
         assert file["one/two/tree;1"].array("Int32").shape == (100,)
         assert file["three/tree;1"].array("I32").shape == (100,)
 
+    def test_prefetched_metadata(self):
+        def filesource(path):
+            return uproot3.source.file.FileSource(path, **uproot3.source.file.FileSource.defaults)
+
+        for path in ["tests/samples/nesteddirs.root", "tests/samples/small-evnt-tree-fullsplit.root"]:
+            memmapped = uproot3.open(path)
+            chunked = uproot3.open(path, localsource=filesource)
+            assert [(n, cls._classname) for n, cls in chunked.allclasses()] == [(n, cls._classname) for n, cls in memmapped.allclasses()]
+
+        tree = uproot3.open("tests/samples/small-evnt-tree-fullsplit.root", localsource=filesource)["tree"]
+        assert list(tree.allkeys()) == list(uproot3.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"].allkeys())
+        assert tree.array("P3.Px").tolist() == uproot3.open("tests/samples/small-evnt-tree-fullsplit.root")["tree"].array("P3.Px").tolist()
+
+    def test_getmany(self):
+        file = uproot3.open("tests/samples/nesteddirs.root")
+        names = [b"three/tree;1", b"one/tree", b"one/two/tree", b"three"]
+        assert [x.__class__.__name__ for x in file.getmany(names)] == ["TTree", "TTree", "TTree", "ROOTDirectory"]
+        assert [list(x.keys()) for x in file.getmany(names[:3])] == [list(file[name].keys()) for name in names[:3]]
+
+        executor = pytest.importorskip("concurrent.futures").ThreadPoolExecutor(2)
+        assert [name for name, x in file.allitems(executor=executor)] == [name for name, x in file.allitems()]
+        assert [list(x.keys()) for x in file.getmany(names[:3], executor=executor)] == [list(file[name].keys()) for name in names[:3]]
+        assert file.allclasses(executor=executor) == file.allclasses()
+        assert list(file.iterkeys(recursive=True, filtername=lambda name: name == b"tree", executor=executor)) == [b"one/two/tree;1", b"one/tree;1", b"three/tree;1"]
+
+        # at most _prefetchdirs subdirectories are read ahead, across all levels, and the order is still depth-first
+        file._prefetchdirs = 1
+        assert file.allkeys(executor=executor) == file.allkeys()
+
     def test_cast(self):
         tree = uproot3.open("tests/samples/Zmumu.root")["events"]
         one = numpy.cast[numpy.int32](numpy.floor(tree.array("M")))
@@ -676,4 +813,180 @@ class Test(object):
     def test_mempartitions(self):
         t = uproot3.open("tests/samples/sample-5.23.02-zlib.root")["sample"]
         assert list(t.mempartitions(500)) == [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (14, 16), (16, 18), (18, 20), (20, 22), (22, 24), (24, 26), (26, 28), (28, 30)]
-        assert [sum(y.nbytes for y in x.values()) for x in t.iterate(entrysteps="0.5 kB")] == [693, 865, 822, 779, 951, 695, 867, 824, 781, 953, 695, 867, 824, 781, 953]
+        assert [sum(y.nbytes for y in x.values()) for x in t.iterate(entrysteps="0.5 kB")] == [703, 875, 832, 789, 961, 705, 877, 834, 791, 963, 705, 877, 834, 791, 963]
+
+        # planned from the TBranches' basket sizes alone, without reading any basket keys
+        keycache = {}
+        assert list(t.mempartitions(500, keycache=keycache)) == [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (14, 16), (16, 18), (18, 20), (20, 22), (22, 24), (24, 26), (26, 28), (28, 30)]
+        assert list(t.clusters(["i8", "Ai8"])) == [(0, 3), (3, 9), (9, 12), (12, 15), (15, 18), (18, 24), (24, 27), (27, 30)]
+        assert keycache == {}
+
+    def test_basketstartstop(self):
+        branch = uproot3.open("tests/samples/sample-6.10.05-zlib.root")["sample"]["i8"]
+        starts = [branch.basket_entrystart(i) for i in range(branch.numbaskets)]
+        stops = [branch.basket_entrystop(i) for i in range(branch.numbaskets)]
+        for entrystart in range(branch.numentries + 1):
+            for entrystop in range(entrystart, branch.numentries + 1):
+                overlapping = [i for i in range(branch.numbaskets) if entrystart < stops[i] and starts[i] < entrystop]
+                if len(overlapping) == 0:
+                    assert branch._basketstartstop(entrystart, entrystop) == (None, None)
+                else:
+                    assert branch._basketstartstop(entrystart, entrystop) == (overlapping[0], overlapping[-1] + 1)
+        assert branch._basket_entryoffset(2, 5) == [0, stops[2] - starts[2], stops[3] - starts[2], stops[4] - starts[2]]
+        assert branch._basket_itemoffset(branch.interpretation, 2, 5, {}) == branch._basket_entryoffset(2, 5)
+
+    def test_entries(self):
+        tree = uproot3.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        entries = [0, 3, 4, 17, 29]
+        for name in [b"i8", b"Ai8", b"af8", b"str"]:
+            assert tree.array(name, entries=entries).tolist() == [tree.array(name).tolist()[i] for i in entries]
+
+        arrays = tree.arrays([b"i4", b"Af8"], entries=numpy.arange(30) % 7 == 0)
+        assert arrays[b"i4"].tolist() == [-15, -8, -1, 6, 13]
+        assert arrays[b"Af8"].counts.tolist() == [0, 2, 4, 1, 3]
+        assert arrays[b"Af8"].content.tolist() == arrays[b"Af8"].flatten().tolist()
+
+        branch = tree[b"i8"]
+        keycache = {}
+        branch.array(entries=[25], keycache=keycache)
+        assert keycache[branch._keycachekey()]["loaded"].tolist() == [i == branch._basketstartstop(25, 26)[0] for i in range(branch.numbaskets)]
+
+        with pytest.raises(ValueError):
+            branch.array(entries=[3, 2])
+        with pytest.raises(IndexError):
+            branch.array(entries=[30])
+
+    def test_cut(self):
+        tree = uproot3.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        full = tree.arrays([b"i4", b"f8", b"Af8", b"str"])
+        mask = (full[b"i4"] % 3 == 0) & (full[b"f8"] > -10)
+
+        arrays = tree.arrays([b"i4", b"Af8", b"str"], cut="(i4 % 3 == 0) & (f8 > -10)")
+        for name in [b"i4", b"Af8", b"str"]:
+            assert arrays[name].tolist() == full[name][mask].tolist()
+
+        arrays = tree.arrays([b"Af8"], cut=lambda x: x["Af8"].counts > 2)
+        assert arrays[b"Af8"].tolist() == full[b"Af8"][full[b"Af8"].counts > 2].tolist()
+
+        steps = [(start, stop, arrays[b"str"].tolist()) for start, stop, arrays in tree.iterate([b"str"], entrysteps=7, cut="numpy.abs(i4) < 5", reportentries=True)]
+        assert steps == [(0, 7, []), (7, 14, [b"hey-11", b"hey-12", b"hey-13"]), (14, 21, [b"hey-14", b"hey-15", b"hey-16", b"hey-17", b"hey-18", b"hey-19"]), (21, 28, []), (28, 30, [])]
+
+        with pytest.raises(ValueError):
+            tree.arrays([b"i4"], cut="Af8 > 0")
+
+    def test_basketscheduler(self):
+        class SerialExecutor(object):
+            class Done(object):
+                def add_done_callback(self, fn):
+                    fn(self)
+            def submit(self, fn):
+                fn()
+                return self.Done()
+
+        order = []
+        def fill(j):
+            order.append(j)
+            return j * 10
+        scheduler = uproot3.tree._BasketScheduler(SerialExecutor(), maxinflight=2)
+        results = scheduler.map(fill, [30, 10, 20, 40], [1, 5, 9, 2])
+        scheduler.run()
+        assert list(results) == [0, 10, 20, 30]
+        assert order == [2, 1, 3, 0]     # file order in windows of 2, largest first within each window
+
+        # an executor that hands back finished futures must not make submission recursive
+        futures = pytest.importorskip("concurrent.futures")
+        class FinishedExecutor(object):
+            def submit(self, fn):
+                future = futures.Future()
+                future.set_result(fn())
+                return future
+        scheduler = uproot3.tree._BasketScheduler(FinishedExecutor(), maxinflight=4)
+        results = scheduler.map(lambda j: j, numpy.arange(5000), numpy.ones(5000))
+        scheduler.run()
+        assert list(results) == list(range(5000))
+
+        tree = uproot3.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        executor = futures.ThreadPoolExecutor(4)
+        expectation = tree.arrays()
+        arrays = tree.arrays(executor=executor)
+        assert all(arrays[name].tolist() == expectation[name].tolist() for name in expectation)
+
+    def test_pipeline(self):
+        pytest.importorskip("concurrent.futures")
+        tree = uproot3.open("tests/samples/sample-6.10.05-zlib.root")["sample"]
+        expectation = tree.arrays()
+        with uproot3.Pipeline(fetchworkers=2, decompressworkers=2, interpretworkers=1, queuesize=1) as pipeline:
+            arrays = tree.arrays(executor=pipeline)
+            assert all(arrays[name].tolist() == expectation[name].tolist() for name in expectation)
+
+            basketcache = {}
+            assert tree.array(b"Af8", executor=pipeline, basketcache=basketcache).tolist() == expectation[b"Af8"].tolist()
+            assert len(basketcache) == tree[b"Af8"].numbaskets
+            assert tree.array(b"Af8", executor=pipeline, basketcache=basketcache).tolist() == expectation[b"Af8"].tolist()
+
+            steps = list(tree.iterate([b"i4", b"str"], entrysteps=7, executor=pipeline))
+            assert sum((step[b"str"].tolist() for step in steps), []) == expectation[b"str"].tolist()
+
+            assert list(pipeline.map(lambda x: x * 2, [1, 2, 3])) == [2, 4, 6]
+
+    def test_processpool(self):
+        concurrent = pytest.importorskip("concurrent.futures")
+        branch = uproot3.open("tests/samples/sample-6.10.05-zlib.root")["sample"]["str"]
+        with concurrent.ProcessPoolExecutor(2) as executor:
+            basketcache = {}
+            assert branch.array(executor=executor, basketcache=basketcache).tolist() == branch.array().tolist()
+            assert len(basketcache) == branch.numbaskets
+            assert [x.tolist() for x in branch.baskets(executor=executor)] == [x.tolist() for x in branch.baskets()]
+
+            # objects made by a generator are read in this process: workers would only decompress their bytes
+            evt = uproot3.open("tests/samples/small-evnt-tree-nosplit.root")["tree"]["evt"]
+            assert uproot3.tree._remoteinterpretation(evt.interpretation) is None
+            assert [x._StlVecStr for x in evt.array(executor=executor)] == [x._StlVecStr for x in evt.array()]
+
+            # results from the workers are received in the thread that collects them, not in the pool's management thread
+            scheduler = uproot3.tree._BasketScheduler(executor)
+            results = scheduler.map(None, numpy.arange(10), numpy.ones(10), remote=lambda j: functools.partial(int, j), receive=lambda j, x: (x, threading.current_thread()))
+            scheduler.run()
+            assert list(results) == [(j, threading.current_thread()) for j in range(10)]
+
+            # workers open the file the way it was opened here
+            opened = uproot3.open("tests/samples/sample-6.10.05-zlib.root", localsource=functools.partial(uproot3.FileSource, **uproot3.FileSource.defaults))["sample"]["str"]
+            assert isinstance(opened._context.sourcefactory(opened._context.sourcepath), uproot3.FileSource)
+            assert opened.array(executor=executor).tolist() == branch.array().tolist()
+
+    def test_processbasket_sources(self):
+        path = "tests/samples/sample-6.10.05-zlib.root"
+        factory = uproot3.open(path)._context.sourcefactory
+        uproot3.tree._ProcessBasket._sources.clear()
+        try:
+            old = uproot3.tree._ProcessBasket(factory, path, ("uuid", 1), None, None, None, 0, 0, False)._source()
+            assert old is uproot3.tree._ProcessBasket(factory, path, ("uuid", 1), None, None, None, 0, 0, False)._source()
+            # a rewritten file (new fUUID or fEND) gets a new source and the old one is closed
+            new = uproot3.tree._ProcessBasket(factory, path, ("uuid", 2), None, None, None, 0, 0, False)._source()
+            assert new is not old and old.closed
+            assert list(uproot3.tree._ProcessBasket._sources) == [(path, ("uuid", 2))]
+        finally:
+            for source in uproot3.tree._ProcessBasket._sources.values():
+                source.close()
+            uproot3.tree._ProcessBasket._sources.clear()
+
+    def test_streamed_objects(self):
+        branch = uproot3.open("tests/samples/issue434.root")["KM3NET_EVENT"]["KM3NETDAQ::JDAQEventHeader"]
+        assert isinstance(branch.interpretation, uproot3.asstreamed)
+        a = branch.array()
+        assert a["detector_id"].tolist() == [44, 44, 44]
+        assert a["overlays"].tolist() == [6, 21, 0]
+
+        # a byte count that does not match the fixed layout is an error, not a misaligned read
+        interpretation = uproot3.asstreamed([(" cnt", ">u4"), (" vers", ">u2"), ("x", ">f8")])
+        good = numpy.frombuffer(struct.pack(">IHd", 0x40000000 | 10, 1, 1.5), numpy.uint8)
+        assert interpretation.fromroot(good, None, 0, 1, 0)["x"].tolist() == [1.5]
+        bad = numpy.frombuffer(struct.pack(">IHd", 0x40000000 | 12, 1, 1.5), numpy.uint8)
+        with pytest.raises(ValueError):
+            interpretation.fromroot(bad, None, 0, 1, 0)
+
+    def test_long_strings(self):
+        # strings of 255 bytes or more have a 5-byte header: 255 and then the 4-byte length
+        a = uproot3.open("tests/samples/from-geant4.root")["Details"]["opts"].array()
+        assert isinstance(a, awkward0.StringArray)
+        assert a[0].startswith(b"[sim]\n") and len(a[0]) > 255
@@ -125,7 +125,7 @@ from __future__ import absolute_import
 
 # high-level entry points
 from uproot3.rootio import open, xrootd, http
-from uproot3.tree import iterate, numentries, lazyarray, lazyarrays, daskarray, daskframe
+from uproot3.tree import iterate, numentries, partition, mapreduce, lazyarray, lazyarrays, daskarray, daskframe
 from uproot3.write.TFile import TFileCreate as create
 from uproot3.write.TFile import TFileRecreate as recreate
 from uproot3.write.TFile import TFileUpdate as update
@@ -137,7 +137,8 @@ from uproot3.source.file import FileSource
 from uproot3.source.xrootd import XRootDSource
 from uproot3.source.http import HTTPSource
 
-from uproot3.cache import ArrayCache, ThreadSafeArrayCache
+from uproot3.cache import ArrayCache, ThreadSafeArrayCache, ObjectCache, MemoryBudget
+from uproot3.pipeline import Pipeline
 
 from uproot3.interp.auto import interpret
 from uproot3.interp.numerical import asdtype
@@ -147,7 +148,10 @@ from uproot3.interp.numerical import asstlbitset
 from uproot3.interp.jagged import asjagged
 from uproot3.interp.objects import astable
 from uproot3.interp.objects import asobj
+from uproot3.interp.objects import asstreamed
 from uproot3.interp.objects import asgenobj
+from uproot3.interp.objects import asstlvector
+from uproot3.interp.objects import asstlmap
 from uproot3.interp.objects import asstring
 from uproot3.interp.objects import SimpleArray
 from uproot3.interp.objects import STLVector
@@ -169,4 +173,4 @@ from uproot3.version import __version__
 # don't expose uproot3.uproot3; it's ugly
 del uproot3
 
-__all__ = ["open", "xrootd", "http", "iterate", "numentries", "lazyarray", "lazyarrays", "daskarray", "daskframe", "create", "recreate", "update", "ZLIB", "LZMA", "LZ4", "ZSTD", "newtree", "newbranch", "MemmapSource", "FileSource", "XRootDSource", "HTTPSource", "ArrayCache", "ThreadSafeArrayCache", "interpret", "asdtype", "asarray", "asdouble32", "asstlbitset", "asjagged", "astable", "asobj", "asgenobj", "asstring", "asdebug", "SimpleArray", "STLVector", "STLMap", "STLString", "Pointer", "pandas", "__version__"]
+__all__ = ["open", "xrootd", "http", "iterate", "numentries", "partition", "mapreduce", "lazyarray", "lazyarrays", "daskarray", "daskframe", "create", "recreate", "update", "ZLIB", "LZMA", "LZ4", "ZSTD", "newtree", "newbranch", "MemmapSource", "FileSource", "XRootDSource", "HTTPSource", "ArrayCache", "ThreadSafeArrayCache", "ObjectCache", "MemoryBudget", "Pipeline", "interpret", "asdtype", "asarray", "asdouble32", "asstlbitset", "asjagged", "astable", "asobj", "asstreamed", "asgenobj", "asstlvector", "asstlmap", "asstring", "asdebug", "SimpleArray", "STLVector", "STLMap", "STLString", "Pointer", "pandas", "__version__"]
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
+
+# Python 3.5+ only: imported by uproot3.tree._asyncio, never at startup
+
+from __future__ import absolute_import
+
+import asyncio
+import concurrent.futures
+import threading
+
+import uproot3.tree
+
+def _loop():
+    return getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+
+def _whendone(scheduler):
+    future = concurrent.futures.Future()
+    def done():
+        if not future.cancelled():
+            future.set_result(None)
+    scheduler.whendone(done)
+    return asyncio.wrap_future(future)
+
+def _cancel(schedulers):
+    for scheduler in schedulers:
+        scheduler.cancel()
+
+async def _started(start):
+    # start() reads metadata and submits baskets in a thread of the event loop's default executor; if this is cancelled,
+    # the baskets it submits are cancelled as soon as it returns
+    started = _loop().run_in_executor(None, uproot3.tree._runscheduled, start)
+    try:
+        return await asyncio.shield(started)
+    except asyncio.CancelledError:
+        started.add_done_callback(lambda future: None if future.cancelled() or future.exception() is not None else _cancel(future.result()[1]))
+        raise
+
+async def _finish(wait, schedulers):
+    # the baskets are awaited in the event loop, without holding a thread; then the output is made in a thread
+    try:
+        await asyncio.gather(*[_whendone(x) for x in schedulers])
+    except asyncio.CancelledError:
+        _cancel(schedulers)
+        raise
+    return await _loop().run_in_executor(None, wait)
+
+async def read(start):
+    wait, schedulers = await _started(start)
+    return await _finish(wait, schedulers)
+
+class AsyncIterator(object):
+    def __init__(self, generator, reportentries):
+        self._generator = generator
+        self._reportentries = reportentries
+        self._lock = threading.Lock()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item, schedulers = await _started(self._next)
+        if self._reportentries:
+            start, stop, wait = item
+            return start, stop, await _finish(wait, schedulers)
+        else:
+            return await _finish(item, schedulers)
+
+    def _next(self):
+        with self._lock:
+            try:
+                return next(self._generator)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    async def aclose(self):
+        await _loop().run_in_executor(None, self._close)
+
+    def _close(self):
+        with self._lock:
+            self._generator.close()
@@ -27,9 +27,9 @@ class TTreeMethods_pandas(object):
     def __init__(self, tree):
         self._tree = tree
 
-    def df(self, branches=None, namedecode="utf-8", entrystart=None, entrystop=None, flatten=True, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def df(self, branches=None, namedecode="utf-8", entrystart=None, entrystop=None, flatten=True, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, entries=None):
         import pandas
-        return self._tree.arrays(branches=branches, outputtype=pandas.DataFrame, namedecode=namedecode, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking)
+        return self._tree.arrays(branches=branches, outputtype=pandas.DataFrame, namedecode=namedecode, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking, entries=entries)
 
     def iterate(self, branches=None, entrysteps=None, namedecode="utf-8", entrystart=None, entrystop=None, flatten=True, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
         import pandas
@@ -45,9 +45,15 @@ def default_flatname(branchname, fieldname, index):
         out += "[" + "][".join(str(x) for x in index) + "]"
     return out
 
-def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward0):
+def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward0, entries=None):
     import pandas
 
+    if entries is None:
+        index = pandas.RangeIndex(entrystart, entrystop, name="entry")
+        entries = numpy.arange(entrystart, entrystop, dtype=numpy.int64)
+    else:
+        index = pandas.Index(entries, name="entry")
+
     if flatname is None:
         flatname = default_flatname
 
@@ -91,7 +97,6 @@ def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, aw
                 columns.append(fn)
                 data[fn] = list(array)     # must be serialized as a Python list for Pandas to accept it
 
-        index = pandas.RangeIndex(entrystart, entrystop, name="entry")
         return outputtype(columns=columns, data=data, index=index)
 
     else:
@@ -139,7 +144,7 @@ def futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, aw
             interpretations.append(interpretation)
             arrays.append(array)
 
-        index = pandas.MultiIndex.from_arrays([index.tojagged(numpy.arange(entrystart, entrystop, dtype=numpy.int64)).content, index.content], names=["entry", "subentry"])
+        index = pandas.MultiIndex.from_arrays([index.tojagged(entries).content, index.content], names=["entry", "subentry"])
 
         df = outputtype(index=index)
 
@@ -53,7 +53,7 @@ open_fragments = {
 
     # options
     "options": u"""options
-        passed to :py:class:`ROOTDirectory <uproot3.rootio.ROOTDirectory>` constructor.""",
+        passed to :py:class:`ROOTDirectory <uproot3.rootio.ROOTDirectory>` constructor. Recognized options are ``read_streamers`` (default ``True``) and ``objectcache``: if not ``None`` *(default)*, an :py:class:`ObjectCache <uproot3.cache.ObjectCache>` that keeps objects returned by :py:meth:`get <uproot3.rootio.ROOTDirectory.get>` and :py:meth:`getmany <uproot3.rootio.ROOTDirectory.getmany>` so that repeated requests skip decompression and deserialization.""",
 }
 
 rootdirectory_fragments = {
@@ -68,6 +68,14 @@ rootdirectory_fragments = {
     # filterclass
     "filterclass": u"""filterclass : function: class object \u21d2 bool
         only keys for which ``filterclass(class object)`` returns ``True`` are returned (does not eliminate subdirectories if ``recursive=True``). Default returns ``True`` for all input. Note that all class objects passed to this function have a ``classname`` attribute for the C++ class name (may differ from the Python class name for syntactic reasons).""",
+
+    # executor
+    "executor": u"""executor : ``None`` or `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_
+        if not ``None`` *(default)*, read the objects in bulk: keys are sorted by position in the file, neighboring keys are fetched in a single read, and decompression is scheduled on the executor. Objects are still deserialized in order in the calling thread. If ``recursive=True``, subdirectories are also read ahead on the executor, as described below.""",
+
+    # executor_keys
+    "executor_keys": u"""executor : ``None`` or `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_
+        if not ``None`` *(default)* and ``recursive=True``, read the key lists of subdirectories on the executor, ahead of the iteration: the 16 subdirectories that will be needed soonest, at any level of depth, are read or being read (together, in as few reads as possible, sorted by position in the file), and each is released as soon as it has been entered. The iteration order is unchanged: depth-first, with a subdirectory's contents following its own key.""",
     }
 
 ################################################################ uproot3.rootio.open
@@ -159,6 +167,8 @@ u"""Represents a ROOT file or directory, an entry point for reading objects.
 
     - :py:meth:`get <uproot3.rootio.ROOTDirectory.get>` read an object from the file, selected by name.
 
+    - :py:meth:`getmany <uproot3.rootio.ROOTDirectory.getmany>` read many objects from the file in bulk, selected by name.
+
     - :py:meth:`iterkeys <uproot3.rootio.ROOTDirectory.iterkeys>` iterate over key names in this directory.
 
     - :py:meth:`itervalues <uproot3.rootio.ROOTDirectory.itervalues>` iterate over objects in this directory.
@@ -206,6 +216,24 @@ u"""Read an object from the ROOT file or directory by name.
     This method, without the ``cycle`` argument, can be accessed more directly through square brackets (``__getitem__``) on the :py:class:`ROOTDirectory <uproot3.rootio.ROOTDirectory>` object.
 """.format(**rootdirectory_fragments), width=TEXT_WIDTH)
 
+_method(uproot3.rootio.ROOTDirectory.getmany).__doc__ = wrap(
+u"""Read many objects from the ROOT file or directory by name.
+
+    Rather than reading, decompressing, and deserializing one key at a time, the keys are sorted by position in the file and neighboring keys are fetched in a single read. If an *executor* is provided, decompression is performed in parallel, overlapped with deserialization.
+
+    Parameters
+    ----------
+    names : list of str (str)
+        names of the objects, as in :py:meth:`get <uproot3.rootio.ROOTDirectory.get>`, including subdirectories and cycle numbers.
+
+    {executor}
+
+    Returns
+    -------
+    list of :py:class:`ROOTStreamedObject <uproot3.rootio.ROOTStreamedObject>`
+        freshly read objects from the ROOT file, in the same order as *names*.
+""".format(**rootdirectory_fragments), width=TEXT_WIDTH)
+
 _method(uproot3.rootio.ROOTDirectory.iterkeys).__doc__ = wrap(
 u"""Iterate over key names in this directory.
 
@@ -219,6 +247,8 @@ u"""Iterate over key names in this directory.
 
     {filterclass}
 
+    {executor_keys}
+
     Returns
     -------
     iterator over bytes
@@ -277,6 +307,8 @@ u"""Iterate over *(key name, class object)* pairs in this directory.
 
     {filterclass}
 
+    {executor_keys}
+
     Returns
     -------
     iterator over (bytes, class object)
@@ -296,6 +328,8 @@ u"""Return key names in this directory.
 
     {filterclass}
 
+    {executor_keys}
+
     Returns
     -------
     list of bytes
@@ -313,6 +347,8 @@ u"""Return objects in this directory.
 
     {filterclass}
 
+    {executor}
+
     Returns
     -------
     list of :py:class:`ROOTStreamedObject <uproot3.rootio.ROOTStreamedObject>`
@@ -330,6 +366,8 @@ u"""Return *(key name, object)* pairs in this directory, like a ``dict``.
 
     {filterclass}
 
+    {executor}
+
     Returns
     -------
     list of (bytes, :py:class:`ROOTStreamedObject <uproot3.rootio.ROOTStreamedObject>`)
@@ -349,6 +387,8 @@ u"""Return *(key name, class object)* pairs in this directory.
 
     {filterclass}
 
+    {executor_keys}
+
     Returns
     -------
     list of (bytes, class object)
@@ -366,6 +406,8 @@ u"""Return keys at all levels of depth (shortcut for passing ``recursive=True``
 
     {filterclass}
 
+    {executor_keys}
+
     Returns
     -------
     list of bytes
@@ -381,6 +423,8 @@ u"""Return objects at all levels of depth (shortcut for passing ``recursive=True
 
     {filterclass}
 
+    {executor}
+
     Returns
     -------
     list of :py:class:`ROOTStreamedObject <uproot3.rootio.ROOTStreamedObject>`
@@ -396,6 +440,8 @@ u"""Return *(key name, object)* pairs at all levels of depth (shortcut for passi
 
     {filterclass}
 
+    {executor}
+
     Returns
     -------
     list of (bytes, :py:class:`ROOTStreamedObject <uproot3.rootio.ROOTStreamedObject>`)
@@ -413,6 +459,8 @@ u"""Return *(key name, class object)* pairs at all levels of depth (shortcut for
 
     {filterclass}
 
+    {executor_keys}
+
     Returns
     -------
     list of (bytes, class object)
@@ -444,6 +492,42 @@ tree_fragments = {
     "entrystop": u"""entrystop : ``None`` or int
         entry at which reading stops (exclusive). If ``None`` *(default)*, stop at the end of the branch.""",
 
+    # entries
+    "entries": u"""entries : ``None``, array of int, or array of bool
+        if not ``None``, read only these entries: a sorted array of entry numbers or a boolean mask with one value per entry (cannot be combined with *entrystart* and *entrystop*). Only baskets containing at least one selected entry are read, and the selected rows are returned in a compact array.""",
+
+    # cut
+    "cut": u"""cut : ``None``, str, or function: mapping \u21d2 array of bool
+        if not ``None``, only return entries that pass this selection: either an expression in terms of branch names (e.g. ``"(nMuon >= 2) & (MET > 40)"``, with ``numpy``/``np`` available) or a function that takes a mapping from branch names to arrays and returns a mask. The branches used by the cut are read first (for each step when iterating); of the requested branches, only baskets containing at least one passing entry are read, and the result is compacted to the passing entries. The mask must have one boolean per entry.""",
+
+    # out
+    "out": u"""out : ``None`` or ``numpy.ndarray``
+        if not ``None``, fill this array (which may be a ``numpy.memmap``) in place instead of a new one, converting to its dtype; the result is a view of its beginning (for jagged arrays, the content is). The branch must be numbers or jagged arrays of numbers, *out* must have room for all items of the baskets that overlap the requested entries, and *cache* is not used (cannot be combined with *entries*).""",
+
+    # outputs
+    "outputs": u"""outputs : ``None`` or ``dict`` of str → ``numpy.ndarray``
+        if not ``None``, branches named by keys are filled into the associated arrays in place, as with the *out* parameter of :py:meth:`array <uproot3.tree.TBranchMethods.array>` (cannot be combined with *cut*).""",
+
+    # outputs_iterate
+    "outputs_iterate": u"""outputs : ``None`` or ``dict`` of str → ``numpy.ndarray``
+        if not ``None``, branches named by keys are filled into the associated arrays in place, as with the *out* parameter of :py:meth:`array <uproot3.tree.TBranchMethods.array>`. Every step reuses the same arrays, so a step's arrays are only valid until the next step, and *cache* is not used (cannot be combined with *cut*).""",
+
+    # memory_budget
+    "memory_budget": u"""memory_budget : ``None``, int, string matching number + /[kMGTPEZY]?B/i, or :py:class:`MemoryBudget <uproot3.cache.MemoryBudget>`
+        if not ``None``, bound the bytes held by the iteration: decompressed baskets of steps being read, arrays of steps not yet consumed, key metadata (at most an eighth of the budget, in an LRU cache unless *keycache* is given), and the baskets kept between steps (unless *basketcache* is given). Each step is counted as twice the uncompressed size of the baskets it reads. Before reading a step, iteration blocks until the earlier steps that are still held (not yet consumed, if *blocking* is ``False``) leave room for it; a step that does not fit in the budget by itself is read when nothing else is held. If *entrysteps* is ``None``, steps are a quarter of the budget. Pass a :py:class:`MemoryBudget <uproot3.cache.MemoryBudget>` to read its ``peak`` afterward.""",
+
+    # prefetch
+    "prefetch": u"""prefetch : non-negative int
+        number of steps after the one being used to read in the background *(default is 0)*: while a step is being used, the baskets of the next *prefetch* steps are read, decompressed, and interpreted in a background thread (and on the *executor*, if any), one step after another, and handed over when the iteration resumes. With *memory_budget*, steps are only read ahead while they fit in the budget. Cannot be used with *outputs*.""",
+
+    # openahead
+    "openahead": u"""openahead : non-negative int
+        number of files after the one being read to open in the background *(default is 0)*: opening the file, reading its streamers, finding the TTree, and selecting branches are done one file after another in a background thread. Files whose TTrees have the same class versions, branches, and leaves as an earlier file reuse its selection of branches and interpretations.""",
+
+    # parallelfiles
+    "parallelfiles": u"""parallelfiles : positive int
+        number of files to read at once *(default is 1)*: each file's steps are read in a background thread, at most *prefetch* + 1 steps ahead of the one being used, and are yielded in file order. Cannot be used with *outputs*.""",
+
     # entrysteps
     "entrysteps": u"""entrysteps : ``None``, positive int, ``float("inf")``, string matching number + /[kMGTPEZY]?B/i, or iterable of *(int, int)* pairs
         if ``None`` *(default)*, iterate in steps of TTree clusters (number of entries for which all branches' baskets align); if an integer, iterate in steps of equal numbers of entries (except at the end of a file); if infinite, take file-sized steps; if a string, iterate in steps of approximately equal memory, given by a memory size string; otherwise, iterate in explicit, user-specified *(start, stop)* intervals ("start" is inclusive and "stop" is exclusive).""",
@@ -515,11 +599,15 @@ tree_fragments = {
 
     # keycache
     "keycache": u"""keycache : ``None`` or ``dict``-like object
-        if not ``None`` *(default)*, basket TKeys will be saved in the ``dict``-like object for later use. TKeys are small, but require file access, so caching them can speed up repeated access.""",
+        if not ``None`` *(default)*, basket TKeys will be saved in the ``dict``-like object for later use, as one compact Numpy record array per branch. TKeys are small, but require file access, so caching them can speed up repeated access.""",
 
     # executor
     "executor": u"""executor : `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_
-        if not ``None`` *(default)*, parallelize basket-reading and decompression by scheduling tasks on the executor. Assumes caches are thread-safe.""",
+        if not ``None`` *(default)*, parallelize basket-reading and decompression by scheduling tasks on the executor. If the executor is a :py:class:`Pipeline <uproot3.pipeline.Pipeline>`, fetching, decompression, and interpretation of each basket are run in separate stages. If it is a `concurrent.futures.ProcessPoolExecutor <https://docs.python.org/3/library/concurrent.futures.html>`_, each basket is read, decompressed, and interpreted in a worker process that opens the file the way it was opened here, and the resulting arrays are passed back in shared memory (Python 3.8 and later). This does not help interpretations that make objects with a generator (:py:class:`asgenobj <uproot3.interp.objects.asgenobj>`, :py:class:`asstlvector <uproot3.interp.objects.asstlvector>`, :py:class:`asstlmap <uproot3.interp.objects.asstlmap>`): their objects are made in the calling process when they are accessed, so their baskets are read in the calling process, one at a time. Assumes caches are thread-safe.""",
+
+    # executor_scheduled
+    "executor_scheduled": u"""executor : `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_
+        if not ``None`` *(default)*, parallelize basket-reading and decompression by scheduling tasks on the executor. The baskets of all branches are scheduled together: in order of position in the file, largest (uncompressed) first within each group of tasks in flight, with a bounded number of tasks submitted at a time. If the executor is a :py:class:`Pipeline <uproot3.pipeline.Pipeline>`, fetching, decompression, and interpretation of each basket are run in separate stages. If it is a `concurrent.futures.ProcessPoolExecutor <https://docs.python.org/3/library/concurrent.futures.html>`_, each basket is read, decompressed, and interpreted in a worker process that opens the file the way it was opened here, and the resulting arrays are passed back in shared memory (Python 3.8 and later). This does not help interpretations that make objects with a generator (:py:class:`asgenobj <uproot3.interp.objects.asgenobj>`, :py:class:`asstlvector <uproot3.interp.objects.asstlvector>`, :py:class:`asstlmap <uproot3.interp.objects.asstlmap>`): their objects are made in the calling process when they are accessed, so their baskets are read in the calling process, one at a time. Assumes caches are thread-safe.""",
 
     # blocking
     "blocking": u"""blocking : bool
@@ -598,6 +686,16 @@ u"""Opens a series of ROOT files (local or remote), yielding the same number of
 
     {blocking}
 
+    {outputs_iterate}
+
+    {memory_budget}
+
+    {prefetch}
+
+    {openahead}
+
+    {parallelfiles}
+
     {localsource}
 
     {xrootdsource}
@@ -703,6 +801,7 @@ u"""Adds array reading methods to TTree objects that have been streamed from a R
     - :py:meth:`lazyarray <uproot3.tree.TTreeMethods.lazyarray>` create a lazy array that would read the branch as needed.
     - :py:meth:`lazyarrays <uproot3.tree.TTreeMethods.lazyarrays>` create many lazy arrays.
     - :py:meth:`iterate <uproot3.tree.TTreeMethods.iterate>` iterate over many arrays at once, yielding the same number of entries from all selected branches in each step.
+    - :py:meth:`array_async <uproot3.tree.TTreeMethods.array_async>`, :py:meth:`arrays_async <uproot3.tree.TTreeMethods.arrays_async>`, and :py:meth:`aiterate <uproot3.tree.TTreeMethods.aiterate>` the same for asyncio (Python 3.5 and later).
 """, width=TEXT_WIDTH)
 
 _method(uproot3.tree.TTreeMethods.get).__doc__ = wrap(
@@ -899,6 +998,8 @@ u"""Return entry starts and stops as *(int, int)* pairs of (approximately) equal
 
     Similar to :py:meth:`clusters <uproot3.tree.TTreeMethods.clusters>` in that it provides a list of (start, stop) entry pairs, but instead of fitting baskets, this method attempts to keep the memory use constant.
 
+    Uncompressed basket sizes are estimated from the TBranch metadata (compressed basket sizes and the branch's compression ratio), so no basket keys are read; baskets whose keys are already in *keycache* use their exact sizes.
+
     Parameters
     ----------
     numbytes : positive number (int or float) or string matching number + /[kMGTPEZY]?B/i
@@ -948,6 +1049,10 @@ u"""Read one branch into an array (or other object if provided an alternate *int
 
     {blocking}
 
+    {entries}
+
+    {out}
+
     Returns
     -------
     array or other object, depending on *interpretation*.
@@ -980,10 +1085,16 @@ u"""Read many branches into arrays (or other objects if provided alternate *inte
 
     {keycache}
 
-    {executor}
+    {executor_scheduled}
 
     {blocking}
 
+    {entries}
+
+    {cut}
+
+    {outputs}
+
     Returns
     -------
     outputtype of arrays or other objects, depending on *interpretation*
@@ -1099,16 +1210,55 @@ u"""Iterate over many arrays at once, yielding the same number of entries from a
 
     {keycache}
 
-    {executor}
+    {executor_scheduled}
 
     {blocking}
 
+    {cut}
+
+    {outputs_iterate}
+
+    {memory_budget}
+
+    {prefetch}
+
     Returns
     -------
     iterator over (int, int, outputtype) (if *reportentries*) or just outputtype (otherwise)
         aligned array segments from the TTree.
 """.format(**tree_fragments), width=TEXT_WIDTH)
 
+_method(uproot3.tree.TTreeMethods.array_async).__doc__ = wrap(
+u"""Coroutine that reads one branch into an array (or other object if provided an alternate *interpretation*), for use with asyncio (Python 3.5 and later).
+
+    Takes the same parameters as :py:meth:`array <uproot3.tree.TTreeMethods.array>`, except *blocking*. The sources are not asynchronous, so the TTree's metadata is read in a thread of the event loop's default executor (see ``loop.set_default_executor``), and the output is assembled there. In between, the baskets are read and decompressed on *executor*, and the coroutine awaits them without holding a thread, so the number of reads in flight is not limited by the size of the default executor. Cancelling the coroutine drops the baskets that have not been submitted yet. Without an *executor*, the baskets are read in the default executor's thread, too.
+
+    Returns
+    -------
+    coroutine of array or other object, depending on *interpretation*.
+""", width=TEXT_WIDTH)
+
+_method(uproot3.tree.TTreeMethods.arrays_async).__doc__ = wrap(
+u"""Coroutine that reads many branches into arrays (or other objects if provided alternate *interpretations*), for use with asyncio (Python 3.5 and later).
+
+    Takes the same parameters as :py:meth:`arrays <uproot3.tree.TTreeMethods.arrays>`, except *blocking*, and awaits the baskets of all branches like :py:meth:`array_async <uproot3.tree.TTreeMethods.array_async>` (a *cut*'s branches are read in the default executor's thread, before the others are submitted).
+
+    Returns
+    -------
+    coroutine of outputtype of arrays or other objects, depending on *interpretation*.
+""", width=TEXT_WIDTH)
+
+_method(uproot3.tree.TTreeMethods.aiterate).__doc__ = wrap(
+u"""Asynchronously iterate over many arrays at once (with ``async for``), yielding the same number of entries from all selected branches in each step, for use with asyncio (Python 3.5 and later).
+
+    Takes the same parameters as :py:meth:`iterate <uproot3.tree.TTreeMethods.iterate>`, except *blocking*. Each step awaits its baskets like :py:meth:`arrays_async <uproot3.tree.TTreeMethods.arrays_async>`; with *prefetch*, the following steps are read in background threads while the current one is being used. Call ``await iterator.aclose()`` to release the iteration if it is not run to the end.
+
+    Returns
+    -------
+    asynchronous iterator over (int, int, outputtype) (if *reportentries*) or just outputtype (otherwise)
+        aligned array segments from the TTree.
+""", width=TEXT_WIDTH)
+
 ################################################################ uproot3.tree.TBranchMethods
 
 uproot3.tree.TBranchMethods.__doc__ = wrap(
@@ -1156,6 +1306,7 @@ u"""Adds array reading methods to TBranch objects that have been streamed from a
     **Methods for reading array data:**
 
     - :py:meth:`array <uproot3.tree.TBranchMethods.array>` read the branch into an array (or other object if provided an alternate *interpretation*).
+    - :py:meth:`array_async <uproot3.tree.TBranchMethods.array_async>` the same for asyncio (Python 3.5 and later).
     - :py:meth:`lazyarray <uproot3.tree.TBranchMethods.lazyarray>` create a lazy array that would read the branch as needed.
     - :py:meth:`basket <uproot3.tree.TBranchMethods.basket>` read a single basket into an array.
     - :py:meth:`baskets <uproot3.tree.TBranchMethods.baskets>` read baskets into a list of arrays.
@@ -1494,17 +1645,33 @@ u"""Read the branch into an array (or other object if provided an alternate *int
 
     {blocking}
 
+    {entries}
+
+    {out}
+
     Returns
     -------
     array or other object, depending on *interpretation*
         branch data.
 """.format(**tree_fragments), width=TEXT_WIDTH)
 
+_method(uproot3.tree.TBranchMethods.array_async).__doc__ = wrap(
+u"""Coroutine that reads the branch into an array (or other object if provided an alternate *interpretation*), for use with asyncio (Python 3.5 and later).
+
+    Takes the same parameters as :py:meth:`array <uproot3.tree.TBranchMethods.array>`, except *blocking*, and awaits its baskets like :py:meth:`TTreeMethods.array_async <uproot3.tree.TTreeMethods.array_async>`.
+
+    Returns
+    -------
+    coroutine of array or other object, depending on *interpretation*.
+""", width=TEXT_WIDTH)
+
 _method(uproot3.tree.TBranchMethods.mempartitions).__doc__ = wrap(
 u"""Return entry starts and stops as *(int, int)* pairs of (approximately) equal-memory partitions in this TBranch.
 
     Similar to :py:meth:`clusters <uproot3.tree.TTreeMethods.clusters>` in that it provides a list of (start, stop) entry pairs, but instead of fitting baskets, this method attempts to keep the memory use constant.
 
+    Uncompressed basket sizes are estimated from the TBranch metadata (compressed basket sizes and the branch's compression ratio), so no basket keys are read; baskets whose keys are already in *keycache* use their exact sizes.
+
     Parameters
     ----------
     numbytes : positive number (int or float) or string matching number + /[kMGTPEZY]?B/i
@@ -1678,6 +1845,8 @@ u"""Create a Pandas DataFrame from some branches.
 
     {executor}
 
+    {entries}
+
     Returns
     -------
     Pandas DataFrame
@@ -1912,6 +2081,82 @@ u"""Get the number of entries in a TTree without fully opening the file.
         total number of entries or number of entries for each file, depending on *total*.
 """.format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
 
+uproot3.tree.partition.__doc__ = wrap(
+u"""Split a dataset into tasks of about the same number of bytes, for processing in parallel.
+
+    Each task is a *(path, entrystart, entrystop)* tuple covering whole clusters (see :py:meth:`clusters <uproot3.tree.TTreeMethods.clusters>`) of one file. Clusters are gathered until a task has at least *target_bytes* of uncompressed basket data in the selected branches (other branches don't count); a remainder smaller than half of *target_bytes* joins the file's last task. A cluster larger than *target_bytes* is a task by itself.
+
+    If a requested file is not found, this raises the appropriate exception. If a requested file does not have the requested TTree, it contributes no tasks.
+
+    Parameters
+    ----------
+    path : str or list of str
+        glob pattern(s) for local file paths (POSIX wildcards like "``*``") or URLs specifying the locations of the files. A list of filenames are processed in the given order, but glob patterns get pre-sorted to ensure a predictable order.
+
+    treepath : str
+        path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
+
+    {branches}
+
+    target_bytes : positive number (int or float) or string matching number + /[kMGTPEZY]?B/i
+        target number of bytes in each task (a lower bound, except for a file's last task); if a string, parse the memory size *(default is "100 MB")*.
+
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    executor : `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_
+        if not ``None`` *(default)*, read the files' metadata in parallel by scheduling tasks on the executor.
+
+    {blocking}
+
+    Returns
+    -------
+    list of (str, int, int)
+        tasks in order of file and entry.
+""".format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
+
+uproot3.tree.mapreduce.__doc__ = wrap(
+u"""Apply a function to each task of a dataset on a process pool and combine the results.
+
+    Workers take the next task as soon as they finish one (with at most two tasks per worker in flight), so tasks of different durations keep all workers busy. Each worker keeps the last TTree it opened, so tasks from the same file (consecutive in the output of :py:func:`partition <uproot3.tree.partition>`) only open it once. Results are combined in the order that they finish, so *reduce* should be associative and commutative. If a task raises an exception, the remaining tasks are cancelled and the exception is raised.
+
+    Parameters
+    ----------
+    tasks : iterable of (str, int, int)
+        *(path, entrystart, entrystop)* tuples, such as the output of :py:func:`partition <uproot3.tree.partition>`.
+
+    treepath : str
+        path within each ROOT file to find the TTree (may include "``/``" for subdirectories or "``;``" for cycle numbers).
+
+    fcn : function: (:py:class:`TTreeMethods <uproot3.tree.TTreeMethods>`, int, int) \u21d2 anything
+        called with the TTree, entrystart, and entrystop of each task in a worker; for a process pool, it must be picklable (defined at the top level of a module) and so must its return value.
+
+    reduce : function: (anything, anything) \u21d2 anything
+        combines two results (or a combined result and a new result).
+
+    executor : `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_
+        if ``None`` *(default)*, a `concurrent.futures.ProcessPoolExecutor <https://docs.python.org/3/library/concurrent.futures.html>`_ with *numworkers* processes is started and shut down at the end; otherwise, run the tasks on this executor.
+
+    numworkers : ``None`` or positive int
+        number of processes for the default executor and the number of workers to keep busy; if ``None`` *(default)*, the number of CPUs.
+
+    {localsource}
+
+    {xrootdsource}
+
+    {httpsource}
+
+    {options}
+
+    Returns
+    -------
+    anything
+        the combined result of all tasks (``None`` if there are no tasks).
+""".format(**dict(list(open_fragments.items()) + list(tree_fragments.items()))), width=TEXT_WIDTH)
+
 ################################################################ uproot3.interp.interp.Interpretation
 
 uproot3.interp.interp.Interpretation.__doc__ = wrap(
@@ -2039,6 +2284,9 @@ u"""Interpret branch data as a new Numpy array with given dtypes and dimensions.
     todims : ``None`` or tuple of ints
         Numpy shape of each destination entry. The Numpy shape of the whole destination array is ``(numentries,) + todims``. If ``None`` *(default)*, ``todims`` will be equal to ``fromdims``. Making them different allows you to reshape arrays while reading.
 
+    native : bool
+        if ``True`` *(default)*, a ``todtype`` of ``None`` means the native-endian variant of the source type. If ``False``, it means the source type itself: no conversion is performed, and the result is a big-endian view of the basket data if it comes from a single basket (possibly read-only), or one copy of the baskets' data otherwise.
+
     Notes
     -----
 
@@ -2179,6 +2427,7 @@ u"""Maintain a position in a :py:class:`Source <uproot3.source.source.Source>` t
     - :py:meth:`copied <uproot3.source.cursor.Cursor.copied>` return a copy of this :py:class:`Cursor <uproot3.source.cursor.Cursor>` with modifications.
     - :py:meth:`skipped <uproot3.source.cursor.Cursor.skipped>` return a copy of this :py:class:`Cursor <uproot3.source.cursor.Cursor>` with the **index** moved forward.
     - :py:meth:`skip <uproot3.source.cursor.Cursor.skip>` move the **index** of this :py:class:`Cursor <uproot3.source.cursor.Cursor>` forward.
+    - :py:meth:`prefetched <uproot3.source.cursor.Cursor.prefetched>` read a known-sized region starting at the **index** in one request, returning a :py:class:`Source <uproot3.source.source.Source>` to parse it from.
     - :py:meth:`fields <uproot3.source.cursor.Cursor.fields>` interpret bytes in the :py:class:`Source <uproot3.source.source.Source>` with given data types and skip the **index** past them.
     - :py:meth:`field <uproot3.source.cursor.Cursor.field>` interpret bytes in the :py:class:`Source <uproot3.source.source.Source>` with a given data type and skip the **index** past it.
     - :py:meth:`bytes <uproot3.source.cursor.Cursor.bytes>` return a range of bytes from the :py:class:`Source <uproot3.source.source.Source>` and skip the **index** past it.
@@ -2265,6 +2514,24 @@ u"""Move the **index** of this :py:class:`Cursor <uproot3.source.cursor.Cursor>`
         number of bytes to skip
 """.format(**format_source_cursor), width=TEXT_WIDTH)
 
+_method(uproot3.source.cursor.Cursor.prefetched).__doc__ = wrap(
+u"""Read a known-sized region starting at the **index** in one request, returning a :py:class:`Source <uproot3.source.source.Source>` to parse it from. Does not move the **index**.
+
+    Metadata (TKeys, streamers, TTree and TBranch records) are parsed a few bytes at a time; if the source is not already contiguous in memory (e.g. a :py:class:`FileSource <uproot3.source.file.FileSource>` or remote source), each of those small reads would assemble a new array from cached chunks. The returned :py:class:`PrefetchedSource <uproot3.source.source.PrefetchedSource>` serves reads within the region from a single buffer and passes reads outside the region to the original source.
+
+    Parameters
+    ----------
+    {source}
+
+    numbytes : int
+        size of the region in bytes.
+
+    Returns
+    -------
+    :py:class:`Source <uproot3.source.source.Source>`
+        the original source if it is already contiguous in memory (or *numbytes* is not positive), otherwise a :py:class:`PrefetchedSource <uproot3.source.source.PrefetchedSource>`.
+""".format(**format_source_cursor), width=TEXT_WIDTH)
+
 _method(uproot3.source.cursor.Cursor.fields).__doc__ = wrap(
 u"""Interpret bytes in the :py:class:`Source <uproot3.source.source.Source>` with given data types and skip the **index** past them.
 
@@ -2410,6 +2677,26 @@ u"""Interface for data sources.
 
     **data(self, start, stop, dtype=None)**
         return a view of data from the starting byte (inclusive) to the stopping byte (exclusive), with a given Numpy type (numpy.uint8 if ``None``).
+
+    **contiguous(self, start, stop)** *(optional)*
+        if the bytes from start (inclusive) to stop (exclusive) are already in memory, return a *(buffer, position)* pair such that they begin at ``buffer[position]``; otherwise, return ``None``. :py:class:`Cursor <uproot3.source.cursor.Cursor>` uses this to parse fields and strings without creating intermediate arrays.
+""", width=TEXT_WIDTH)
+
+uproot3.source.source.PrefetchedSource.__doc__ = wrap(
+u"""A :py:class:`Source <uproot3.source.source.Source>` that serves a region of another source from one contiguous buffer, passing all other requests to the original source.
+
+    Ordinary users would never create a :py:class:`PrefetchedSource <uproot3.source.source.PrefetchedSource>`. They are produced by :py:meth:`Cursor.prefetched <uproot3.source.cursor.Cursor.prefetched>` when metadata are parsed from a source that is not already in memory.
+
+    Parameters
+    ----------
+    source : :py:class:`Source <uproot3.source.source.Source>`
+        the original source.
+
+    start : int
+        position of the first byte of *data* in the original source.
+
+    data : ``numpy.ndarray`` of ``numpy.uint8``
+        the prefetched bytes.
 """, width=TEXT_WIDTH)
 
 source_fragments = {
@@ -2574,3 +2861,98 @@ u"""An :py:class:`ArrayCache <uproot3.cache.ArrayCache>` with locks for thread s
     method : "LRU" *(default)* or "LFU"
         least recently used or least frequently used
 """, width=TEXT_WIDTH)
+
+################################################################ uproot3.cache.MemoryBudget
+
+uproot3.cache.MemoryBudget.__doc__ = wrap(
+u"""A bound on the memory held by :py:meth:`iterate <uproot3.tree.TTreeMethods.iterate>` (its *memory_budget* parameter), which also reports the peak.
+
+    ``reserved`` is the number of bytes counted for steps that are being read or have not been consumed, ``used`` adds the arrays in tracked caches, and ``peak`` is the largest ``used`` seen so far. The same budget may be passed to several iterations, in sequence or at once.
+
+    Parameters
+    ----------
+    limitbytes : int or string matching number + /[kMGTPEZY]?B/i
+        maximum number of bytes to hold.
+""", width=TEXT_WIDTH)
+
+################################################################ uproot3.cache.ObjectCache
+
+uproot3.cache.ObjectCache.__doc__ = wrap(
+u"""A thread-safe cache for deserialized ROOT objects, passed to :py:func:`uproot3.open <uproot3.rootio.open>` as ``objectcache``.
+
+    Objects are keyed by file path, ``fSeekKey``, and ``fCycle``, and their size is estimated by their ``nbytes`` property if they have one and by the uncompressed size of their key (``fObjlen``) otherwise. The same cache may be shared among several files.
+
+    Whenever a file is opened with this cache, its header is compared with the one seen last time: if the file has been written to (e.g. by :py:func:`uproot3.recreate <uproot3.write.TFile.TFileRecreate>`), all cached objects from that file are dropped.
+
+    Objects that keep reading from their file, such as TTrees and directories, are only returned to the file handle that read them: opening the file again reads them again, and closing a file drops them from the cache.
+
+    The cache is filled by :py:meth:`get <uproot3.rootio.ROOTDirectory.get>` and :py:meth:`getmany <uproot3.rootio.ROOTDirectory.getmany>` only: assigning to it raises ``TypeError``. Objects larger than ``limitbytes`` are not kept.
+
+    Parameters
+    ----------
+    limitbytes : int or string matching number + /[kMGTPEZY]?B/i
+        maximum number of bytes to keep in the cache.
+
+    method : "LRU" *(default)* or "LFU"
+        least recently used or least frequently used
+""", width=TEXT_WIDTH)
+
+_method(uproot3.cache.ObjectCache.invalidate).__doc__ = wrap(
+u"""Drop cached objects.
+
+    Parameters
+    ----------
+    path : ``None`` or str
+        if ``None`` *(default)*, drop all objects; otherwise, only drop objects from the file with this path.
+""", width=TEXT_WIDTH)
+
+################################################################ uproot3.pipeline.Pipeline
+
+uproot3.pipeline.Pipeline.__doc__ = wrap(
+u"""An executor that reads baskets in three stages, each with its own pool of threads: fetching raw bytes from the file, decompressing them, and interpreting them as arrays.
+
+    Stages are connected by bounded queues, so that if decompression or interpretation falls behind, fetching waits rather than holding more raw data in memory. It can be passed as ``executor`` wherever a `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_ is accepted; ordinary tasks submitted with ``submit`` or ``map`` run in the fetch stage.
+
+    Parameters
+    ----------
+    fetchworkers : int
+        number of threads reading from the file (default is 4).
+
+    decompressworkers : ``None`` or int
+        number of threads decompressing baskets; if ``None`` *(default)*, one per CPU.
+
+    interpretworkers : int
+        number of threads interpreting decompressed baskets (default is 1).
+
+    queuesize : ``None`` or int
+        maximum number of baskets waiting between two stages; if ``None`` *(default)*, twice the largest number of workers.
+""", width=TEXT_WIDTH)
+
+_method(uproot3.pipeline.Pipeline.submit_stages).__doc__ = wrap(
+u"""Schedule a task that passes through all three stages.
+
+    Parameters
+    ----------
+    fetch : function: () \u21d2 object
+        called in the fetch stage.
+
+    decompress : function: object \u21d2 object
+        called in the decompression stage with the result of ``fetch``.
+
+    interpret : function: object \u21d2 object
+        called in the interpretation stage with the result of ``decompress``.
+
+    Returns
+    -------
+    `concurrent.futures.Future <https://docs.python.org/3/library/concurrent.futures.html>`_
+        holds the result of ``interpret``, or the first exception raised by any stage.
+""", width=TEXT_WIDTH)
+
+_method(uproot3.pipeline.Pipeline.shutdown).__doc__ = wrap(
+u"""Stop the worker threads after all scheduled tasks are finished.
+
+    Parameters
+    ----------
+    wait : bool
+        if ``True`` *(default)*, return only when all worker threads have stopped.
+""", width=TEXT_WIDTH)
@@ -78,3 +78,117 @@ class ThreadSafeArrayCache(ArrayCache):
     def __len__(self):
         with self._lock:
             return len(self._cache)
+
+class ObjectCache(ThreadSafeArrayCache):
+    @staticmethod
+    def getsizeof(obj):
+        return obj[0]
+
+    def __init__(self, limitbytes, method="LRU"):
+        super(ObjectCache, self).__init__(limitbytes, method=method)
+        self._generations = {}
+
+    def _sizeof(self, key, obj):
+        nbytes = getattr(obj, "nbytes", None)
+        if nbytes is None:
+            nbytes = key._fObjlen
+        return max(int(nbytes), 1)
+
+    def __getitem__(self, where):
+        with self._lock:
+            return self._cache[where][1]
+
+    def __setitem__(self, where, what):
+        # an object's size depends on its key (fObjlen), so only get and getmany fill this cache
+        raise TypeError("ObjectCache is filled by ROOTDirectory.get and getmany, not by assignment")
+
+    def _get(self, where, source):
+        with self._lock:
+            out = self._cache.get(where, None)
+        if out is None or (out[2] is not None and out[2] is not source):
+            return None    # bound to a file handle other than the one asking for it
+        else:
+            return out[1]
+
+    def _put(self, where, key, obj):
+        # objects that read from their file later (TTrees, directories) are only returned to the same open file
+        size = self._sizeof(key, obj)
+        context = getattr(obj, "_context", None)
+        source = getattr(context, "source", None)
+        with self._lock:
+            if size <= self._cache.maxsize:
+                self._cache[where] = (size, obj, source)
+
+    def _release(self, source):
+        with self._lock:
+            for where in [x for x, y in self._cache.items() if y[2] is source]:
+                del self._cache[where]
+
+    def _checkgeneration(self, path, generation):
+        with self._lock:
+            if self._generations.get(path, generation) != generation:
+                self._evict(path)
+            self._generations[path] = generation
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                self._generations.clear()
+            else:
+                self._evict(path)
+                self._generations.pop(path, None)
+
+    def _evict(self, path):
+        for where in [x for x in self._cache if isinstance(x, tuple) and x[0] == path]:
+            del self._cache[where]
+
+class MemoryBudget(object):
+    def __init__(self, limitbytes):
+        from uproot3.rootio import _memsize
+        m = _memsize(limitbytes)
+        if m is not None:
+            limitbytes = m
+        if limitbytes <= 0:
+            raise ValueError("memory budget must be positive")
+        self.limitbytes = int(math.ceil(limitbytes))
+        self.reserved = 0
+        self.peak = 0
+        self._tracked = []
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "<MemoryBudget {0} bytes (peak {1}) at 0x{2:012x}>".format(self.limitbytes, self.peak, id(self))
+
+    def track(self, mapping):
+        # count the arrays held by a cache (or dict) as used
+        self._tracked.append(mapping)
+
+    @staticmethod
+    def _sizeof(mapping):
+        if isinstance(mapping, ArrayCache):
+            return mapping._cache.currsize
+        else:
+            return sum(ArrayCache.getsizeof(x) for x in list(mapping.values()))
+
+    @property
+    def used(self):
+        return self.reserved + sum(self._sizeof(x) for x in self._tracked)
+
+    def fits(self, numbytes):
+        return self.used + numbytes <= self.limitbytes
+
+    def acquire(self, numbytes):
+        with self._lock:
+            self.reserved += numbytes
+        self.update()
+
+    def release(self, numbytes):
+        self.update()
+        with self._lock:
+            self.reserved -= numbytes
+
+    def update(self):
+        used = self.used
+        with self._lock:
+            self.peak = max(self.peak, used)
@@ -19,7 +19,10 @@ from uproot3.interp.numerical import asstlbitset
 from uproot3.interp.jagged import asjagged
 from uproot3.interp.objects import astable
 from uproot3.interp.objects import asobj
+from uproot3.interp.objects import asstreamed
 from uproot3.interp.objects import asgenobj
+from uproot3.interp.objects import asstlvector
+from uproot3.interp.objects import asstlmap
 from uproot3.interp.objects import asstring
 from uproot3.interp.objects import SimpleArray
 from uproot3.interp.objects import STLVector
@@ -103,6 +106,19 @@ def _obj_or_genobj(streamerClass, branch, isjagged, cntvers=False, tobject=True,
     if len(branch._fBranches) != 0:
         return None
 
+    if not isjagged and not cntvers:
+        # an unsplit object is serialized with a byte count and version for itself and each class within it; _recarray
+        # leaves them out, which only lines up for TObject subclasses (TObject's 16 bytes cover the outer ones)
+        try:
+            recarray = streamerClass._recarray_streamed_dtype()
+        except (AttributeError, ValueError):
+            recarray = None
+        if recarray is not None and " fUniqueID" not in recarray.names:
+            if streamerClass._methods is None:
+                return asstreamed(recarray)
+            else:
+                return asobj(astable(asstreamed(recarray)), streamerClass._methods)
+
     try:
         recarray = streamerClass._recarray_dtype(cntvers=cntvers, tobject=tobject)
 
@@ -337,7 +353,7 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                                 return None
 
                             if streamerClass.__name__ == "string":
-                                return asgenobj(STLVector(STLString(awkward0)), branch._context, 6)
+                                return asstlvector(STLString(awkward0))
 
                             if len(branch._fBranches) != 0:
                                 return None
@@ -384,7 +400,7 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<double>" or getattr(branch._streamer, "_fTypeName", None) == b"vector<Double_t>":
                     return asjagged(asdtype("f8"), skipbytes=10)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<string>":
-                    return asgenobj(STLVector(STLString(awkward0)), branch._context, 6)
+                    return asstlvector(STLString(awkward0))
                 else:
                     m = interpret._vectorpointer.match(getattr(branch._streamer, "_fTypeName", b""))
                     if m is not None and m.group(1) in branch._context.streamerinfosmap:
@@ -392,60 +408,60 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                         return asgenobj(STLVector(Pointer(streamer.pyclass)), branch._context, skipbytes=6)
 
                 if getattr(branch._streamer, "_fTypeName", None) == b"map<string,bool>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Bool_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype(awkward0.numpy.bool_)), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype(awkward0.numpy.bool_), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,char>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Char_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i1")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i1"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,unsigned char>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,UChar_t>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Byte_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u1")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u1"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,short>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Short_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i2")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i2"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,unsigned short>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,UShort_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u2")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u2"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,int>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Int_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i4")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i4"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,unsigned int>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,UInt_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u4")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u4"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,long>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Long_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i8"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,unsigned long>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,ULong_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u8"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,long long>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Long64_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i8"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,unsigned long long>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,ULong64_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u8"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,float>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Float_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("f4")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("f4"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,double>" or getattr(branch._streamer, "_fTypeName", None) == b"map<string,Double_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("f8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("f8"), dicts=True)
                 elif getattr(branch._streamer, "_fTypeName", None) == b"map<string,string>":
-                    return asgenobj(STLMap(STLString(awkward0), STLString(awkward0)), branch._context, 6)
+                    return asstlmap(STLString(awkward0), STLString(awkward0), dicts=True)
 
                 if getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<bool> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Bool_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(awkward0.numpy.bool_))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(awkward0.numpy.bool_)))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<char> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Char_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("i1"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype("i1")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned char> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<UChar_t> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Byte_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("u1"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype("u1")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<short> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Short_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i2"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i2")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned short> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<UShort_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u2"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u2")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<int> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Int_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i4"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i4")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned int> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<UInt_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u4"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u4")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Long_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i8")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<ULong_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u8")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<long long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Long64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i8")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<unsigned long long> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<ULong64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u8")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<float> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Float_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f4"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">f4")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<double> >" or getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<Double_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">f8")))
                 elif getattr(branch._streamer, "_fTypeName", None) == b"vector<vector<string> >":
                     return asgenobj(STLVector(STLVector(STLString(awkward0))), branch._context, 6)
 
@@ -483,65 +499,65 @@ def interpret(branch, awkwardlib=None, swapbytes=True, cntvers=False, tobject=Tr
                 elif branch._fClassName == b"vector<double>" or branch._fClassName == b"vector<Double_t>":
                     return asjagged(asdtype("f8"), skipbytes=10)
                 elif branch._fClassName == b"vector<string>":
-                    return asgenobj(STLVector(STLString(awkward0)), branch._context, 6)
+                    return asstlvector(STLString(awkward0))
 
                 if branch._fClassName == b"vector<vector<bool> >" or branch._fClassName == b"vector<vector<Bool_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(awkward0.numpy.bool_))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(awkward0.numpy.bool_)))
                 elif branch._fClassName == b"vector<vector<char> >" or branch._fClassName == b"vector<vector<Char_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("i1"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype("i1")))
                 elif branch._fClassName == b"vector<vector<unsigned char> >" or branch._fClassName == b"vector<vector<UChar_t> >" or branch._fClassName == b"vector<vector<Byte_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype("u1"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype("u1")))
                 elif branch._fClassName == b"vector<vector<short> >" or branch._fClassName == b"vector<vector<Short_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i2"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i2")))
                 elif branch._fClassName == b"vector<vector<unsigned short> >" or branch._fClassName == b"vector<vector<UShort_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u2"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u2")))
                 elif branch._fClassName == b"vector<vector<int> >" or branch._fClassName == b"vector<vector<Int_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i4"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i4")))
                 elif branch._fClassName == b"vector<vector<unsigned int> >" or branch._fClassName == b"vector<vector<UInt_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u4"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u4")))
                 elif branch._fClassName == b"vector<vector<long> >" or branch._fClassName == b"vector<vector<Long_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i8")))
                 elif branch._fClassName == b"vector<vector<unsigned long> >" or branch._fClassName == b"vector<vector<ULong_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u8")))
                 elif branch._fClassName == b"vector<vector<long long> >" or branch._fClassName == b"vector<vector<Long64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">i8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">i8")))
                 elif branch._fClassName == b"vector<vector<unsigned long long> >" or branch._fClassName == b"vector<vector<ULong64_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">u8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">u8")))
                 elif branch._fClassName == b"vector<vector<float> >" or branch._fClassName == b"vector<vector<Float_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f4"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">f4")))
                 elif branch._fClassName == b"vector<vector<double> >" or branch._fClassName == b"vector<vector<Double_t> >":
-                    return asgenobj(STLVector(STLVector(asdtype(">f8"))), branch._context, 6)
+                    return asstlvector(STLVector(asdtype(">f8")))
                 elif branch._fClassName == b"vector<vector<string> >":
                     return asgenobj(STLVector(STLVector(STLString(awkward0))), branch._context, 6)
 
                 if branch._fClassName == b"map<string,bool>" or branch._fClassName == b"map<string,Bool_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype(awkward0.numpy.bool_)), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype(awkward0.numpy.bool_), dicts=True)
                 elif branch._fClassName == b"map<string,char>" or branch._fClassName == b"map<string,Char_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i1")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i1"), dicts=True)
                 elif branch._fClassName == b"map<string,unsigned char>" or branch._fClassName == b"map<string,UChar_t>" or branch._fClassName == b"map<string,Byte_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u1")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u1"), dicts=True)
                 elif branch._fClassName == b"map<string,short>" or branch._fClassName == b"map<string,Short_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i2")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i2"), dicts=True)
                 elif branch._fClassName == b"map<string,unsigned short>" or branch._fClassName == b"map<string,UShort_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u2")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u2"), dicts=True)
                 elif branch._fClassName == b"map<string,int>" or branch._fClassName == b"map<string,Int_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i4")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i4"), dicts=True)
                 elif branch._fClassName == b"map<string,unsigned int>" or branch._fClassName == b"map<string,UInt_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u4")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u4"), dicts=True)
                 elif branch._fClassName == b"map<string,long>" or branch._fClassName == b"map<string,Long_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i8"), dicts=True)
                 elif branch._fClassName == b"map<string,unsigned long>" or branch._fClassName == b"map<string,ULong_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u8"), dicts=True)
                 elif branch._fClassName == b"map<string,long long>" or branch._fClassName == b"map<string,Long64_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("i8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("i8"), dicts=True)
                 elif branch._fClassName == b"map<string,unsigned long long>" or branch._fClassName == b"map<string,ULong64_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("u8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("u8"), dicts=True)
                 elif branch._fClassName == b"map<string,float>" or branch._fClassName == b"map<string,Float_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("f4")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("f4"), dicts=True)
                 elif branch._fClassName == b"map<string,double>" or branch._fClassName == b"map<string,Double_t>":
-                    return asgenobj(STLMap(STLString(awkward0), asdtype("f8")), branch._context, 6)
+                    return asstlmap(STLString(awkward0), asdtype("f8"), dicts=True)
                 elif branch._fClassName == b"map<string,string>":
-                    return asgenobj(STLMap(STLString(awkward0), STLString(awkward0)), branch._context, 6)
+                    return asstlmap(STLString(awkward0), STLString(awkward0), dicts=True)
 
                 if branch.name.endswith(b".first") and branch._fClassName.startswith(b"pair<string,"):
                     return asgenobj(SimpleArray(STLString(awkward0)), branch._context, 6)
@@ -27,6 +27,30 @@ def _destructive_divide(array, divisor, awkward0):
         awkward0.numpy.floor_divide(array, divisor, out=array)
     return array
 
+def _skipheaders(data, bytestarts, bytestops, itemsize, numpy):
+    # copies data[bytestarts[i]:bytestops[i]] for all i into one contiguous array, without a basket-sized mask
+    counts = numpy.maximum(bytestops - bytestarts, 0)
+    total = counts.sum()
+    if total == 0:
+        return data[:0]
+
+    if total >= 64 * itemsize * len(counts):
+        # large entries: one copy per entry is cheaper than an index per item
+        return numpy.concatenate([data[start:stop] for start, stop in zip(bytestarts.tolist(), bytestops.tolist()) if stop > start])
+
+    # small entries: gather whole items through a view with one overlapping itemsize-byte window per byte of data
+    if itemsize > len(data) or (counts % itemsize != 0).any():
+        itemsize = 1
+    data = numpy.ascontiguousarray(data)
+    numitems = counts // itemsize
+    itemstarts = numpy.empty(len(numitems), dtype=numitems.dtype)
+    itemstarts[0] = 0
+    numpy.cumsum(numitems[:-1], out=itemstarts[1:])
+    index = numpy.repeat(bytestarts - itemstarts * itemsize, numitems)
+    index += numpy.arange(0, total, itemsize, dtype=index.dtype)
+    windows = numpy.ndarray((len(data) - itemsize + 1,), dtype="V{0}".format(itemsize), buffer=data, strides=(1,))
+    return windows[index].view(data.dtype)
+
 class asjagged(uproot3.interp.interp.Interpretation):
     # makes __doc__ attribute mutable before Python 3.3
     __metaclass__ = type.__new__(type, "type", (uproot3.interp.interp.Interpretation.__metaclass__,), {})
@@ -75,17 +99,6 @@ class asjagged(uproot3.interp.interp.Interpretation):
                 return self.awkward0.JaggedArray(starts, stops, content)
 
             else:
-                bytestarts = byteoffsets[local_entrystart     : local_entrystop    ] + self.skipbytes
-                bytestops  = byteoffsets[local_entrystart + 1 : local_entrystop + 1]
-
-                mask = self.awkward0.numpy.zeros(len(data), dtype=self.awkward0.numpy.int8)
-                mask[bytestarts[bytestarts < len(data)]] = 1
-                self.awkward0.numpy.add.at(mask, bytestops[bytestops < len(data)], -1)
-                self.awkward0.numpy.cumsum(mask, out=mask)
-                data = data[mask.view(self.awkward0.numpy.bool_)]
-
-                content = self.content.fromroot(data, None, 0, bytestops[-1], keylen)
-
                 itemsize = 1
                 sub = self.content
                 while hasattr(sub, "content"):
@@ -95,7 +108,13 @@ class asjagged(uproot3.interp.interp.Interpretation):
                 if isinstance(sub, uproot3.interp.numerical.asstlbitset):
                     itemsize = sub.numbytes + 4
 
-                counts = bytestops - bytestarts
+                bytestarts = byteoffsets[local_entrystart     : local_entrystop    ] + self.skipbytes
+                bytestops  = byteoffsets[local_entrystart + 1 : local_entrystop + 1]
+
+                data = _skipheaders(data, bytestarts, bytestops, itemsize, self.awkward0.numpy)
+                content = self.content.fromroot(data, None, 0, len(data), keylen)
+
+                counts = self.awkward0.numpy.maximum(bytestops - bytestarts, 0)
                 shift = math.log(itemsize, 2)
                 if shift == round(shift):
                     self.awkward0.numpy.right_shift(counts, int(shift), out=counts)
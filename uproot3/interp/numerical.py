@@ -34,6 +34,12 @@ def _flatlen(obj, awkward0):
     else:
         return int(awkward0.numpy.prod(obj.shape))
 
+class _SourcesPrep(object):
+    def __init__(self):
+        self.sources = []
+        self.itemstart = 0
+        self.itemstop = None
+
 class _asnumeric(uproot3.interp.interp.Interpretation):
     @property
     def todtypeflat(self):
@@ -85,7 +91,9 @@ class asdtype(_asnumeric):
     # makes __doc__ attribute mutable before Python 3.3
     __metaclass__ = type.__new__(type, "type", (_asnumeric.__metaclass__,), {})
 
-    def __init__(self, fromdtype, todtype=None):
+    native = True
+
+    def __init__(self, fromdtype, todtype=None, native=True):
         if isinstance(fromdtype, self.awkward0.numpy.dtype):
             self.fromdtype = fromdtype
         elif isinstance(fromdtype, string_types) and len(fromdtype) > 0 and fromdtype[0] in BYTEORDER_INDICATORS:
@@ -95,8 +103,12 @@ class asdtype(_asnumeric):
         else:
             self.fromdtype = self.awkward0.numpy.dtype(fromdtype).newbyteorder(">")
 
+        self.native = native
         if todtype is None:
-            self.todtype = self.fromdtype.newbyteorder("=")
+            if native:
+                self.todtype = self.fromdtype.newbyteorder("=")
+            else:
+                self.todtype = self.fromdtype
         elif isinstance(todtype, self.awkward0.numpy.dtype):
             self.todtype = todtype
         elif isinstance(todtype, string_types) and len(todtype) > 0 and todtype[0] in BYTEORDER_INDICATORS:
@@ -120,7 +132,7 @@ class asdtype(_asnumeric):
             if todims is not None:
                 shape = todims + shape
 
-        return asdtype(self.fromdtype, self.awkward0.numpy.dtype((dtype, shape)))
+        return asdtype(self.fromdtype, self.awkward0.numpy.dtype((dtype, shape)), self.native)
 
     def toarray(self, array):
         return asarray(self.fromdtype, array)
@@ -129,6 +141,8 @@ class asdtype(_asnumeric):
         args = [repr(str(self.fromdtype))]
         if self.fromdtype.newbyteorder(">") != self.todtype.newbyteorder(">"):
             args.append(repr(str(self.todtype)))
+        if not self.native:
+            args.append("native=False")
         return "asdtype({0})".format(", ".join(args))
 
     @property
@@ -156,13 +170,59 @@ class asdtype(_asnumeric):
     def numitems(self, numbytes, numentries):
         dtype, shape = _dtypeshape(self.fromdtype)
         quotient, remainder = divmod(numbytes, dtype.itemsize)
-        assert remainder == 0
+        assert numpy.all(remainder == 0)
         return quotient
 
     def fromroot(self, data, byteoffsets, local_entrystart, local_entrystop, keylen):
         dtype, shape = _dtypeshape(self.fromdtype)
         return data.view(dtype).reshape((-1,) + shape)[local_entrystart:local_entrystop]
 
+    @property
+    def _views(self):
+        # without conversion, the output can be made of the baskets' own (big-endian) data, rather than a copy of it
+        return not self.native and self.todtype == self.fromdtype
+
+    def destination(self, numitems, numentries):
+        if self._views:
+            return _SourcesPrep()
+        else:
+            return super(asdtype, self).destination(numitems, numentries)
+
+    def fill(self, source, destination, itemstart, itemstop, entrystart, entrystop):
+        if isinstance(destination, _SourcesPrep):
+            destination.sources.append((itemstart, itemstop, source.reshape(-1)))
+        else:
+            super(asdtype, self).fill(source, destination, itemstart, itemstop, entrystart, entrystop)
+
+    def clip(self, destination, itemstart, itemstop, entrystart, entrystop):
+        if isinstance(destination, _SourcesPrep):
+            destination.itemstart, destination.itemstop = itemstart, itemstop
+            return destination
+        else:
+            return super(asdtype, self).clip(destination, itemstart, itemstop, entrystart, entrystop)
+
+    def finalize(self, destination, branch):
+        if isinstance(destination, _SourcesPrep):
+            # a single basket is returned as a view; only several are copied, once, into one array
+            dtype, shape = _dtypeshape(self.todtype)
+            pieces = []
+            for start, stop, source in sorted(destination.sources, key=lambda x: x[0]):
+                low = max(start, destination.itemstart)
+                high = stop if destination.itemstop is None else min(stop, destination.itemstop)
+                if high > low:
+                    pieces.append(source[low - start : high - start])
+            if len(pieces) == 1:
+                out = pieces[0]
+            else:
+                # not numpy.concatenate, which would return native-endian data
+                out = self.awkward0.numpy.empty(sum(len(x) for x in pieces), dtype)
+                stop = 0
+                for x in pieces:
+                    out[stop : stop + len(x)] = x
+                    stop += len(x)
+            destination = out.reshape((-1,) + shape)
+        return super(asdtype, self).finalize(destination, branch)
+
 class asarray(asdtype):
     # makes __doc__ attribute mutable before Python 3.3
     __metaclass__ = type.__new__(type, "type", (asdtype.__metaclass__,), {})
@@ -201,7 +261,11 @@ class asarray(asdtype):
 
     def clip(self, destination, itemstart, itemstop, entrystart, entrystop):
         array, stop = destination
-        return super(asarray, self).clip(array, itemstart, itemstop, entrystart, entrystop), stop
+        clipped = super(asarray, self).clip(array, itemstart, itemstop, entrystart, entrystop)
+        if itemstart != 0:
+            # the first basket was only partly read; move the entries to the beginning of the array
+            array[:len(clipped)] = clipped
+        return array, len(clipped)
 
     def finalize(self, destination, branch):
         array, stop = destination
@@ -273,7 +337,7 @@ class asdouble32(_asnumeric):
 
     def numitems(self, numbytes, numentries):
         quotient, remainder = divmod(numbytes, self.fromdtypeflat.itemsize)
-        assert remainder == 0
+        assert numpy.all(remainder == 0)
         return quotient
 
     def fromroot(self, data, byteoffsets, local_entrystart, local_entrystop, keylen):
@@ -299,12 +363,20 @@ class asdouble32(_asnumeric):
             array = unpacked.view(dtype=self.awkward0.numpy.float32) * sign
             array = array.astype(self.todtypeflat)
         else:
-            array = array[local_entrystart:local_entrystop].astype(self.todtypeflat)
-            self.awkward0.numpy.multiply(array, float(self.high - self.low) / (1 << self.numbits), out=array)
-            self.awkward0.numpy.add(array, self.low, out=array)
+            # scaled into the destination by fill
+            array = array[local_entrystart:local_entrystop]
 
         return array
 
+    def fill(self, source, destination, itemstart, itemstop, entrystart, entrystop):
+        if self.truncated:
+            super(asdouble32, self).fill(source, destination, itemstart, itemstop, entrystart, entrystop)
+        else:
+            # byte-swap, convert, and scale the packed integers in one pass that writes the destination directly
+            out = destination.reshape(-1)[itemstart:itemstop]
+            self.awkward0.numpy.multiply(source.reshape(-1), float(self.high - self.low) / (1 << self.numbits), out=out, dtype=out.dtype, casting="unsafe")
+            self.awkward0.numpy.add(out, self.low, out=out)
+
 class asfloat16(asdouble32):
     # makes __doc__ attribute mutable before Python 3.3
     __metaclass__ = type.__new__(type, "type", (asdouble32.__metaclass__,), {})
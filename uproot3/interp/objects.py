@@ -281,6 +281,42 @@ class asobj(uproot3.interp.interp.Interpretation):
             print("reading {0}".format(repr(out)))
         return out
 
+class asstreamed(uproot3.interp.numerical.asdtype):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (uproot3.interp.numerical.asdtype.__metaclass__,), {})
+
+    _kByteCountMask = 0x40000000
+
+    def __init__(self, fromdtype, todtype=None):
+        super(asstreamed, self).__init__(fromdtype, todtype)
+        if self.fromdtype.names is None or self.fromdtype.names[0] != " cnt":
+            raise TypeError("asstreamed must be given a recarray dtype that starts with the byte count (' cnt')")
+        self._headers = [n for n in self.fromdtype.names if n.startswith(" cnt") or n.startswith(" vers")]
+
+    def __repr__(self):
+        return "asstreamed" + super(asstreamed, self).__repr__()[7:]
+
+    @property
+    def identifier(self):
+        return "asstreamed" + super(asstreamed, self).identifier[7:]
+
+    def compatible(self, other):
+        return isinstance(other, asstreamed) and self.todtype == other.todtype
+
+    def numitems(self, numbytes, numentries):
+        quotient, remainder = divmod(numbytes, self.fromdtype.itemsize)
+        if not numpy.all(remainder == 0) or not numpy.all(quotient == numentries):
+            raise ValueError("objects in this basket are not all serialized as the {0}-byte layout of {1}; read them with asgenobj instead".format(self.fromdtype.itemsize, repr(self)))
+        return quotient
+
+    def fromroot(self, data, byteoffsets, local_entrystart, local_entrystop, keylen):
+        out = super(asstreamed, self).fromroot(data, byteoffsets, local_entrystart, local_entrystop, keylen)
+        # every object must be the fixed layout: the outermost byte count covers the whole record and the
+        # byte counts and versions of all nested classes are the same in every entry
+        if len(out) > 0 and ((out[" cnt"] != (self._kByteCountMask | (self.fromdtype.itemsize - 4))).any() or any((out[n] != out[n][0]).any() for n in self._headers)):
+            raise ValueError("objects in this basket are not all serialized as the {0}-byte layout of {1}; read them with asgenobj instead".format(self.fromdtype.itemsize, repr(self)))
+        return out
+
 class _variable(uproot3.interp.interp.Interpretation):
     def __init__(self, content, generator, *args, **kwargs):
         self.content = content
@@ -406,13 +442,267 @@ class asstring(_variable):
     __metaclass__ = type.__new__(type, "type", (_variable.__metaclass__,), {})
 
     def __init__(self, skipbytes=1):
-        super(asstring, self).__init__(uproot3.interp.jagged.asjagged(uproot3.interp.numerical.asdtype(self.awkward0.ObjectArray.CHARTYPE), skipbytes=skipbytes), lambda array: _tobytes(array))
+        # the header is removed in _fromjagged, where its length can depend on the string
+        super(asstring, self).__init__(uproot3.interp.jagged.asjagged(uproot3.interp.numerical.asdtype(self.awkward0.ObjectArray.CHARTYPE), skipbytes=0), None)
+        self.skipbytes = skipbytes
 
     def __repr__(self):
-        return "asstring({0})".format("" if self.content.skipbytes == 1 else repr(self.content.skipbytes))
+        return "asstring({0})".format("" if self.skipbytes == 1 else repr(self.skipbytes))
+
     @property
     def identifier(self):
-        return "asstring({0})".format("" if self.content.skipbytes == 1 else repr(self.content.skipbytes))
+        return "asstring({0})".format("" if self.skipbytes == 1 else repr(self.skipbytes))
+
+    @property
+    def type(self):
+        return bytes
+
+    def empty(self):
+        return self._fromjagged(self.content.empty())
 
     def compatible(self, other):
         return isinstance(other, asstring)
+
+    def finalize(self, destination, branch):
+        out = self._fromjagged(self.content.finalize(destination, branch))
+        if self.debug_reading:
+            print("reading {0}".format(repr(out)))
+        return out
+
+    def _fromjagged(self, jagged):
+        # a StringArray is a view of the same characters: only the starts move past each header
+        numpy = self.awkward0.numpy
+        data = jagged.content
+        starts = numpy.asarray(jagged.starts, dtype=numpy.int64)
+        stops = numpy.asarray(jagged.stops, dtype=numpy.int64)
+
+        # a length byte of 255 at the end of the header means that a 4-byte length follows (strings of 255 bytes or more)
+        skip = numpy.full(len(starts), self.skipbytes, dtype=numpy.int64)
+        if self.skipbytes > 0:
+            candidates = numpy.nonzero(stops - starts >= self.skipbytes + 4)[0]
+            candidates = candidates[data[starts[candidates] + self.skipbytes - 1] == 255]
+            islong = _bigendian(data, starts[candidates] + self.skipbytes, ">i4") == stops[candidates] - starts[candidates] - self.skipbytes - 4
+            skip[candidates[islong]] += 4
+
+        return self.awkward0.StringArray.fromjagged(self.awkward0.JaggedArray(numpy.minimum(starts + skip, stops), stops, data), encoding=None)
+
+def _gathernumbers(data, positions, dtype):
+    # one number of the given dtype at each byte position of data
+    dtype = numpy.dtype(dtype)
+    return data[positions[:, numpy.newaxis] + numpy.arange(dtype.itemsize)].view(dtype).reshape(-1)
+
+def _bigendian(data, positions, dtype):
+    return _gathernumbers(data, positions, dtype).astype(numpy.int64)
+
+def _gatherbytes(data, starts, numbytes):
+    # concatenation of data[starts[i] : starts[i] + numbytes[i]] for all i
+    offsets = numpy.zeros(len(numbytes) + 1, dtype=numpy.int64)
+    numpy.cumsum(numbytes, out=offsets[1:])
+    return data[numpy.arange(offsets[-1]) + numpy.repeat(starts - offsets[:-1], numbytes)]
+
+def _isfastitem(cls):
+    if isinstance(cls, uproot3.interp.numerical.asdtype):
+        return cls.fromdtype.shape == () and cls.todtype.shape == ()
+    elif isinstance(cls, STLVector):
+        return isinstance(cls.cls, uproot3.interp.numerical.asdtype) and _isfastitem(cls.cls)
+    else:
+        return isinstance(cls, STLString)
+
+def _itemidentifier(cls):
+    if isinstance(cls, uproot3.interp.numerical.asdtype):
+        return cls.identifier
+    elif isinstance(cls, STLVector):
+        return "STLVector({0})".format(cls.cls.identifier)
+    else:
+        return "STLString()"
+
+def _itemtype(awkward0, cls):
+    if isinstance(cls, uproot3.interp.numerical.asdtype):
+        return cls.todtype
+    elif isinstance(cls, STLVector):
+        return awkward0.type.ArrayType(awkward0.numpy.inf, cls.cls.todtype)
+    else:
+        return bytes
+
+def _readitems(data, where, cls):
+    # start, size (in numbers or characters), and end of one serialized item of type cls at each position
+    if isinstance(cls, uproot3.interp.numerical.asdtype):
+        return where, numpy.ones(len(where), dtype=numpy.int64), where + cls.fromdtype.itemsize
+    elif isinstance(cls, STLString):
+        size = data[where].astype(numpy.int64)
+        islong = numpy.nonzero(size == 255)[0]
+        size[islong] = _bigendian(data, where[islong] + 1, ">i4")
+        start = where + 1
+        start[islong] += 4
+        return start, size, start + size
+    else:
+        size = _bigendian(data, where, ">i4")
+        return where + 4, size, where + 4 + size * cls.cls.fromdtype.itemsize
+
+def _scanitems(data, position, counts, offsets, clses, starts, sizes):
+    # reads counts[i] groups of items (one of each type in clses) starting at position[i], for all entries i at once:
+    # one pass over the entries for each index within the groups, so the number of Python-level steps is the maximum
+    # count, not the number of items; position is left at the end of each entry's items
+    active = numpy.nonzero(counts > 0)[0]
+    i = 0
+    while len(active) > 0:
+        where = position[active]
+        index = offsets[active] + i
+        for cls, start, size in zip(clses, starts, sizes):
+            start[index], size[index], where = _readitems(data, where, cls)
+        position[active] = where
+        i += 1
+        active = active[counts[active] > i]
+
+def _checkitems(position, stops, counts, sizes, interpretation):
+    nonempty = counts > 0
+    if any((size < 0).any() for size in sizes) or (position[nonempty] > stops[nonempty]).any():
+        raise ValueError("serialized data extend beyond the end of their entry in {0}".format(repr(interpretation)))
+
+def _column(awkward0, data, cls, starts, sizes):
+    # all of the items found by _readitems as one array
+    if isinstance(cls, uproot3.interp.numerical.asdtype):
+        out = _gathernumbers(data, starts, cls.fromdtype)
+        if out.dtype != cls.todtype:
+            out = out.astype(cls.todtype)
+        return out
+    elif isinstance(cls, STLString):
+        return awkward0.StringArray.fromjagged(awkward0.JaggedArray.fromcounts(sizes, _gatherbytes(data, starts, sizes)), encoding=None)
+    else:
+        content = _gatherbytes(data, starts, sizes * cls.cls.fromdtype.itemsize).view(cls.cls.fromdtype)
+        if content.dtype != cls.cls.todtype:
+            content = content.astype(cls.cls.todtype)
+        return awkward0.JaggedArray.fromcounts(sizes, content)
+
+class asstlvector(_variable):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (_variable.__metaclass__,), {})
+
+    def __init__(self, cls, skipbytes=6):
+        if not isinstance(cls, (STLString, STLVector)) or not _isfastitem(cls):
+            raise TypeError("asstlvector reads vectors of strings or of vectors of numbers, not {0}".format(repr(cls)))
+        super(asstlvector, self).__init__(uproot3.interp.jagged.asjagged(uproot3.interp.numerical.asdtype(self.awkward0.ObjectArray.CHARTYPE), skipbytes=skipbytes), None)
+        self.cls = cls
+
+    def __repr__(self):
+        return "asstlvector({0}{1})".format(repr(self.cls), "" if self.content.skipbytes == 6 else ", {0}".format(self.content.skipbytes))
+
+    @property
+    def identifier(self):
+        return "asstlvector({0}{1})".format(_itemidentifier(self.cls), "" if self.content.skipbytes == 6 else ",{0}".format(self.content.skipbytes))
+
+    @property
+    def type(self):
+        return self.awkward0.type.ArrayType(self.awkward0.numpy.inf, _itemtype(self.awkward0, self.cls))
+
+    def empty(self):
+        return self._fromjagged(self.content.empty())
+
+    def compatible(self, other):
+        return isinstance(other, asstlvector) and self.identifier == other.identifier
+
+    def finalize(self, destination, branch):
+        out = self._fromjagged(self.content.finalize(destination, branch))
+        if self.debug_reading:
+            print("reading {0}".format(repr(out)))
+        return out
+
+    def _fromjagged(self, jagged):
+        numpy = self.awkward0.numpy
+        data = jagged.content
+        starts = numpy.asarray(jagged.starts, dtype=numpy.int64)
+        stops = numpy.asarray(jagged.stops, dtype=numpy.int64)
+
+        counts = numpy.zeros(len(starts), dtype=numpy.int64)
+        nonempty = numpy.nonzero(stops - starts >= 4)[0]
+        counts[nonempty] = _bigendian(data, starts[nonempty], ">i4")
+        if (counts < 0).any():
+            raise ValueError("negative vector size in {0}".format(repr(self)))
+        offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+
+        itemstarts, itemsizes = numpy.empty(offsets[-1], dtype=numpy.int64), numpy.empty(offsets[-1], dtype=numpy.int64)
+        position = starts + 4
+        _scanitems(data, position, counts, offsets, [self.cls], [itemstarts], [itemsizes])
+        _checkitems(position, stops, counts, [itemsizes], self)
+
+        return self.awkward0.JaggedArray.fromcounts(counts, _column(self.awkward0, data, self.cls, itemstarts, itemsizes))
+
+def _mapdict(entry):
+    return dict(zip(entry["keys"], entry["values"]))
+
+class asstlmap(_variable):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (_variable.__metaclass__,), {})
+
+    _memberwise = 0x4000
+
+    def __init__(self, keycls, valcls, dicts=False):
+        if not _isfastitem(keycls) or not _isfastitem(valcls):
+            raise TypeError("asstlmap reads maps of numbers, strings, or vectors of numbers, not {0}".format(repr(STLMap(keycls, valcls))))
+        # the 6-byte header is not skipped: its version says whether the map was written member-wise
+        super(asstlmap, self).__init__(uproot3.interp.jagged.asjagged(uproot3.interp.numerical.asdtype(self.awkward0.ObjectArray.CHARTYPE), skipbytes=0), None)
+        self.keycls = keycls
+        self.valcls = valcls
+        self.dicts = dicts
+
+    def __repr__(self):
+        return "asstlmap({0}, {1}{2})".format(repr(self.keycls), repr(self.valcls), ", dicts=True" if self.dicts else "")
+
+    @property
+    def identifier(self):
+        return "asstlmap({0},{1}{2})".format(_itemidentifier(self.keycls), _itemidentifier(self.valcls), ",dicts=True" if self.dicts else "")
+
+    @property
+    def type(self):
+        if self.dicts:
+            return self.awkward0.type.ArrayType(self.awkward0.numpy.inf, dict)
+        else:
+            return self.awkward0.type.ArrayType(self.awkward0.numpy.inf, self.awkward0.numpy.inf, self.awkward0.type.TableType(keys=_itemtype(self.awkward0, self.keycls), values=_itemtype(self.awkward0, self.valcls)))
+
+    def empty(self):
+        return self._fromjagged(self.content.empty())
+
+    def compatible(self, other):
+        return isinstance(other, asstlmap) and self.identifier == other.identifier
+
+    def finalize(self, destination, branch):
+        out = self._fromjagged(self.content.finalize(destination, branch))
+        if self.debug_reading:
+            print("reading {0}".format(repr(out)))
+        return out
+
+    def _fromjagged(self, jagged):
+        numpy = self.awkward0.numpy
+        data = jagged.content
+        starts = numpy.asarray(jagged.starts, dtype=numpy.int64)
+        stops = numpy.asarray(jagged.stops, dtype=numpy.int64)
+
+        # 4-byte byte count, 2-byte version, then (if member-wise) a 2-byte class version and 4-byte checksum before the size
+        counts = numpy.zeros(len(starts), dtype=numpy.int64)
+        memberwise = numpy.zeros(len(starts), dtype=numpy.bool_)
+        nonempty = numpy.nonzero(stops - starts >= 10)[0]
+        memberwise[nonempty] = (_bigendian(data, starts[nonempty] + 4, ">u2") & self._memberwise) != 0
+        position = starts + numpy.where(memberwise, 12, 6)
+        counts[nonempty] = _bigendian(data, position[nonempty], ">i4")
+        if (counts < 0).any():
+            raise ValueError("negative map size in {0}".format(repr(self)))
+        position += 4
+        offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+
+        keystarts, keysizes = numpy.empty(offsets[-1], dtype=numpy.int64), numpy.empty(offsets[-1], dtype=numpy.int64)
+        valstarts, valsizes = numpy.empty(offsets[-1], dtype=numpy.int64), numpy.empty(offsets[-1], dtype=numpy.int64)
+
+        # object-wise maps alternate key, value, key, value...; member-wise maps have all keys, then all values
+        objectwise = numpy.where(memberwise, 0, counts)
+        _scanitems(data, position, objectwise, offsets, [self.keycls, self.valcls], [keystarts, valstarts], [keysizes, valsizes])
+        memberwise = numpy.where(memberwise, counts, 0)
+        _scanitems(data, position, memberwise, offsets, [self.keycls], [keystarts], [keysizes])
+        _scanitems(data, position, memberwise, offsets, [self.valcls], [valstarts], [valsizes])
+        _checkitems(position, stops, counts, [keysizes, valsizes], self)
+
+        out = self.awkward0.JaggedArray.fromcounts(counts, self.awkward0.Table(keys=_column(self.awkward0, data, self.keycls, keystarts, keysizes), values=_column(self.awkward0, data, self.valcls, valstarts, valsizes)))
+        if self.dicts:
+            out = self.awkward0.ObjectArray(out, _mapdict)
+        return out
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import multiprocessing
+import sys
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+def _identity(value):
+    return value
+
+class Pipeline(object):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (type,), {})
+
+    FETCH, DECOMPRESS, INTERPRET = 0, 1, 2
+
+    def __init__(self, fetchworkers=4, decompressworkers=None, interpretworkers=1, queuesize=None):
+        try:
+            import concurrent.futures
+        except ImportError:
+            raise ImportError("Install futures package (for concurrent.futures backport) with:\n    pip install futures\nor\n    conda install -c conda-forge futures")
+        self._future = concurrent.futures.Future
+
+        if decompressworkers is None:
+            decompressworkers = multiprocessing.cpu_count()
+        self._numworkers = [fetchworkers, decompressworkers, interpretworkers]
+        if any(x < 1 for x in self._numworkers):
+            raise ValueError("each stage of a Pipeline needs at least one worker")
+        if queuesize is None:
+            queuesize = 2 * max(self._numworkers)
+        self._queuesize = queuesize
+
+        # the input queue is unbounded; the queues between stages are bounded, so a stage that falls behind blocks the one before it
+        self._queues = [queue.Queue(), queue.Queue(queuesize), queue.Queue(queuesize)]
+        self._threads = []
+        for stage, numworkers in enumerate(self._numworkers):
+            threads = [threading.Thread(target=self._work, args=(stage,)) for i in range(numworkers)]
+            for thread in threads:
+                thread.daemon = True
+                thread.start()
+            self._threads.append(threads)
+        self._shutdown = False
+
+    def __repr__(self):
+        return "<Pipeline fetch={0} decompress={1} interpret={2} at 0x{3:012x}>".format(self._numworkers[0], self._numworkers[1], self._numworkers[2], id(self))
+
+    @property
+    def maxinflight(self):
+        return sum(self._numworkers) + 2 * self._queuesize
+
+    def _work(self, stage):
+        while True:
+            item = self._queues[stage].get()
+            if item is None:
+                break
+            future, stages, value = item
+            try:
+                if stage == self.FETCH:
+                    value = stages[stage]()
+                else:
+                    value = stages[stage](value)
+            except Exception:
+                future.set_exception(sys.exc_info()[1])
+                continue
+            if stage == self.INTERPRET:
+                future.set_result(value)
+            else:
+                self._queues[stage + 1].put((future, stages, value))
+
+    def submit_stages(self, fetch, decompress, interpret):
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new tasks after shutdown")
+        future = self._future()
+        self._queues[self.FETCH].put((future, (fetch, decompress, interpret), None))
+        return future
+
+    def submit(self, fn, *args, **kwargs):
+        # an ordinary task runs in the first stage and passes through the others unchanged
+        return self.submit_stages(lambda: fn(*args, **kwargs), _identity, _identity)
+
+    def map(self, fn, *iterables):
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+        def results():
+            for future in futures:
+                yield future.result()
+        return results()
+
+    def shutdown(self, wait=True):
+        if not self._shutdown:
+            self._shutdown = True
+            def stop():
+                # stop the stages in order, so that everything already fetched is decompressed and interpreted
+                for stage, threads in enumerate(self._threads):
+                    for thread in threads:
+                        self._queues[stage].put(None)
+                    for thread in threads:
+                        thread.join()
+            if wait:
+                stop()
+            else:
+                threading.Thread(target=stop).start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.shutdown(wait=True)
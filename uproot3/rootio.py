@@ -10,6 +10,7 @@ import os
 import re
 import struct
 import sys
+from collections import deque
 try:
     from urlparse import urlparse
 except ImportError:
@@ -49,10 +50,10 @@ def open(path, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defa
             for n in kwargs:
                 if n in options:
                     kwargs[n] = options.pop(n)
-            openfcn = lambda path: MemmapSource(path, **kwargs)
+            openfcn = _SourceFactory(MemmapSource, kwargs)
         else:
             openfcn = localsource
-        return ROOTDirectory.read(openfcn(path), **options)
+        return _readwith(openfcn, path, **options)
 
     elif _bytesid(parsed.scheme) == b"root":
         return xrootd(path, xrootdsource=xrootdsource, **options)
@@ -72,10 +73,10 @@ def xrootd(path, xrootdsource=XRootDSource.defaults, **options):
         for n in kwargs:
             if n in options:
                 kwargs[n] = options.pop(n)
-        openfcn = lambda path: XRootDSource(path, **kwargs)
+        openfcn = _SourceFactory(XRootDSource, kwargs)
     else:
         openfcn = xrootdsource
-    return ROOTDirectory.read(openfcn(path), **options)
+    return _readwith(openfcn, path, **options)
 
 def http(path, httpsource=HTTPSource.defaults, **options):
     if isinstance(httpsource, dict):
@@ -84,10 +85,23 @@ def http(path, httpsource=HTTPSource.defaults, **options):
         for n in kwargs:
             if n in options:
                 kwargs[n] = options.pop(n)
-        openfcn = lambda path: HTTPSource(path, **kwargs)
+        openfcn = _SourceFactory(HTTPSource, kwargs)
     else:
         openfcn = httpsource
-    return ROOTDirectory.read(openfcn(path), **options)
+    return _readwith(openfcn, path, **options)
+
+class _SourceFactory(object):
+    # opens a source with the options the file was opened with; unlike a lambda, it can be pickled for worker processes
+    def __init__(self, cls, kwargs):
+        self.cls, self.kwargs = cls, kwargs
+
+    def __call__(self, path):
+        return self.cls(path, **self.kwargs)
+
+def _readwith(openfcn, path, **options):
+    out = ROOTDirectory.read(openfcn(path), **options)
+    out._context.sourcefactory = openfcn
+    return out
 
 def nofilter(x): return True
 
@@ -104,6 +118,8 @@ class ROOTDirectory(object):
         def __init__(self, sourcepath, streamerinfos, streamerinfosmap, classes, compression, tfile):
             self.sourcepath, self.streamerinfos, self.streamerinfosmap, self.classes, self.compression, self.tfile = sourcepath, streamerinfos, streamerinfosmap, classes, compression, tfile
             self.uuid = tfile["_fUUID"]
+            self.objectcache = None
+            self.sourcefactory = None
 
         def copy(self):
             out = ROOTDirectory._FileContext.__new__(ROOTDirectory._FileContext)
@@ -115,6 +131,7 @@ class ROOTDirectory(object):
         if len(args) == 0:
             try:
                 read_streamers = options.pop("read_streamers", True)
+                objectcache = options.pop("objectcache", None)
                 if len(options) > 0:
                     raise TypeError("unrecognized options: {0}".format(", ".join(options)))
 
@@ -161,6 +178,10 @@ class ROOTDirectory(object):
                 classes = _defineclasses(streamerinfos, classes)
                 context = ROOTDirectory._FileContext(source.path, streamerinfos, streamerinfosmap, classes, uproot3.source.compressed.Compression(fCompress), tfile)
                 context.source = source
+                if objectcache is not None:
+                    # writing moves the file's end and free-segment pointers (recreating changes its UUID): either means cached objects may be stale
+                    objectcache._checkgeneration(source.path, (fUUID, fEND, fSeekFree, fNbytesFree))
+                    context.objectcache = objectcache
 
                 keycursor = Cursor(fBEGIN)
                 mykey = TKey.read(source, keycursor, context, None)
@@ -190,10 +211,11 @@ class ROOTDirectory(object):
 
                 else:
                     subcursor = Cursor(fSeekKeys)
-                    headerkey = TKey.read(source, subcursor, context, None)
+                    keysource = subcursor.prefetched(source, fNbytesKeys)
+                    headerkey = TKey.read(keysource, subcursor, context, None)
 
-                    nkeys = subcursor.field(source, ROOTDirectory._format5)
-                    keys = [TKey.read(source, subcursor, context, None) for i in range(nkeys)]
+                    nkeys = subcursor.field(keysource, ROOTDirectory._format5)
+                    keys = [TKey.read(keysource, subcursor, context, None) for i in range(nkeys)]
 
                     out = ROOTDirectory(mykey._fName, context, keys)
 
@@ -247,89 +269,124 @@ class ROOTDirectory(object):
                 if filtername(x._fName):
                     x.show(stream=stream)
 
-    def iterkeys(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        for key in self._keys:
-            cls = _classof(self._context, key._fClassName)
+    _prefetchdirs = 16
+
+    @staticmethod
+    def _isdirectory(key):
+        return key._fClassName == b"TDirectory" or key._fClassName == b"TDirectoryFile"
+
+    def _iterkeyitems(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        # depth-first, in each directory's key order: a subdirectory's contents follow its own key, with or without an executor
+        # each level is [path prefix, directory, its remaining keys, its subdirectories not yet entered]
+        levels = [["", self, iter(self._keys), deque(key for key in self._keys if self._isdirectory(key))]]
+        reads = {}
+        if recursive and executor is not None:
+            self._readahead(levels, reads, executor)
+
+        while len(levels) > 0:
+            prefix, directory, keys, subdirs = levels[-1]
+            key = next(keys, None)
+            if key is None:
+                levels.pop()
+                continue
+
+            cls = _classof(directory._context, key._fClassName)
             if filtername(key._fName) and filterclass(cls):
-                yield self._withcycle(key)
+                yield (prefix + self._withcycle(key).decode("ascii")).encode("ascii"), cls, key
 
-            if recursive and (key._fClassName == b"TDirectory" or key._fClassName == b"TDirectoryFile"):
-                for name in key.get().iterkeys(recursive, filtername, filterclass):
-                    yield "{0}/{1}".format(self._withoutcycle(key).decode("ascii"), name.decode("ascii")).encode("ascii")
+            if recursive and self._isdirectory(key):
+                if executor is None:
+                    subdirectory = key.get()
+                else:
+                    if id(key) not in reads:
+                        self._readahead(levels, reads, executor)
+                    future, index = reads.pop(id(key))
+                    subdirectory = future.result()[index]
+                    future.result()[index] = None    # the batch holds each directory only until it is used
+                subdirs.popleft()
+
+                levels.append([prefix + self._withoutcycle(key).decode("ascii") + "/", subdirectory, iter(subdirectory._keys), deque(x for x in subdirectory._keys if self._isdirectory(x))])
+                if executor is not None:
+                    self._readahead(levels, reads, executor)
+
+    def _readahead(self, levels, reads, executor):
+        # read the subdirectories that will be needed soonest (the deepest level's first), at most _prefetchdirs of them
+        # at a time across all levels, in one coalesced read; the first one is always read, as it may be needed now
+        batch = []
+        for i, key in enumerate(key for level in levels[::-1] for key in level[3]):
+            if i > 0 and len(reads) + len(batch) >= self._prefetchdirs:
+                break
+            if id(key) not in reads:
+                batch.append(key)
+
+        if len(batch) > 0:
+            future = executor.submit(_readkeys, batch)
+            for index, key in enumerate(batch):
+                reads[id(key)] = (future, index)
+
+    def iterkeys(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        for name, cls, key in self._iterkeyitems(recursive, filtername, filterclass, executor):
+            yield name
 
     def itervalues(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        for key in self._keys:
-            cls = _classof(self._context, key._fClassName)
-            if filtername(key._fName) and filterclass(cls):
-                yield key.get()
-
-            if recursive and (key._fClassName == b"TDirectory" or key._fClassName == b"TDirectoryFile"):
-                for value in key.get().itervalues(recursive, filtername, filterclass):
-                    yield value
+        for name, cls, key in self._iterkeyitems(recursive, filtername, filterclass):
+            yield key.get()
 
     def iteritems(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        for key in self._keys:
-            cls = _classof(self._context, key._fClassName)
-            if filtername(key._fName) and filterclass(cls):
-                yield self._withcycle(key), key.get()
+        for name, cls, key in self._iterkeyitems(recursive, filtername, filterclass):
+            yield name, key.get()
 
-            if recursive and (key._fClassName == b"TDirectory" or key._fClassName == b"TDirectoryFile"):
-                for name, value in key.get().iteritems(recursive, filtername, filterclass):
-                    yield "{0}/{1}".format(self._withoutcycle(key).decode("ascii"), name.decode("ascii")).encode("ascii"), value
+    def iterclasses(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        for name, cls, key in self._iterkeyitems(recursive, filtername, filterclass, executor):
+            yield name, cls
 
-    def iterclasses(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        for key in self._keys:
-            cls = _classof(self._context, key._fClassName)
-            if filtername(key._fName) and filterclass(cls):
-                yield self._withcycle(key), cls
-
-            if recursive and (key._fClassName == b"TDirectory" or key._fClassName == b"TDirectoryFile"):
-                for name, classname in key.get().iterclasses(recursive, filtername, filterclass):
-                    yield "{0}/{1}".format(self._withoutcycle(key).decode("ascii"), name.decode("ascii")).encode("ascii"), classname
-
-    def iterclassnames(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        for key in self._keys:
-            cls = _classof(self._context, key._fClassName)
-            if filtername(key._fName) and filterclass(cls):
-                yield self._withcycle(key), key._fClassName.decode('ascii')
-
-            if recursive and (key._fClassName == b"TDirectory" or key._fClassName == b"TDirectoryFile"):
-                for name, classname in key.get().iterclassnames(recursive, filtername, filterclass):
-                    yield "{0}/{1}".format(self._withoutcycle(key).decode("ascii"), name.decode("ascii")).encode("ascii"), classname
+    def iterclassnames(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        for name, cls, key in self._iterkeyitems(recursive, filtername, filterclass, executor):
+            yield name, key._fClassName.decode("ascii")
 
-    def keys(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        return list(self.iterkeys(recursive=recursive, filtername=filtername, filterclass=filterclass))
+    def keys(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        return list(self.iterkeys(recursive=recursive, filtername=filtername, filterclass=filterclass, executor=executor))
 
     def _ipython_key_completions_(self):
         "Support for completion of keys in an IPython kernel"
         return [item.decode("ascii") for item in self.iterkeys()]
 
-    def values(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        return list(self.itervalues(recursive=recursive, filtername=filtername, filterclass=filterclass))
+    def values(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        if executor is None:
+            return list(self.itervalues(recursive=recursive, filtername=filtername, filterclass=filterclass))
+        else:
+            return _readkeys([key for name, cls, key in self._iterkeyitems(recursive, filtername, filterclass, executor)], executor)
 
-    def items(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        return list(self.iteritems(recursive=recursive, filtername=filtername, filterclass=filterclass))
+    def items(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        if executor is None:
+            return list(self.iteritems(recursive=recursive, filtername=filtername, filterclass=filterclass))
+        else:
+            names, keys = [], []
+            for name, cls, key in self._iterkeyitems(recursive, filtername, filterclass, executor):
+                names.append(name)
+                keys.append(key)
+            return list(zip(names, _readkeys(keys, executor)))
 
-    def classes(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        return list(self.iterclasses(recursive=recursive, filtername=filtername, filterclass=filterclass))
+    def classes(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        return list(self.iterclasses(recursive=recursive, filtername=filtername, filterclass=filterclass, executor=executor))
 
-    def classnames(self, recursive=False, filtername=nofilter, filterclass=nofilter):
-        return list(self.iterclassnames(recursive=recursive, filtername=filtername, filterclass=filterclass))
+    def classnames(self, recursive=False, filtername=nofilter, filterclass=nofilter, executor=None):
+        return list(self.iterclassnames(recursive=recursive, filtername=filtername, filterclass=filterclass, executor=executor))
 
-    def allkeys(self, filtername=nofilter, filterclass=nofilter):
-        return self.keys(recursive=True, filtername=filtername, filterclass=filterclass)
+    def allkeys(self, filtername=nofilter, filterclass=nofilter, executor=None):
+        return self.keys(recursive=True, filtername=filtername, filterclass=filterclass, executor=executor)
 
-    def allvalues(self, filtername=nofilter, filterclass=nofilter):
-        return self.values(recursive=True, filtername=filtername, filterclass=filterclass)
+    def allvalues(self, filtername=nofilter, filterclass=nofilter, executor=None):
+        return self.values(recursive=True, filtername=filtername, filterclass=filterclass, executor=executor)
 
-    def allitems(self, filtername=nofilter, filterclass=nofilter):
-        return self.items(recursive=True, filtername=filtername, filterclass=filterclass)
+    def allitems(self, filtername=nofilter, filterclass=nofilter, executor=None):
+        return self.items(recursive=True, filtername=filtername, filterclass=filterclass, executor=executor)
 
-    def allclasses(self, filtername=nofilter, filterclass=nofilter):
-        return self.classes(recursive=True, filtername=filtername, filterclass=filterclass)
+    def allclasses(self, filtername=nofilter, filterclass=nofilter, executor=None):
+        return self.classes(recursive=True, filtername=filtername, filterclass=filterclass, executor=executor)
 
-    def allclassnames(self, filtername=nofilter, filterclass=nofilter):
-        return self.classnames(recursive=True, filtername=filtername, filterclass=filterclass)
+    def allclassnames(self, filtername=nofilter, filterclass=nofilter, executor=None):
+        return self.classnames(recursive=True, filtername=filtername, filterclass=filterclass, executor=executor)
 
     def get(self, name, cycle=None):
         name = _bytesid(name)
@@ -352,29 +409,76 @@ class ROOTDirectory(object):
             return out
 
         else:
-            if cycle is None and b";" in name:
-                at = name.rindex(b";")
-                name, cycle = name[:at], name[at + 1:]
-                cycle = int(cycle)
-
-            last = None
-            for key in self._keys:
-                if key._fName == name:
-                    if cycle == key._fCycle:
-                        return key.get()
-                    elif cycle is None and last is None:
-                        last = key
-                    elif cycle is None and last._fCycle < key._fCycle:
-                        last = key
-
-            if last is not None:
-                return last.get()
-            elif cycle is None:
-                raise _KeyError("not found: {0}\n in file: {1}".format(repr(name), self._context.sourcepath))
+            return self._cachedget(self._key(name, cycle))
+
+    def _cachedget(self, key):
+        objectcache = self._context.objectcache
+        if objectcache is None:
+            return key.get()
+
+        where = self._objectcachekey(key)
+        out = objectcache._get(where, self._context.source)
+        if out is None:
+            out = key.get()
+            objectcache._put(where, key, out)
+        return out
+
+    def _objectcachekey(self, key):
+        return (self._context.sourcepath, key._fSeekKey, key._fCycle)
+
+    def _key(self, name, cycle=None):
+        if cycle is None and b";" in name:
+            at = name.rindex(b";")
+            name, cycle = name[:at], name[at + 1:]
+            cycle = int(cycle)
+
+        last = None
+        for key in self._keys:
+            if key._fName == name:
+                if cycle == key._fCycle:
+                    return key
+                elif cycle is None and last is None:
+                    last = key
+                elif cycle is None and last._fCycle < key._fCycle:
+                    last = key
+
+        if last is not None:
+            return last
+        elif cycle is None:
+            raise _KeyError("not found: {0}\n in file: {1}".format(repr(name), self._context.sourcepath))
+        else:
+            raise _KeyError("not found: {0} with cycle {1}\n in file: {2}".format(repr(name), cycle, self._context.sourcepath))
+
+    def getmany(self, names, executor=None):
+        objectcache = self._context.objectcache
+        out = [None] * len(names)
+        indexes, keys = [], []
+        for i, name in enumerate(names):
+            name = _bytesid(name)
+            directory = self
+            if b"/" in name:
+                dirname, name = name.rsplit(b"/", 1)
+                directory = self.get(dirname)
+            if isinstance(directory, ROOTDirectory):
+                key = directory._key(name)
+                if objectcache is not None:
+                    out[i] = objectcache._get(self._objectcachekey(key), self._context.source)
+                if out[i] is None:
+                    indexes.append(i)
+                    keys.append(key)
             else:
-                raise _KeyError("not found: {0} with cycle {1}\n in file: {2}".format(repr(name), cycle, self._context.sourcepath))
+                # path into a non-directory (e.g. a TTree's branches)
+                out[i] = directory.get(name)
+
+        for i, key, obj in zip(indexes, keys, _readkeys(keys, executor)):
+            out[i] = obj
+            if objectcache is not None:
+                objectcache._put(self._objectcachekey(key), key, obj)
+        return out
 
     def close(self):
+        if self._context.objectcache is not None:
+            self._context.objectcache._release(self._context.source)
         self._context.source.close()
 
     def __contains__(self, name):
@@ -400,6 +504,48 @@ _KeyError.__module__ = "builtins" if sys.version_info[0] > 2 else None
 
 ################################################################ helper functions for common tasks
 
+def _readkeys(keys, executor=None, gapbytes=64*1024, limitbytes=16*1024**2):
+    # group keys into few large reads: sorted by position in the file, merging neighbors separated by small gaps
+    order = sorted(range(len(keys)), key=lambda i: (id(keys[i]._source.parent()), keys[i]._fSeekKey))
+    groups = []
+    for i in order:
+        key = keys[i]
+        parent = key._source.parent()
+        start, stop = key._fSeekKey, key._fSeekKey + key._fNbytes
+        if len(groups) > 0 and groups[-1][0] is parent and start - groups[-1][2] <= gapbytes and stop - groups[-1][1] <= limitbytes:
+            groups[-1][2] = max(groups[-1][2], stop)
+            groups[-1][3].append(i)
+        else:
+            groups.append([parent, start, stop, [i]])
+
+    def decompress(source):
+        if isinstance(source, uproot3.source.compressed.CompressedSource):
+            source._prepare()
+        return source
+
+    def submit(group):
+        parent, start, stop, indexes = group
+        source = Cursor(start).prefetched(parent.threadlocal(), stop - start)
+        tasks = []
+        for i in indexes:
+            keysource = keys[i]._sourcefrom(source)
+            if executor is None:
+                tasks.append((i, keysource))
+            else:
+                tasks.append((i, executor.submit(decompress, keysource)))
+        return tasks
+
+    # read and start decompressing the next group while deserializing the current one
+    out = [None] * len(keys)
+    pending = []
+    for group in groups + [None]:
+        tasks = [] if group is None else submit(group)
+        for i, task in pending:
+            out[i] = keys[i]._getfrom(task if executor is None else task.result())
+        pending = tasks
+
+    return out
+
 def _memsize(data):
     if isinstance(data, str):
         m = re.match(r"^\s*([+-]?(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?)\s*([kmgtpezy]?b)\s*$", data, re.I)
@@ -502,6 +648,9 @@ def _readobjany(source, cursor, context, parent, asclass=None):
         vers = 1
         start = cursor.index - cursor.origin
         tag = cursor.field(source, struct.Struct(">I"))
+        if numpy.int64(tag) & uproot3.const.kClassMask != 0:
+            # parse the whole object from one contiguous read
+            source = cursor.prefetched(source, cursor.origin + beg + int(numpy.int64(bcnt) & ~uproot3.const.kByteCountMask) + 4 - cursor.index)
 
     if numpy.int64(tag) & uproot3.const.kClassMask == 0:
         # reference object
@@ -740,7 +889,9 @@ def _defineclasses(streamerinfos, classes):
                     "            elif cnt is None:",
                     "                startendcheck = False",
                     "            else:",
-                    "                return Undefined.read(source, cursor, context, parent, cls.__name__)"]
+                    "                return Undefined.read(source, cursor, context, parent, cls.__name__)",
+                    "        if cnt is not None:",
+                    "            source = cursor.prefetched(source, start + cnt - cursor.index)"]
 
             fields = []
             recarray = []
@@ -1016,27 +1167,34 @@ class TKey(ROOTObject):
             cursor.index = start
             self._fNbytes, self._fVersion, self._fObjlen, self._fDatime, self._fKeylen, self._fCycle, self._fSeekKey, self._fSeekPdir = cursor.fields(source, self._format_big)
 
-        self._fClassName = cursor.string(source)
-        self._fName = cursor.string(source)
-        self._fTitle = cursor.string(source)
+        headersource = cursor.prefetched(source, start + self._fKeylen - cursor.index)
+        self._fClassName = cursor.string(headersource)
+        self._fName = cursor.string(headersource)
+        self._fTitle = cursor.string(headersource)
 
         # if source.size() is not None:
         #     if source.size() - self._fSeekKey < self._fNbytes:
         #         raise ValueError("TKey declares that object {0} has {1} bytes but only {2} remain in the file (after the key)".format(repr(self._fName), self._fNbytes, source.size() - self._fSeekKey))
 
+        self._context = context
+        self._source = self._sourcefrom(source)
+
         # object size != compressed size means it's compressed
         if self._fObjlen != self._fNbytes - self._fKeylen:
-            self._source = uproot3.source.compressed.CompressedSource(context.compression, source, Cursor(self._fSeekKey + self._fKeylen), self._fNbytes - self._fKeylen, self._fObjlen)
             self._cursor = Cursor(0, origin=-self._fKeylen)
 
         # otherwise, it's uncompressed
         else:
-            self._source = source
             self._cursor = Cursor(self._fSeekKey + self._fKeylen, origin=self._fSeekKey)
 
-        self._context = context
         return self
 
+    def _sourcefrom(self, source):
+        if self._fObjlen != self._fNbytes - self._fKeylen:
+            return uproot3.source.compressed.CompressedSource(self._context.compression, source, Cursor(self._fSeekKey + self._fKeylen), self._fNbytes - self._fKeylen, self._fObjlen)
+        else:
+            return source
+
     _format_small = struct.Struct(">ihiIhhii")
     _format_big   = struct.Struct(">ihiIhhqq")
 
@@ -1046,11 +1204,15 @@ class TKey(ROOTObject):
         Objects are not read or decompressed until this function is explicitly called.
         """
 
+        return self._getfrom(self._source, dismiss=dismiss)
+
+    def _getfrom(self, source, dismiss=True):
         try:
-            return _classof(self._context, self._fClassName).read(self._source, self._cursor.copied(), self._context, self)
+            cursor = self._cursor.copied()
+            return _classof(self._context, self._fClassName).read(cursor.prefetched(source, self._fObjlen), cursor, self._context, self)
         finally:
             if dismiss:
-                self._source.dismiss()
+                source.dismiss()
 
 def _canonicaltype(name):
     for pattern, replacement in _canonicaltype.patterns:
@@ -1379,8 +1541,36 @@ class ROOTStreamedObject(ROOTObject):
         raise ValueError("not a recarray")
 
     @classmethod
-    def _recarray_dtype(cls, cntvers=False, tobject=True):
+    def _recarray_streamed(cls):
+        # _recarray describes TObject with 16 bytes that stand in for the byte count and version of the class that
+        # contains it as well as TObject itself; as streamed, TObject is a version, fUniqueID, and fBits (10 bytes)
+        out = []
         dtypesin = cls._recarray()
+        i = 0
+        while i < len(dtypesin):
+            name = dtypesin[i][0]
+            if name == " fBits" and i + 1 < len(dtypesin) and dtypesin[i + 1][0] == " fUniqueID":
+                out.extend([(" vers", numpy.dtype(">u2")), (" fUniqueID", numpy.dtype(">u4")), (" fBits", numpy.dtype(">u4"))])
+                i += 2
+            elif name == " cnt":
+                out.append((name, numpy.dtype(">u4")))
+                i += 1
+            elif name == " vers":
+                out.append((name, numpy.dtype(">u2")))
+                i += 1
+            else:
+                out.append(dtypesin[i])
+                i += 1
+        return out
+
+    @classmethod
+    def _recarray_streamed_dtype(cls):
+        return cls._recarray_dtype(cntvers=True, tobject=True, dtypesin=cls._recarray_streamed())
+
+    @classmethod
+    def _recarray_dtype(cls, cntvers=False, tobject=True, dtypesin=None):
+        if dtypesin is None:
+            dtypesin = cls._recarray()
         dtypesout = []
         used = set()
         allhidden = True
@@ -46,6 +46,9 @@ class ChunkedSource(uproot3.source.source.Source):
     def _read(self, chunkindex):
         raise NotImplementedError
 
+    def contiguous(self, start, stop):
+        return None
+
     def close(self):
         super(ChunkedSource, self).close()
         self.cache.clear()
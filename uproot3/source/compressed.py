@@ -189,5 +189,11 @@ class CompressedSource(uproot3.source.source.Source):
         else:
             return self._uncompressed[start:stop].view(dtype)
 
+    def contiguous(self, start, stop):
+        self._prepare()
+        if stop > len(self._uncompressed):
+            return None
+        return self._uncompressed, start
+
     def dismiss(self):
         self._uncompressed = None
@@ -9,8 +9,16 @@ import string
 
 import numpy
 
+import uproot3.source.source
 from uproot3._util import _tobytes
 
+def _contiguous(source, start, stop):
+    # optional part of the Source interface: (buffer, position) or None
+    contiguous = getattr(source, "contiguous", None)
+    if contiguous is None:
+        return None
+    return contiguous(start, stop)
+
 class Cursor(object):
     # makes __doc__ attribute mutable before Python 3.3
     __metaclass__ = type.__new__(type, "type", (type,), {})
@@ -42,10 +50,21 @@ class Cursor(object):
     def skip(self, numbytes):
         self.index += numbytes
 
+    def prefetched(self, source, numbytes):
+        start = self.index
+        stop = start + numbytes
+        if numbytes <= 0 or _contiguous(source, start, stop) is not None:
+            return source
+        return uproot3.source.source.PrefetchedSource(source, start, source.data(start, stop))
+
     def fields(self, source, format):
         start = self.index
         stop = self.index = start + format.size
-        return format.unpack(source.data(start, stop))
+        contiguous = _contiguous(source, start, stop)
+        if contiguous is None:
+            return format.unpack(source.data(start, stop))
+        buffer, position = contiguous
+        return format.unpack_from(buffer, position)
 
     def field(self, source, format):
         return self.fields(source, format)[0]
@@ -63,6 +82,14 @@ class Cursor(object):
         return source.data(start, stop, dtype)
 
     def string(self, source):
+        contiguous = _contiguous(source, self.index, self.index + 1)
+        if contiguous is not None:
+            buffer, position = contiguous
+            length = int(buffer[position])
+            if length != 255 and position + 1 + length <= len(buffer):
+                self.index += 1 + length
+                return _tobytes(buffer[position + 1 : position + 1 + length])
+
         start = self.index
         stop = self.index = start + 1
         length = source.data(start, stop)[0]
@@ -74,7 +101,23 @@ class Cursor(object):
         stop = self.index = start + length
         return _tobytes(source.data(start, stop))
 
+    _cstring_window = 64
+
     def cstring(self, source):
+        contiguous = _contiguous(source, self.index, self.index)
+        if contiguous is not None:
+            buffer, position = contiguous
+            window = self._cstring_window
+            while True:
+                chunk = buffer[position : position + window]
+                nulls = numpy.flatnonzero(chunk == 0)
+                if len(nulls) > 0:
+                    self.index += int(nulls[0]) + 1
+                    return _tobytes(chunk[:nulls[0]])
+                if len(chunk) < window:
+                    break
+                window *= 4
+
         char = None
         chars = []
         while char != 0:
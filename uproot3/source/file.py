@@ -32,6 +32,9 @@ class FileSource(uproot3.source.chunked.ChunkedSource):
         out = FileSource.__new__(self.__class__)
         out.path = self.path
         out._chunkbytes = self._chunkbytes
+        out._limitbytes = self._limitbytes
+        out._parallel = self._parallel
+        out._size = self._size
         out.cache = self.cache
         out._source = None             # local file connections are *not shared* among threads (they're *not* thread-safe)
         out._setup_futures(self._parallel)
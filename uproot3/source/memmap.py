@@ -55,3 +55,9 @@ class MemmapSource(uproot3.source.source.Source):
             return self.source[start:stop]
         else:
             return self.source[start:stop].view(dtype)
+
+    def contiguous(self, start, stop):
+        source = self.source
+        if stop > len(source):
+            return None
+        return source, start
@@ -44,3 +44,55 @@ class Source(object):
             return self._source[start:stop]
         else:
             return self._source[start:stop].view(dtype)
+
+    def contiguous(self, start, stop):
+        if stop > len(self._source):
+            return None
+        return self._source, start
+
+class PrefetchedSource(Source):
+    # makes __doc__ attribute mutable before Python 3.3
+    __metaclass__ = type.__new__(type, "type", (Source.__metaclass__,), {})
+
+    def __init__(self, source, start, data):
+        assert len(data.shape) == 1 and data.dtype == numpy.uint8
+        self._fallback = source
+        self._start = start
+        self._stop = start + len(data)
+        self._source = data
+
+    @property
+    def path(self):
+        return self._fallback.path
+
+    def parent(self):
+        return self._fallback.parent()
+
+    def size(self):
+        return self._fallback.size()
+
+    def threadlocal(self):
+        return self._fallback.threadlocal()
+
+    def dismiss(self):
+        self._fallback.dismiss()
+
+    def close(self):
+        self._fallback.close()
+
+    def preload(self, starts):
+        self._fallback.preload(starts)
+
+    def data(self, start, stop, dtype=None):
+        if start < self._start or stop > self._stop:
+            return self._fallback.data(start, stop, dtype)
+
+        if dtype is None:
+            return self._source[start - self._start : stop - self._start]
+        else:
+            return self._source[start - self._start : stop - self._start].view(dtype)
+
+    def contiguous(self, start, stop):
+        if start < self._start or stop > self._stop:
+            return None
+        return self._source, start - self._start
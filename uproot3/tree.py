@@ -6,13 +6,17 @@ from __future__ import absolute_import
 
 import base64
 import codecs
+import copy
 import glob
+import hashlib
 import importlib
 import inspect
 import itertools
 import math
+import multiprocessing
 import numbers
 import os
+import pickle
 import re
 import struct
 import sys
@@ -23,6 +27,14 @@ try:
     from urlparse import urlparse
 except ImportError:
     from urllib.parse import urlparse
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
 
 import numpy
 import cachetools
@@ -30,11 +42,14 @@ import cachetools
 import awkward0
 import uproot3_methods.profiles
 
+import uproot3.pipeline
 import uproot3.rootio
 from uproot3.rootio import _bytesid
 from uproot3.rootio import _memsize
 from uproot3.rootio import nofilter
 from uproot3.rootio import _safename
+from uproot3.cache import ThreadSafeArrayCache
+from uproot3.cache import MemoryBudget
 from uproot3.interp.auto import interpret
 from uproot3.interp.numerical import asdtype
 from uproot3.interp.jagged import asjagged
@@ -94,6 +109,126 @@ def _normalize_awkwardlib(awkwardlib):
     else:
         return awkwardlib
 
+def _normalize_budget(memory_budget):
+    if memory_budget is None or isinstance(memory_budget, MemoryBudget):
+        return memory_budget
+    else:
+        return MemoryBudget(memory_budget)
+
+class _BudgetKeyCache(ThreadSafeArrayCache):
+    # the keycache iterate makes for a memory_budget: a key table larger than the whole cache is read again when needed, not an error
+    def __setitem__(self, where, what):
+        if self.getsizeof(what) <= self._cache.maxsize:
+            super(_BudgetKeyCache, self).__setitem__(where, what)
+
+class _BudgetedStep(object):
+    # an iterate step holds its bytes of a MemoryBudget until its arrays are made and it has been yielded
+    def __init__(self, wait, budget, numbytes):
+        self._wait, self._budget, self._numbytes = wait, budget, numbytes
+        self._done = self._yielded = self.released = False
+
+    def __call__(self):
+        if not self._done:
+            self._result = self._wait()
+            self._wait = None
+            self._done = True
+            self._release()
+        return self._result
+
+    def yielded(self):
+        self._yielded = True
+        self._release()
+
+    def _release(self):
+        if self._done and self._yielded and not self.released:
+            self._budget.release(self._numbytes)
+            self.released = True
+
+class _Prefetched(object):
+    # an iterate step read in a background thread, after the step read ahead before it, while an earlier step is being used
+    def __init__(self, make, previous):
+        self._make, self._previous = make, previous
+        self._done = threading.Event()
+        self._result = self._excinfo = None
+        thread = threading.Thread(target=self._run)
+        thread.daemon = True
+        thread.start()
+
+    def _run(self):
+        try:
+            if self._previous is not None:
+                self._previous._done.wait()
+            self._result = self._make()
+        except Exception:
+            self._excinfo = sys.exc_info()
+        finally:
+            self._make = self._previous = None
+            self._done.set()
+
+    def __call__(self):
+        self._done.wait()
+        _delayedraise(self._excinfo)
+        return self._result
+
+def _asyncio():
+    if sys.version_info < (3, 5):
+        raise ImportError("asynchronous reading (array_async, arrays_async, aiterate) requires Python 3.5 or later")
+    import uproot3._connect._asyncio
+    return uproot3._connect._asyncio
+
+class _Producer(object):
+    # runs a generator in a background thread, handing over its items in order through a bounded queue
+    _end = object()
+
+    def __init__(self, generator, maxsize):
+        self._generator = generator
+        self._queue = queue.Queue(maxsize)
+        self._stopped = threading.Event()
+        thread = threading.Thread(target=self._run)
+        thread.daemon = True
+        thread.start()
+
+    def _run(self):
+        try:
+            for item in self._generator:
+                if not self._put((item, None)):
+                    return
+        except Exception:
+            self._put((None, sys.exc_info()))
+        else:
+            self._put(self._end)
+        finally:
+            self._generator.close()
+
+    def _put(self, item):
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def __iter__(self):
+        while True:
+            item = self._queue.get()
+            if item is self._end:
+                break
+            item, excinfo = item
+            _delayedraise(excinfo)
+            yield item
+
+    def stop(self):
+        self._stopped.set()
+
+def _output(outputs, branch):
+    if outputs is None:
+        return None
+    elif branch.name in outputs:
+        return outputs[branch.name]
+    else:
+        return outputs.get(branch.name.decode("utf-8", "replace"), None)
+
 def _normalize_entrystartstop(numentries, entrystart, entrystop):
     if entrystart is None:
         entrystart = 0
@@ -112,69 +247,606 @@ def _normalize_entrystartstop(numentries, entrystart, entrystop):
 
     return int(entrystart), int(entrystop)
 
+def _readcoalesced(source, positions, width, gapbytes=4096):
+    # read width bytes at each position, as a (len(positions), width) array, coalescing nearby positions into single reads
+    out = numpy.empty((len(positions), width), dtype=numpy.uint8)
+    if len(positions) == 0:
+        return out
+    offsets = numpy.arange(width)
+
+    order = numpy.argsort(positions, kind="mergesort")
+    sortedpos = positions[order]
+    breaks = numpy.nonzero(sortedpos[1:] - (sortedpos[:-1] + width) > gapbytes)[0] + 1
+    for group in numpy.split(numpy.arange(len(sortedpos)), breaks):
+        start, stop = int(sortedpos[group[0]]), int(sortedpos[group[-1]]) + width
+        data = source.data(start, stop)
+        out[order[group]] = data[(sortedpos[group] - start)[:, numpy.newaxis] + offsets]
+    return out
+
+def _normalize_entries(numentries, entries):
+    entries = numpy.asarray(entries)
+    if entries.dtype == numpy.bool_:
+        if entries.shape != (numentries,):
+            raise ValueError("boolean entries must have one value per entry ({0})".format(numentries))
+        entries = numpy.nonzero(entries)[0]
+    if len(entries.shape) != 1 or not (len(entries) == 0 or issubclass(entries.dtype.type, numpy.integer)):
+        raise TypeError("entries must be a one-dimensional array of entry numbers or a boolean mask")
+    entries = entries.astype(numpy.int64)
+    if numpy.any(entries[1:] < entries[:-1]):
+        raise ValueError("entries must be sorted in increasing order")
+    if len(entries) > 0 and (entries[0] < 0 or entries[-1] >= numentries):
+        raise IndexError("entries must be in the range [0, {0})".format(numentries))
+    return entries
+
+def _selectrows(array, mask, interpretation):
+    out = array[mask]
+    if isinstance(interpretation, asjagged):
+        out = out.compact()
+    return out
+
+class _CutArrays(object):
+    # branches referred to by a cut, read on first use for one range of entries
+    def __init__(self, tree, entrystart, entrystop, awkward0, cache, basketcache, keycache, executor):
+        self._tree, self._entrystart, self._entrystop = tree, entrystart, entrystop
+        self._awkward0, self._cache, self._basketcache, self._keycache, self._executor = awkward0, cache, basketcache, keycache, executor
+        self._safenames = None
+        self.loaded = {}
+
+    def _branch(self, name):
+        try:
+            return self._tree.get(_bytesid(name))
+        except (KeyError, UnicodeEncodeError):
+            pass
+        if self._safenames is None:
+            self._safenames = dict((_safename(branch.name), branch) for branch in self._tree.allvalues())
+        return self._safenames[name]
+
+    def __getitem__(self, name):
+        branch = self._branch(name)
+        if branch.name not in self.loaded:
+            interpretation = branch._normalize_interpretation(None, self._awkward0)
+            if interpretation is None:
+                raise ValueError("cannot interpret branch {0} as a Python type\n   in file: {1}".format(repr(branch.name), branch._context.sourcepath))
+            array = branch.array(interpretation=interpretation, entrystart=self._entrystart, entrystop=self._entrystop, awkwardlib=self._awkward0, cache=self._cache, basketcache=self._basketcache, keycache=self._keycache, executor=self._executor)
+            self.loaded[branch.name] = (interpretation, array)
+        return self.loaded[branch.name][1]
+
+    def __contains__(self, name):
+        try:
+            self._branch(name)
+        except KeyError:
+            return False
+        else:
+            return True
+
+_scheduling = threading.local()
+
+def _runscheduled(fcn):
+    # calls fcn() and returns its result with the _BasketSchedulers that it ran in this thread, so that they can be awaited
+    _scheduling.started = started = []
+    try:
+        return fcn(), started
+    finally:
+        _scheduling.started = None
+
+def _arrayasync(array, executor):
+    # array(executor) returns a function that waits for the output; with a _BasketScheduler, asyncio can await its baskets
+    def start():
+        if executor is None or not hasattr(executor, "submit"):
+            return array(executor)
+        scheduler = _BasketScheduler(executor)
+        wait = array(scheduler)
+        scheduler.run()
+        return wait
+    return _asyncio().read(start)
+
+class _BasketScheduler(object):
+    # collects the basket-filling tasks of several branches and runs them on one executor: in file order for
+    # near-sequential I/O, largest (uncompressed) first within each window of tasks, with a bounded number in flight
+    def __init__(self, executor, maxinflight=None):
+        self._pipelined = isinstance(executor, uproot3.pipeline.Pipeline)
+        self._processes = _isprocesspool(executor)
+        if maxinflight is None:
+            if self._pipelined:
+                maxinflight = executor.maxinflight
+            else:
+                maxinflight = 2 * (getattr(executor, "_max_workers", None) or multiprocessing.cpu_count())
+        self._executor = executor
+        self._maxinflight = max(1, maxinflight)
+        self._tasks = []
+        self._queue = None
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._alldone = False
+        self._whendone = []
+
+    class _Task(object):
+        def __init__(self, fill, j, seek, size, fetch, decompress, remote, receive):
+            self.fill, self.j, self.seek, self.size, self._fetch, self._decompress = fill, j, seek, size, fetch, decompress
+            self._remote, self._receive = remote, receive
+            self.done = threading.Event()
+            self.result = None
+            self.failed = False
+            self.future = None
+            self.discarded = False
+
+        def run(self):
+            try:
+                self.result = self.fill(self.j)
+            except Exception:
+                self.result = sys.exc_info()
+            finally:
+                self.done.set()
+
+        # the same work in three stages (for a Pipeline); a failure in any stage is reported like an exception in fill
+        def fetch(self):
+            try:
+                return self._fetch(self.j)
+            except Exception:
+                self.result, self.failed = sys.exc_info(), True
+
+        def decompress(self, fetched):
+            if not self.failed:
+                try:
+                    return self._decompress(self.j, fetched)
+                except Exception:
+                    self.result, self.failed = sys.exc_info(), True
+
+        def interpret(self, basketdata):
+            try:
+                if not self.failed:
+                    self.result = self.fill(self.j, basketdata)
+            except Exception:
+                self.result = sys.exc_info()
+            finally:
+                self.done.set()
+
+        # the same work in another process (for a ProcessPoolExecutor): the pool's management thread only records
+        # the finished future; its result is received (and filled in) by the thread that collects results
+        def received(self, future):
+            self.future = future
+            self.done.set()
+            if self.discarded:
+                self.discard()
+
+        def collect(self):
+            future, self.future = self.future, None
+            if future is not None:
+                try:
+                    self.result = self._receive(self.j, future.result())
+                except Exception:
+                    self.result = sys.exc_info()
+            return self.result
+
+        def discard(self):
+            # results that will never be collected still have to give back their shared memory
+            self.discarded = True
+            future, self.future = self.future, None
+            if future is not None and future.exception() is None:
+                _releaseshared(future.result())
+
+    @staticmethod
+    def _results(tasks):
+        try:
+            for task in tasks:
+                task.done.wait()
+                yield task.collect()
+        finally:
+            for task in tasks:
+                task.discard()
+
+    def map(self, fill, seeks, sizes, fetch=None, decompress=None, remote=None, receive=None):
+        tasks = [self._Task(fill, j, int(seek), int(size), fetch, decompress, remote, receive) for j, (seek, size) in enumerate(zip(seeks, sizes))]
+        self._tasks.extend(tasks)
+        return self._results(tasks)
+
+    def run(self):
+        tasks = sorted(self._tasks, key=lambda task: task.seek)
+        self._tasks = []
+        ordered = []
+        for i in range(0, len(tasks), self._maxinflight):
+            ordered.extend(sorted(tasks[i : i + self._maxinflight], key=lambda task: -task.size))
+        with self._lock:
+            self._queue = ordered[::-1]
+            self._inflight = 0
+            self._alldone = False
+        started = getattr(_scheduling, "started", None)
+        if started is not None:
+            started.append(self)
+
+        if len(ordered) == 0:
+            self._finished(None, 0)
+        elif len(ordered) <= self._maxinflight:
+            self._feed()
+        else:
+            # the rest are submitted as earlier ones finish, by a loop in another thread: never from a done-callback,
+            # which runs immediately (one stack frame deeper each time) if the executor hands back finished futures
+            thread = threading.Thread(target=self._feed)
+            thread.daemon = True
+            thread.start()
+
+    def _feed(self):
+        while True:
+            with self._ready:
+                while len(self._queue) > 0 and self._inflight >= self._maxinflight:
+                    self._ready.wait()
+                if len(self._queue) == 0:
+                    return
+                task = self._queue.pop()
+                self._inflight += 1
+
+            try:
+                submitted = self._submit(task)
+            except Exception:
+                task.result = sys.exc_info()
+                task.done.set()
+                submitted = False
+            if not submitted:
+                self._finished()
+
+    def _finished(self, future=None, count=1):
+        with self._ready:
+            self._inflight -= count
+            self._ready.notify()
+            if self._alldone or len(self._queue) > 0 or self._inflight > 0:
+                return
+            self._alldone = True
+            callbacks, self._whendone = self._whendone, []
+        for callback in callbacks:
+            callback()
+
+    def whendone(self, callback):
+        # calls callback() (in some thread) when all tasks of the last run are done, or now if they already are
+        with self._lock:
+            if not self._alldone:
+                self._whendone.append(callback)
+                return
+        callback()
+
+    def cancel(self):
+        # tasks that have not been submitted yet are dropped; those in flight finish
+        with self._ready:
+            queue, self._queue = self._queue or [], []
+            for task in queue:
+                task.result = (RuntimeError, RuntimeError("reading was cancelled"), None)
+                task.done.set()
+        self._finished(None, 0)
+
+    def _submit(self, task):
+        # returns True if the task's future calls _finished when it's done, False if the task has already been handled
+        if self._processes:
+            # closures can't be sent to another process: tasks without a picklable part are run here
+            try:
+                remote = None if task._remote is None else task._remote(task.j)
+            except Exception:
+                task.result = sys.exc_info()
+                task.done.set()
+                return False
+            if remote is None:
+                task.run()
+                return False
+            future = self._executor.submit(remote)
+            future.add_done_callback(task.received)
+        elif self._pipelined and task._fetch is not None:
+            future = self._executor.submit_stages(task.fetch, task.decompress, task.interpret)
+        else:
+            future = self._executor.submit(task.run)
+        future.add_done_callback(self._finished)
+        return True
+
+def _numitems(interpretation, numbytes, numentries):
+    # numbers of items for arrays of basket sizes; falls back to one call per basket if the interpretation only handles scalars
+    try:
+        out = interpretation.numitems(numbytes, numentries)
+    except Exception:
+        out = None
+    if not isinstance(out, numpy.ndarray) or out.shape != numbytes.shape:
+        out = numpy.array([interpretation.numitems(int(x), int(y)) for x, y in zip(numbytes, numentries)], dtype=numpy.int64)
+    return out.astype(numpy.int64, copy=False)
+
+def _isprocesspool(executor):
+    try:
+        import concurrent.futures
+    except ImportError:
+        return False
+    return isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+
+def _remoteinterpretation(interpretation):
+    # fromroot never uses the Python class of objects (only finalize does, in this process), so it's dropped before pickling;
+    # None for interpretations with a generator (asgenobj, asstlvector, asstlmap): their objects are made in this process
+    # when they're accessed, and all a worker could do for them is decompress bytes, which is not worth sending them back
+    if isinstance(interpretation, uproot3.interp.objects.asstring):
+        return interpretation.content
+    elif isinstance(interpretation, uproot3.interp.objects._variable):
+        return None
+    elif isinstance(interpretation, asobj):
+        interpretation = copy.copy(interpretation)
+        interpretation.cls = None
+    elif isinstance(interpretation, asjagged):
+        content = _remoteinterpretation(interpretation.content)
+        if content is None:
+            return None
+        interpretation = copy.copy(interpretation)
+        interpretation.content = content
+    return interpretation
+
+def _frombasketdata(interpretation, basketdata, fObjlen, fKeylen, fLast, border, local_entrystart, local_entrystop, byteoffsets=None):
+    if fObjlen == border:
+        data = basketdata
+    else:
+        data = basketdata[:border]
+        byteoffsets = numpy.empty((fObjlen - border - 4) // 4, dtype=numpy.int32)   # native endian
+        byteoffsets[:-1] = basketdata[border + 4 : -4].view(">i4")                  # read as big-endian and convert
+        byteoffsets[-1] = fLast
+        numpy.subtract(byteoffsets, fKeylen, byteoffsets)
+    return interpretation.fromroot(data, byteoffsets, local_entrystart, local_entrystop, fKeylen)
+
+def _decompressbasketdata(compression, fetched, fNbytes, fObjlen, fKeylen, seek, compressed):
+    if compressed:
+        return uproot3.source.compressed.CompressedSource(compression, fetched, Cursor(seek + fKeylen), fNbytes - fKeylen, fObjlen).data(0, fObjlen)
+    else:
+        return Cursor(seek + fKeylen).bytes(fetched, fObjlen)
+
+class _ProcessBasket(object):
+    # reads, decompresses, and interprets one basket in a worker process; it carries the basket's position and sizes
+    # and the file's source factory, so the worker only has to open the source, not find the tree and branch
+    _sources = OrderedDict()
+    _maxsources = 8
+
+    def __init__(self, sourcefactory, path, fileid, compression, key, interpretation, local_entrystart, local_entrystop, keepdata):
+        self.sourcefactory, self.path, self.fileid, self.compression, self.key, self.interpretation = sourcefactory, path, fileid, compression, key, interpretation
+        self.local_entrystart, self.local_entrystop, self.keepdata = local_entrystart, local_entrystop, keepdata
+
+    def _source(self):
+        # a source is reused only for the same version of the same file (fUUID and fEND); older versions and the least recently used are closed
+        sources = _ProcessBasket._sources
+        cachekey = (self.path, self.fileid)
+        source = sources.pop(cachekey, None)
+        if source is None:
+            for other in [x for x in sources if x[0] == self.path]:
+                sources.pop(other).close()
+            while len(sources) >= self._maxsources:
+                sources.popitem(last=False)[1].close()
+            source = self.sourcefactory(self.path)
+        sources[cachekey] = source
+        return source
+
+    def __call__(self):
+        source = self._source()
+        fNbytes, fObjlen, fKeylen, fLast, seek, compressed, border = self.key
+        fetched = Cursor(seek + fKeylen).prefetched(source, fNbytes - fKeylen)
+        basketdata = _decompressbasketdata(self.compression, fetched, fNbytes, fObjlen, fKeylen, seek, compressed)
+        out = _frombasketdata(self.interpretation, basketdata, fObjlen, fKeylen, fLast, border, self.local_entrystart, self.local_entrystop)
+        return _toshared((basketdata if self.keepdata else None, out))
+
+def _picklable(obj):
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    else:
+        return True
+
+def _toshared(obj):
+    # numpy arrays in obj (also inside tuples and JaggedArrays) are copied into one block of shared memory, so that only their layout is pickled
+    arrays = []
+    layout = _sharedlayout(obj, arrays)
+    if shared_memory is None or len(arrays) == 0:
+        return None, obj
+    block = shared_memory.SharedMemory(create=True, size=sum(_sharedalign(x.nbytes) for x in arrays))
+    try:
+        offset = 0
+        for x in arrays:
+            numpy.ndarray(x.shape, x.dtype, buffer=block.buf, offset=offset)[...] = x
+            offset += _sharedalign(x.nbytes)
+    finally:
+        block.close()
+    # the receiving process unlinks the block, so this one must not try to clean it up when it exits
+    if getattr(block, "_track", True):
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(block._name, "shared_memory")
+        except Exception:
+            pass
+    return block.name, layout
+
+def _withshared(shared, fcn):
+    # calls fcn on the object with its arrays as views of the shared memory, which is released afterward: fcn must copy what it keeps
+    name, layout = shared
+    if name is None:
+        return fcn(layout)
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return fcn(_sharedrebuild(layout, block.buf, [0]))
+    finally:
+        try:
+            block.close()
+        except BufferError:
+            pass    # a view outlived fcn (e.g. in a traceback): the mapping stays until it's gone, but the name is released now
+        block.unlink()
+
+def _releaseshared(shared):
+    name, layout = shared
+    if name is not None:
+        try:
+            block = shared_memory.SharedMemory(name=name)
+            block.close()
+            block.unlink()
+        except (IOError, OSError):
+            pass    # already released
+
+def _sharedalign(numbytes):
+    return (numbytes + 15) // 16 * 16
+
+def _sharedlayout(obj, arrays):
+    if isinstance(obj, numpy.ndarray) and obj.dtype != numpy.dtype(object) and obj.nbytes > 0:
+        arrays.append(obj)
+        return ("array", obj.dtype, obj.shape)
+    elif type(obj) is tuple:
+        return ("tuple",) + tuple(_sharedlayout(x, arrays) for x in obj)
+    elif type(obj) is awkward0.JaggedArray:
+        return ("jagged", _sharedlayout(obj.starts, arrays), _sharedlayout(obj.stops, arrays), _sharedlayout(obj.content, arrays), _sharedlayout(getattr(obj, "byteoffsets", None), arrays))
+    else:
+        return ("object", obj)
+
+def _sharedrebuild(layout, buf, offset):
+    if layout[0] == "array":
+        out = numpy.ndarray(layout[2], layout[1], buffer=buf, offset=offset[0])
+        offset[0] += _sharedalign(out.nbytes)
+        return out
+    elif layout[0] == "tuple":
+        return tuple(_sharedrebuild(x, buf, offset) for x in layout[1:])
+    elif layout[0] == "jagged":
+        starts, stops, content, byteoffsets = [_sharedrebuild(x, buf, offset) for x in layout[1:]]
+        out = awkward0.JaggedArray(starts, stops, content)
+        if byteoffsets is not None:
+            out.byteoffsets = byteoffsets
+        return out
+    else:
+        return layout[1]
+
 ################################################################ high-level interface
 
-def iterate(path, treepath, branches=None, entrysteps=float("inf"), outputtype=dict, namedecode=None, reportpath=False, reportfile=False, reportentries=False, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+def iterate(path, treepath, branches=None, entrysteps=float("inf"), outputtype=dict, namedecode=None, reportpath=False, reportfile=False, reportentries=False, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, outputs=None, memory_budget=None, prefetch=0, openahead=0, parallelfiles=1, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
     awkward0 = _normalize_awkwardlib(awkwardlib)
-    for tree, branchesinterp, globalentrystart, thispath, thisfile in _iterate(path, treepath, branches, awkward0, localsource, xrootdsource, httpsource, **options):
-        for start, stop, arrays in tree.iterate(branches=branchesinterp, entrysteps=entrysteps, outputtype=outputtype, namedecode=namedecode, reportentries=True, entrystart=0, entrystop=tree.numentries, flatten=flatten, flatname=flatname, awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking):
-
-            if getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame":
-                if type(arrays.index).__name__ == "MultiIndex":
-                    if hasattr(arrays.index.levels[0], "array"):
-                        index = arrays.index.levels[0].array   # pandas>=0.24.0
-                    else:
-                        index = arrays.index.levels[0].values  # pandas<0.24.0
-                    awkward0.numpy.add(index, globalentrystart, out=index)
+    memory_budget = _normalize_budget(memory_budget)
+    if openahead < 0:
+        raise ValueError("openahead must be a non-negative number of files")
+    if parallelfiles < 1:
+        raise ValueError("parallelfiles must be a positive number of files")
+    if parallelfiles > 1 and outputs is not None:
+        raise ValueError("parallelfiles and outputs cannot be used together")
+
+    files = _iterate(path, treepath, branches, awkward0, localsource, xrootdsource, httpsource, openahead=openahead, **options)
+    if parallelfiles == 1:
+        for tree, branchesinterp, globalentrystart, thispath, thisfile in files:
+            for out in _iteratefile(tree, branchesinterp, globalentrystart, thispath, thisfile, entrysteps, outputtype, namedecode, reportpath, reportfile, reportentries, flatten, flatname, awkward0, cache, basketcache, keycache, executor, blocking, blocking, outputs, memory_budget, prefetch):
+                yield out
 
-                elif type(arrays.index).__name__ == "RangeIndex":
-                    if hasattr(arrays.index, "start") and hasattr(arrays.index, "stop"):
-                        indexstart = arrays.index.start        # pandas>=0.25.0
-                        indexstop = arrays.index.stop
-                    else:
-                        indexstart = arrays.index._start       # pandas<0.25.0
-                        indexstop = arrays.index._stop
-                    arrays.index = type(arrays.index)(indexstart + globalentrystart, indexstop + globalentrystart)
+    else:
+        # each file is read in a background thread, up to parallelfiles at a time, and its steps are handed over in order
+        readers = []
+        try:
+            while True:
+                while len(readers) < parallelfiles:
+                    loaded = next(files, None)
+                    if loaded is None:
+                        break
+                    tree, branchesinterp, globalentrystart, thispath, thisfile = loaded
+                    readers.append(_Producer(_iteratefile(tree, branchesinterp, globalentrystart, thispath, thisfile, entrysteps, outputtype, namedecode, reportpath, reportfile, reportentries, flatten, flatname, awkward0, cache, basketcache, keycache, executor, True, blocking, outputs, memory_budget, prefetch), prefetch + 1))
+                if len(readers) == 0:
+                    break
+                for out in readers[0]:
+                    yield out
+                readers.pop(0)
+        finally:
+            for reader in readers:
+                reader.stop()
+
+def _iteratefile(tree, branchesinterp, globalentrystart, thispath, thisfile, entrysteps, outputtype, namedecode, reportpath, reportfile, reportentries, flatten, flatname, awkward0, cache, basketcache, keycache, executor, readblocking, blocking, outputs, memory_budget, prefetch):
+    for start, stop, arrays in tree.iterate(branches=branchesinterp, entrysteps=entrysteps, outputtype=outputtype, namedecode=namedecode, reportentries=True, entrystart=0, entrystop=tree.numentries, flatten=flatten, flatname=flatname, awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=readblocking, outputs=outputs, memory_budget=memory_budget, prefetch=prefetch):
+
+        if getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame":
+            if type(arrays.index).__name__ == "MultiIndex":
+                if hasattr(arrays.index.levels[0], "array"):
+                    index = arrays.index.levels[0].array   # pandas>=0.24.0
+                else:
+                    index = arrays.index.levels[0].values  # pandas<0.24.0
+                awkward0.numpy.add(index, globalentrystart, out=index)
 
+            elif type(arrays.index).__name__ == "RangeIndex":
+                if hasattr(arrays.index, "start") and hasattr(arrays.index, "stop"):
+                    indexstart = arrays.index.start        # pandas>=0.25.0
+                    indexstop = arrays.index.stop
                 else:
-                    if hasattr(arrays.index, "array"):
-                        index = arrays.index.array             # pandas>=0.24.0
-                    else:
-                        index = arrays.index.values            # pandas<0.24.0
-                    awkward0.numpy.add(index, globalentrystart, out=index)
+                    indexstart = arrays.index._start       # pandas<0.25.0
+                    indexstop = arrays.index._stop
+                arrays.index = type(arrays.index)(indexstart + globalentrystart, indexstop + globalentrystart)
 
-            out = (arrays,)
-            if reportentries:
-                out = (globalentrystart + start, globalentrystart + stop) + out
-            if reportfile:
-                out = (thisfile,) + out
-            if reportpath:
-                out = (thispath,) + out
-            if len(out) == 1:
-                yield out[0]
             else:
-                yield out
+                if hasattr(arrays.index, "array"):
+                    index = arrays.index.array             # pandas>=0.24.0
+                else:
+                    index = arrays.index.values            # pandas<0.24.0
+                awkward0.numpy.add(index, globalentrystart, out=index)
+
+        if readblocking and not blocking:
+            arrays = (lambda arrays: lambda: arrays)(arrays)
+
+        out = (arrays,)
+        if reportentries:
+            out = (globalentrystart + start, globalentrystart + stop) + out
+        if reportfile:
+            out = (thisfile,) + out
+        if reportpath:
+            out = (thispath,) + out
+        if len(out) == 1:
+            yield out[0]
+        else:
+            yield out
 
-def _iterate(path, treepath, branches, awkward0, localsource, xrootdsource, httpsource, **options):
+def _iterate(path, treepath, branches, awkward0, localsource, xrootdsource, httpsource, openahead=0, **options):
     if isinstance(path, string_types):
         paths = _filename_explode(path)
     else:
         paths = [y for x in path for y in _filename_explode(x)]
 
-    globalentrystart = 0
-    for path in paths:
+    # files with the same schema get the same branches and interpretations, which are only worked out once
+    plans = {}
+
+    def load(path):
         file = uproot3.rootio.open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
         try:
             tree = file[treepath]
         except KeyError:
+            return None
+        schema = _schemakey(tree)
+        branchesinterp = plans.get(schema, None)
+        if branchesinterp is None:
+            branchesinterp = OrderedDict()
+            for branch, interpretation in tree._normalize_branches(branches, awkward0):
+                branchesinterp[branch.name] = interpretation
+            plans[schema] = branchesinterp
+        return tree, branchesinterp, path, file
+
+    def opener(path):
+        return lambda: load(path)
+
+    paths = iter(paths)
+    opening = []       # files that are being opened, in order; all but the first in the background
+    previous = None
+    globalentrystart = 0
+    while True:
+        while len(opening) <= openahead:
+            path = next(paths, None)
+            if path is None:
+                break
+            if len(opening) == 0:
+                opening.append(opener(path))
+            else:
+                opening.append(_Prefetched(opener(path), previous))
+                previous = opening[-1]
+        if len(opening) == 0:
+            break
+
+        loaded = opening.pop(0)()
+        if loaded is None:
             continue
-        branchesinterp = OrderedDict()
-        for branch, interpretation in tree._normalize_branches(branches, awkward0):
-            branchesinterp[branch.name] = interpretation
+        tree, branchesinterp, path, file = loaded
 
         yield tree, branchesinterp, globalentrystart, path, file
         globalentrystart += tree.numentries
 
+def _schemakey(tree):
+    # class versions and the types and layout of branches and leaves: everything that interpretations are derived from
+    streamers = tuple(sorted((x._fName, x._fClassVersion, x._fCheckSum) for x in tree._context.streamerinfos))
+    branches = []
+    for branch in tree.allvalues():
+        leaves = tuple((type(leaf).__name__, leaf._fName, leaf._fTitle, getattr(leaf, "_fLen", None), getattr(leaf, "_fLenType", None), getattr(leaf, "_fIsUnsigned", None), getattr(getattr(leaf, "_fLeafCount", None), "_fName", None)) for leaf in branch._fLeaves)
+        branches.append((branch.name, type(branch).__name__, getattr(branch, "_fClassName", None), branch._fTitle, getattr(branch, "_fType", None), getattr(branch, "_fStreamerType", None), getattr(branch, "_fEntryOffsetLen", None), leaves))
+    return (streamers, tuple(branches), tuple(sorted(tree.aliases.items())))
+
 ################################################################ methods for TTree
 
 class TTreeMethods(object):
@@ -440,14 +1112,7 @@ class TTreeMethods(object):
 
         relevant_numbytes = 0.0
         for branch, interpretation in branches:
-            if branch._recoveredbaskets is None:
-                branch._tryrecover()
-            for i, key in enumerate(branch._threadsafe_iterate_keys(keycache, False)):
-                start, stop = branch._entryoffsets[i], branch._entryoffsets[i + 1]
-                if entrystart < stop and start < entrystop:
-                    this_numbytes = key._fObjlen * (min(stop, entrystop) - max(start, entrystart)) / float(stop - start)
-                    assert this_numbytes >= 0.0
-                    relevant_numbytes += this_numbytes
+            relevant_numbytes += branch._relevant_numbytes(entrystart, entrystop, keycache)
 
         entrysteps = max(1, int(round(math.ceil((entrystop - entrystart) * numbytes / relevant_numbytes))))
 
@@ -462,65 +1127,55 @@ class TTreeMethods(object):
         awkward0 = _normalize_awkwardlib(None)
         branches = list(self._normalize_branches(branches, awkward0))
 
-        # convenience class; simplifies presentation of the algorithm
-        class BranchCursor(object):
-            def __init__(self, branch):
-                self.branch = branch
-                self.basketstart = 0
-                self.basketstop = 0
-            @property
-            def entrystart(self):
-                return self.branch.basket_entrystart(self.basketstart)
-            @property
-            def entrystop(self):
-                return self.branch.basket_entrystop(self.basketstop)
-
-        cursors = [BranchCursor(branch) for branch, interpretation in branches if branch.numbaskets > 0]
-
-        if len(cursors) == 0:
+        offsets = [branch._entryoffsets for branch, interpretation in branches if branch.numbaskets > 0]
+
+        if len(offsets) == 0:
             yield _normalize_entrystartstop(self.numentries, entrystart, entrystop)
 
         else:
-            # everybody starts at the same entry number; if there is no such place before someone runs out of baskets, there will be an exception
-            leadingstart = max(cursor.entrystart for cursor in cursors)
-            while not all(cursor.entrystart == leadingstart for cursor in cursors):
-                for cursor in cursors:
-                    while cursor.entrystart < leadingstart:
-                        cursor.basketstart += 1
-                        cursor.basketstop += 1
-                leadingstart = max(cursor.entrystart for cursor in cursors)
+            # a cluster boundary is an entry number at which every branch starts a basket (from fBasketEntry; no keys are read)
+            boundaries = offsets[0]
+            for x in offsets[1:]:
+                boundaries = numpy.intersect1d(boundaries, x)
+            starts, stops = boundaries[:-1], boundaries[1:]
 
+            # check to see if they're within the bounds the user requested (strictly or not strictly)
             entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+            if strict:
+                good = (entrystart <= starts) & (stops <= entrystop)
+            else:
+                good = (entrystart < stops) & (starts < entrystop)
 
-            # move all cursors forward, yielding a (start, stop) pair if their baskets line up
-            while any(cursor.basketstop < cursor.branch.numbaskets for cursor in cursors):
-                # move all subleading baskets forward until they are no longer subleading
-                leadingstop = max(cursor.entrystop for cursor in cursors)
-                for cursor in cursors:
-                    while cursor.entrystop < leadingstop:
-                        cursor.basketstop += 1
-
-                # if they all line up, this is a good cluster
-                if all(cursor.entrystop == leadingstop for cursor in cursors):
-                    # check to see if it's within the bounds the user requested (strictly or not strictly)
-                    if strict:
-                        if entrystart <= leadingstart and leadingstop <= entrystop:
-                            yield leadingstart, leadingstop
-                    else:
-                        if entrystart < leadingstop and leadingstart < entrystop:
-                            yield leadingstart, leadingstop
+            for start, stop in zip(starts[good].tolist(), stops[good].tolist()):
+                yield start, stop
+
+    def _bytepartitions(self, numbytes, branches, keycache):
+        # whole clusters, gathered until each partition has at least numbytes of the branches (a small remainder joins the last)
+        awkward0 = _normalize_awkwardlib(None)
+        branches = list(self._normalize_branches(branches, awkward0))
+        clusters = [(start, stop) for start, stop in self.clusters([branch.name for branch, interpretation in branches]) if start < stop]
+        if len(clusters) == 0:
+            return []
 
-                    # anyway, move all the starts to the new stopping position and move all stops forward by one
-                    leadingstart = leadingstop
-                    for cursor in cursors:
-                        cursor.basketstart = cursor.basketstop
-                        cursor.basketstop += 1
+        boundaries = numpy.array([start for start, stop in clusters] + [clusters[-1][1]], dtype=numpy.int64)
+        cumulative = numpy.zeros(len(boundaries), dtype=numpy.float64)
+        for branch, interpretation in branches:
+            cumulative += branch._cumulative_numbytes(boundaries, keycache)
 
-                # stop iterating if we're past all acceptable clusters
-                if leadingstart >= entrystop:
-                    break
+        out = []
+        first = 0
+        for i in range(1, len(boundaries)):
+            if cumulative[i] - cumulative[first] >= numbytes:
+                out.append((int(boundaries[first]), int(boundaries[i])))
+                first = i
+        if first < len(boundaries) - 1:
+            if len(out) > 0 and cumulative[-1] - cumulative[first] < numbytes / 2.0:
+                out[-1] = (out[-1][0], int(boundaries[-1]))
+            else:
+                out.append((int(boundaries[first]), int(boundaries[-1])))
+        return out
 
-    def array(self, branch, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def array(self, branch, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, entries=None, out=None):
         awkward0 = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branch, awkward0))
         if len(branches) == 1:
@@ -530,9 +1185,9 @@ class TTreeMethods(object):
                 tbranch, _ = branches[0]
         else:
             raise ValueError("list of branch names or glob/regex matches more than one branch; use TTree.arrays (plural)")
-        return tbranch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking)
+        return tbranch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=blocking, entries=entries, out=out)
 
-    def arrays(self, branches=None, outputtype=dict, namedecode=None, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, recursive=True):
+    def arrays(self, branches=None, outputtype=dict, namedecode=None, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, recursive=True, entries=None, cut=None, outputs=None):
         awkward0 = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branches, awkward0))
         for branch, interpretation in branches:
@@ -542,9 +1197,44 @@ class TTreeMethods(object):
             branches = [(branch, interpretation) for branch, interpretation in branches if not isinstance(interpretation, asjagged)]
             flatten = False
 
+        # one keycache for all branches, so that they share key tables and offsets made from counter branches
+        if keycache is None:
+            keycache = {}
+
         # for the case of outputtype == pandas.DataFrame, do some preparation to fill DataFrames efficiently
         ispandas = getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame"
-        entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+        if entries is not None:
+            if entrystart is not None or entrystop is not None:
+                raise ValueError("entries and entrystart/entrystop cannot be used together")
+            entries = _normalize_entries(self.numentries, entries)
+            entrystart, entrystop = None, None
+        else:
+            entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+
+        # with a cut, read the branches it refers to first, then only the baskets of the other branches that contain passing entries
+        mask, loaded = None, {}
+        if cut is not None:
+            if entries is not None:
+                raise ValueError("cut and entries cannot be used together")
+            if outputs is not None:
+                raise ValueError("cut and outputs cannot be used together")
+            mask, loaded = self._cutmask(cut, entrystart, entrystop, awkward0, cache, basketcache, keycache, executor)
+            entries = entrystart + numpy.nonzero(mask)[0]
+            entrystart, entrystop = None, None
+
+        # one scheduler for the baskets of all branches, so that they are read in file order
+        scheduler = None
+        if executor is not None and hasattr(executor, "submit"):
+            scheduler = _BasketScheduler(executor)
+
+        def fill(branch, interpretation):
+            if branch.name in loaded and loaded[branch.name][0].identifier == interpretation.identifier:
+                out = _selectrows(loaded[branch.name][1], mask, interpretation)
+                if flatten and not ispandas and isinstance(interpretation, asjagged):
+                    out = out.content
+                return lambda: out
+            else:
+                return branch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=(flatten and not ispandas), awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache, executor=(executor if scheduler is None else scheduler), blocking=False, entries=entries, out=_output(outputs, branch))
 
         # start the job of filling the arrays
         futures = None
@@ -558,9 +1248,12 @@ class TTreeMethods(object):
                 else:
                     return branch.name if namedecode is None else branch.name.decode(namedecode)
 
-            futures = [(wrap_name(branch, namedecode), interpretation, branch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=(flatten and not ispandas), awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False)) for branch, interpretation in branches]
+            futures = [(wrap_name(branch, namedecode), interpretation, fill(branch, interpretation)) for branch, interpretation in branches]
         else:
-            futures = [(branch.name if namedecode is None else branch.name.decode(namedecode), interpretation, branch.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=(flatten and not ispandas), awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False)) for branch, interpretation in branches]
+            futures = [(branch.name if namedecode is None else branch.name.decode(namedecode), interpretation, fill(branch, interpretation)) for branch, interpretation in branches]
+
+        if scheduler is not None:
+            scheduler.run()
 
         # make functions that wait for the filling job to be done and return the right outputtype
         if outputtype == namedtuple:
@@ -571,7 +1264,7 @@ class TTreeMethods(object):
         elif ispandas:
             import uproot3._connect._pandas
             def wait():
-                return uproot3._connect._pandas.futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward0)
+                return uproot3._connect._pandas.futures2df(futures, outputtype, entrystart, entrystop, flatten, flatname, awkward0, entries=entries)
 
         elif isinstance(outputtype, type) and issubclass(outputtype, dict):
             def wait():
@@ -591,6 +1284,30 @@ class TTreeMethods(object):
         else:
             return wait
 
+    def _cutmask(self, cut, entrystart, entrystop, awkward0, cache, basketcache, keycache, executor):
+        arrays = _CutArrays(self, entrystart, entrystop, awkward0, cache, basketcache, keycache, executor)
+        if isinstance(cut, string_types):
+            mask = eval(compile(cut, "<cut>", "eval"), {"numpy": numpy, "np": numpy}, arrays)
+        elif callable(cut):
+            mask = cut(arrays)
+        else:
+            raise TypeError("cut must be an expression string or a function of a mapping from branch names to arrays")
+
+        if isinstance(mask, awkward0.JaggedArray):
+            raise ValueError("cut must have one value per entry; reduce jagged selections with .any() or .all()")
+        mask = numpy.asarray(mask)
+        if mask.shape == ():
+            mask = numpy.full(entrystop - entrystart, bool(mask))
+        if mask.dtype != numpy.bool_ or mask.shape != (entrystop - entrystart,):
+            raise ValueError("cut must be a boolean array with one value per entry ({0}), not {1} with shape {2}".format(entrystop - entrystart, mask.dtype, mask.shape))
+        return mask, arrays.loaded
+
+    def array_async(self, branch, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, entries=None, out=None):
+        return _arrayasync(lambda executor: self.array(branch, interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False, entries=entries, out=out), executor)
+
+    def arrays_async(self, branches=None, outputtype=dict, namedecode=None, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, recursive=True, entries=None, cut=None, outputs=None):
+        return _asyncio().read(lambda: self.arrays(branches=branches, outputtype=outputtype, namedecode=namedecode, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False, recursive=recursive, entries=entries, cut=cut, outputs=outputs))
+
     def lazyarray(self, branch, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True):
         awkward0 = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branch, awkward0))
@@ -676,17 +1393,30 @@ class TTreeMethods(object):
                 raise TypeError("entrysteps must be None for cluster iteration, a positive integer for equal steps in number of entries (inf for maximal), a memory size string (number followed by B/kB/MB/GB/etc.), or an iterable of 2-tuples for explicit entry starts (inclusive) and stops (exclusive)")
             return entrysteps
 
-    def iterate(self, branches=None, entrysteps=None, outputtype=dict, namedecode=None, reportentries=False, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def iterate(self, branches=None, entrysteps=None, outputtype=dict, namedecode=None, reportentries=False, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, cut=None, outputs=None, memory_budget=None, prefetch=0):
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative number of steps")
+        budget = _normalize_budget(memory_budget)
         if keycache is None:
-            keycache = {}
+            if budget is None:
+                keycache = {}
+            else:
+                # key metadata gets an eighth of the budget; evicted key tables are read again if needed
+                keycache = _BudgetKeyCache(max(1, budget.limitbytes // 8))
+                budget.track(keycache)
 
         if basketcache is None:
             basketcache = {}
             explicit_basketcache = False
+            if budget is not None:
+                budget.track(basketcache)
         else:
             explicit_basketcache = True
 
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
+        if budget is not None and entrysteps is None:
+            # a step's baskets and arrays take about twice its bytes, and the next step may be read while it is held
+            entrysteps = self.mempartitions(max(1, budget.limitbytes // 4), branches=branches, entrystart=entrystart, entrystop=entrystop, keycache=keycache)
         entrysteps = self._normalize_entrysteps(entrysteps, branches, entrystart, entrystop, keycache)
         awkward0 = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branches, awkward0))
@@ -694,6 +1424,15 @@ class TTreeMethods(object):
             if branch._recoveredbaskets is None:
                 branch._tryrecover()
 
+        # every step fills the same output arrays, so its arrays are only valid until the next step; they are not cached
+        if outputs is not None:
+            if cut is not None:
+                raise ValueError("cut and outputs cannot be used together")
+            if prefetch > 0:
+                raise ValueError("prefetch and outputs cannot be used together")
+            branches = [(branch, interpretation if _output(outputs, branch) is None else branch._outinterpretation(interpretation, _output(outputs, branch))) for branch, interpretation in branches]
+            cache = None
+
         # for the case of outputtype == pandas.DataFrame, do some preparation to fill DataFrames efficiently
         ispandas = getattr(outputtype, "__name__", None) == "DataFrame" and getattr(outputtype, "__module__", None) == "pandas.core.frame"
 
@@ -701,9 +1440,13 @@ class TTreeMethods(object):
             if future is None:
                 return past
             else:
-                out = interpretation.finalize(future(), branch)
-                if cache is not None:
-                    cache[cachekey] = out
+                if cachekey is None:
+                    # already finalized (and cached) by TBranchMethods.array
+                    out = future()
+                else:
+                    out = interpretation.finalize(future(), branch)
+                    if cache is not None:
+                        cache[cachekey] = out
                 if flatten and isinstance(interpretation, asjagged):
                     return out.flatten()
                 elif pythonize:
@@ -713,36 +1456,55 @@ class TTreeMethods(object):
 
         if outputtype == namedtuple:
             outputtype = namedtuple("Arrays", [codecs.ascii_decode(branch.name, "replace")[0] if namedecode is None else branch.name.decode(namedecode) for branch, interpretation in branches])
-            def wrap_for_python_scope(futures, start, stop):
+            def wrap_for_python_scope(futures, start, stop, entries):
                 return lambda: outputtype(*[evaluate(branch, interpretation, future, past, cachekey, False) for branch, interpretation, future, past, cachekey in futures])
 
         elif ispandas:
             import uproot3._connect._pandas
-            def wrap_for_python_scope(futures, start, stop):
-                def wrap_again(branch, interpretation, future):
-                    return lambda: interpretation.finalize(future(), branch)
-                return lambda: uproot3._connect._pandas.futures2df([(branch.name, interpretation, wrap_again(branch, interpretation, future)) for branch, interpretation, future, past, cachekey in futures], outputtype, start, stop, flatten, flatname, awkward0)
+            def wrap_for_python_scope(futures, start, stop, entries):
+                def wrap_again(branch, interpretation, future, past, cachekey):
+                    if future is None:
+                        return lambda: past
+                    elif cachekey is None:
+                        return future
+                    else:
+                        return lambda: interpretation.finalize(future(), branch)
+                return lambda: uproot3._connect._pandas.futures2df([(branch.name, interpretation, wrap_again(branch, interpretation, future, past, cachekey)) for branch, interpretation, future, past, cachekey in futures], outputtype, start, stop, flatten, flatname, awkward0, entries=entries)
 
         elif isinstance(outputtype, type) and issubclass(outputtype, dict):
-            def wrap_for_python_scope(futures, start, stop):
+            def wrap_for_python_scope(futures, start, stop, entries):
                 return lambda: outputtype((branch.name if namedecode is None else branch.name.decode(namedecode), evaluate(branch, interpretation, future, past, cachekey, False)) for branch, interpretation, future, past, cachekey in futures)
 
         elif isinstance(outputtype, type) and issubclass(outputtype, (list, tuple)):
-            def wrap_for_python_scope(futures, start, stop):
+            def wrap_for_python_scope(futures, start, stop, entries):
                 return lambda: outputtype(evaluate(branch, interpretation, future, past, cachekey, False) for branch, interpretation, future, past, cachekey in futures)
 
         else:
-            def wrap_for_python_scope(futures, start, stop):
+            def wrap_for_python_scope(futures, start, stop, entries):
                 return lambda: outputtype(*[evaluate(branch, interpretation, future, past, cachekey, False) for branch, interpretation, future, past, cachekey in futures])
 
-        for start, stop in entrysteps:
-            start = max(start, entrystart)
-            stop = min(stop, entrystop)
-            if start > stop:
-                continue
-
+        def schedule(start, stop):
             futures = []
-            for branch, interpretation in branches:
+            entries = None
+            stepexecutor = executor
+            if executor is not None and hasattr(executor, "submit"):
+                stepexecutor = _BasketScheduler(executor)
+
+            if cut is not None:
+                # read the cut's branches for this step, then only baskets of other branches that contain passing entries
+                mask, loaded = self._cutmask(cut, start, stop, awkward0, cache, basketcache if explicit_basketcache else None, keycache, executor)
+                entries = start + numpy.nonzero(mask)[0]
+                for branch, interpretation in branches:
+                    if branch.name in loaded and loaded[branch.name][0].identifier == interpretation.identifier:
+                        past = _selectrows(loaded[branch.name][1], mask, interpretation)
+                        if flatten and not ispandas and isinstance(interpretation, asjagged):
+                            past = past.flatten()
+                        futures.append((branch, interpretation, None, past, None))
+                    else:
+                        future = branch.array(interpretation=interpretation, awkwardlib=awkward0, cache=cache, basketcache=basketcache if explicit_basketcache else None, keycache=keycache, executor=stepexecutor, blocking=False, entries=entries)
+                        futures.append((branch, interpretation, future, None, None))
+
+            for branch, interpretation in (branches if cut is None else ()):
                 cachekey = branch._cachekey(interpretation, start, stop)
 
                 if branch.numbaskets == 0:
@@ -758,19 +1520,87 @@ class TTreeMethods(object):
                         if out is not None:
                             futures.append((branch, interpretation, None, out, cachekey))
                             continue
-                    future = branch._step_array(interpretation, basket_itemoffset, basket_entryoffset, start, stop, awkward0, basketcache, keycache, executor, explicit_basketcache)
+                    future = branch._step_array(interpretation, basket_itemoffset, basket_entryoffset, start, stop, awkward0, basketcache, keycache, stepexecutor, explicit_basketcache)
                     futures.append((branch, interpretation, future, None, cachekey))
 
-            out = wrap_for_python_scope(futures, start, stop)
+            if stepexecutor is not executor:
+                stepexecutor.run()
+
+            return wrap_for_python_scope(futures, start, stop, entries)
+
+        def readahead(start, stop):
+            return lambda: schedule(start, stop)()
+
+        steps = ((max(start, entrystart), min(stop, entrystop)) for start, stop in entrysteps)
+        steps = ((start, stop) for start, stop in steps if start <= stop)
+        upcoming = None
+        ahead = []      # steps whose reading has started, in order; the first is the next to be yielded
+        pending = []
+        previous = None
+        while True:
+            # start the next step, then read up to prefetch steps after it in the background
+            while len(ahead) <= prefetch:
+                if upcoming is None:
+                    upcoming = next(steps, None)
+                    if upcoming is None:
+                        break
+                    if budget is not None:
+                        upcoming = upcoming + (self._stepbytes(branches, upcoming[0], upcoming[1], keycache),)
+                start, stop = upcoming[:2]
+
+                if budget is not None:
+                    numbytes = upcoming[2]
+                    pending = [x for x in pending if not x.released]
+                    if len(ahead) > 0:
+                        # read ahead only as far as the budget allows; the rest waits for the generator to resume
+                        if not budget.fits(numbytes):
+                            break
+                    else:
+                        # block until the steps that are still held leave room for this one (or none are left)
+                        while len(pending) > 0 and not budget.fits(numbytes):
+                            pending.pop(0)()
+                            pending = [x for x in pending if not x.released]
+                    budget.acquire(numbytes)
+
+                if len(ahead) == 0:
+                    out = schedule(start, stop)
+                else:
+                    out = previous = _Prefetched(readahead(start, stop), previous)
+                if budget is not None:
+                    out = _BudgetedStep(out, budget, numbytes)
+                    pending.append(out)
+                ahead.append((start, stop, out))
+                upcoming = None
+
+            if len(ahead) == 0:
+                break
+            start, stop, step = ahead.pop(0)
 
             if blocking:
-                out = out()
+                out = step()
+            else:
+                out = step
 
             if reportentries:
                 yield start, stop, out
             else:
                 yield out
 
+            if budget is not None:
+                step.yielded()
+
+    def aiterate(self, branches=None, entrysteps=None, outputtype=dict, namedecode=None, reportentries=False, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, cut=None, outputs=None, memory_budget=None, prefetch=0):
+        return _asyncio().AsyncIterator(self.iterate(branches=branches, entrysteps=entrysteps, outputtype=outputtype, namedecode=namedecode, reportentries=reportentries, entrystart=entrystart, entrystop=entrystop, flatten=flatten, flatname=flatname, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False, cut=cut, outputs=outputs, memory_budget=memory_budget, prefetch=prefetch), reportentries)
+
+    def _stepbytes(self, branches, entrystart, entrystop, keycache):
+        # decompressed bytes of the baskets a step reads, and about as many again for the arrays made from them
+        numbytes = 0
+        for branch, interpretation in branches:
+            basketstart, basketstop = branch._basketstartstop(entrystart, entrystop)
+            if basketstart is not None:
+                numbytes += 2 * int(branch._keytable(keycache, basketstart, basketstop)["fObjlen"][basketstart:basketstop].sum())
+        return numbytes
+
     def _format(self, indent=""):
         # TODO: add TTree data to the bottom of this
         out = []
@@ -932,7 +1762,7 @@ class TBranchMethods(object):
 
         if self.numentries == self._fBasketEntry[self._numgoodbaskets]:
             self._recoveredbaskets = []
-            self._entryoffsets = self._fBasketEntry[: self._numgoodbaskets + 1].tolist()
+            self._entryoffsets = numpy.array(self._fBasketEntry[: self._numgoodbaskets + 1], dtype=numpy.int64)
             self._recoverylock = None
         else:
             self._recoveredbaskets = None
@@ -1050,66 +1880,110 @@ class TBranchMethods(object):
     def _basketcachekey(self, i):
         return "{0};{1};{2};{3};raw".format(base64.b64encode(self._context.uuid).decode("ascii"), self._context.treename.decode("ascii"), self.name.decode("ascii"), i)
 
-    def _keycachekey(self, i):
-        return "{0};{1};{2};{3};key".format(base64.b64encode(self._context.uuid).decode("ascii"), self._context.treename.decode("ascii"), self.name.decode("ascii"), i)
+    def _keycachekey(self):
+        return "{0};{1};{2};keys".format(base64.b64encode(self._context.uuid).decode("ascii"), self._context.treename.decode("ascii"), self.name.decode("ascii"))
 
-    def _threadsafe_key(self, i, keycache, complete):
-        key = None
-        if keycache is not None:
-            key = keycache.get(self._keycachekey(i), None)
+    def _countoffsetscachekey(self, entrystart, entrystop):
+        return "{0};{1};{2};{3}-{4};offsets".format(base64.b64encode(self._context.uuid).decode("ascii"), self._context.treename.decode("ascii"), self.name.decode("ascii"), entrystart, entrystop)
 
-        if key is None:
-            keysource = self._source.threadlocal()
-            try:
-                key = self._basketkey(keysource, i, complete)
-                if keycache is not None:
-                    keycache[self._keycachekey(i)] = key
-            finally:
-                keysource.dismiss()
-
-        return key
+    _keytable_dtype = numpy.dtype([("loaded", numpy.bool_), ("fNbytes", numpy.int64), ("fObjlen", numpy.int64), ("fKeylen", numpy.int64), ("fLast", numpy.int64), ("seek", numpy.int64), ("compressed", numpy.bool_), ("border", numpy.int64)])
 
-    def _threadsafe_iterate_keys(self, keycache, complete, basketstart=None, basketstop=None):
+    def _keytable(self, keycache, basketstart=None, basketstop=None, baskets=None):
+        if self._recoveredbaskets is None:
+            self._tryrecover()
         if basketstart is None:
             basketstart = 0
         if basketstop is None:
             basketstop = self.numbaskets
 
-        done = False
+        table = None
         if keycache is not None:
-            keys = [keycache.get(self._keycachekey(i), None) for i in range(basketstart, basketstop)]
-            if all(x is not None for x in keys):
-                if not complete or all(hasattr(x, "border") for x in keys):
-                    for key in keys:
-                        yield key
-                    done = True
-
-        if not done:
+            table = keycache.get(self._keycachekey(), None)
+        if table is None or len(table) != self.numbaskets:
+            table = numpy.zeros(self.numbaskets, dtype=self._keytable_dtype)
+            if keycache is not None:
+                keycache[self._keycachekey()] = table
+
+        if baskets is None:
+            missing = basketstart + numpy.nonzero(~table["loaded"][basketstart:basketstop])[0]
+        else:
+            missing = baskets[~table["loaded"][baskets]]
+        if len(missing) > 0:
+            self._fill_keytable(table, missing)
+        return table
+
+    def _fill_keytable(self, table, missing):
+        good = missing[missing < self._numgoodbaskets]
+        if len(good) > 0:
             keysource = self._source.threadlocal()
             try:
-                for i in range(basketstart, basketstop):
-                    key = None if keycache is None else keycache.get(self._keycachekey(i), None)
-                    if key is None or (complete and not hasattr(key, "border")):
-                        key = self._basketkey(keysource, i, complete)
-                        if keycache is not None:
-                            keycache[self._keycachekey(i)] = key
-                        yield key
-                    else:
-                        yield key
+                source = keysource.parent()
+                seeks = self._fBasketSeek[good].astype(numpy.int64)
+
+                header = _readcoalesced(source, seeks, self._BasketKey._dtype_header.itemsize).view(self._BasketKey._dtype_header).reshape(-1)
+                fNbytes = header["fNbytes"].astype(numpy.int64)
+                fObjlen = header["fObjlen"].astype(numpy.int64)
+                fKeylen = header["fKeylen"].astype(numpy.int64)
+                fSeekKey = numpy.where(header["fVersion"] > 1000, header["fSeekKey_big"], header["fSeekKey_small"])
+
+                complete = _readcoalesced(source, seeks + fKeylen - self._BasketKey._dtype_complete.itemsize - 1, self._BasketKey._dtype_complete.itemsize).view(self._BasketKey._dtype_complete).reshape(-1)
+                fLast = complete["fLast"].astype(numpy.int64)
+
+                size = source.size()
+                if size is not None:
+                    toolong = numpy.nonzero(size - fSeekKey < fNbytes)[0]
+                    if len(toolong) > 0:
+                        s = source
+                        while s.parent() is not None and s.parent() is not s:
+                            s = s.parent()
+                        raise ValueError("TKey declares that object has {0} bytes but only {1} remain in the file\n   in file: {2}".format(fNbytes[toolong[0]], size - fSeekKey[toolong[0]], s.path))
             finally:
                 keysource.dismiss()
 
+            table["fNbytes"][good] = fNbytes
+            table["fObjlen"][good] = fObjlen
+            table["fKeylen"][good] = fKeylen
+            table["fLast"][good] = fLast
+            table["seek"][good] = fSeekKey
+            table["compressed"][good] = fObjlen != fNbytes - fKeylen
+            table["border"][good] = fLast - fKeylen
+            table["loaded"][good] = True
+
+        for i in missing[missing >= self._numgoodbaskets]:
+            basket = self._recoveredbaskets[i - self._numgoodbaskets]
+            table[i] = (True, basket._fNbytes, basket._fObjlen, basket._fKeylen, basket._fLast, -1, False, basket.border)
+
+    def _basketdata(self, i, keytable):
+        return self._decompressbasket(i, keytable, self._fetchbasket(i, keytable))
+
+    def _fetchbasket(self, i, keytable):
+        # I/O: a source holding the (possibly compressed) bytes of basket i
+        if i >= self._numgoodbaskets:
+            return None
+        fNbytes, fKeylen, seek = int(keytable["fNbytes"][i]), int(keytable["fKeylen"][i]), int(keytable["seek"][i])
+        datasource = self._source.threadlocal()
+        try:
+            return Cursor(seek + fKeylen).prefetched(datasource.parent(), fNbytes - fKeylen)
+        finally:
+            datasource.dismiss()
+
+    def _decompressbasket(self, i, keytable, fetched):
+        if i >= self._numgoodbaskets:
+            return self._recoveredbaskets[i - self._numgoodbaskets].basketdata()
+        fNbytes, fObjlen, fKeylen, seek = int(keytable["fNbytes"][i]), int(keytable["fObjlen"][i]), int(keytable["fKeylen"][i]), int(keytable["seek"][i])
+        return _decompressbasketdata(self.compression, fetched, fNbytes, fObjlen, fKeylen, seek, keytable["compressed"][i])
+
     def uncompressedbytes(self, keycache=None):
-        return sum(key._fObjlen for key in self._threadsafe_iterate_keys(keycache, False))
+        return int(self._keytable(keycache)["fObjlen"].sum())
 
     def compressedbytes(self, keycache=None):
-        return sum(key._fNbytes - key._fKeylen for key in self._threadsafe_iterate_keys(keycache, False))
+        keytable = self._keytable(keycache)
+        return int((keytable["fNbytes"] - keytable["fKeylen"]).sum())
 
     def compressionratio(self, keycache=None):
-        numer, denom = 0, 0
-        for key in self._threadsafe_iterate_keys(keycache, False):
-            numer += key._fObjlen
-            denom += key._fNbytes - key._fKeylen
+        keytable = self._keytable(keycache)
+        numer = keytable["fObjlen"].sum()
+        denom = (keytable["fNbytes"] - keytable["fKeylen"]).sum()
         return float(numer) / float(denom)
 
     def _normalize_dtype(self, interpretation, awkward0):
@@ -1136,6 +2010,15 @@ class TBranchMethods(object):
         else:
             return interpretation
 
+    def _outinterpretation(self, interpretation, out):
+        # fill the caller's array (any numpy.ndarray, including a numpy.memmap) instead of a new one
+        if isinstance(interpretation, asdtype):
+            return interpretation.toarray(out)
+        elif isinstance(interpretation, asjagged) and isinstance(interpretation.content, asdtype):
+            return asjagged(interpretation.content.toarray(out), interpretation.skipbytes)
+        else:
+            raise TypeError("cannot fill an output array with branch {0} (interpretation {1}); only numbers and jagged arrays of numbers can be read into an output array\n   in file: {2}".format(repr(self.name), interpretation, self._context.sourcepath))
+
     def _normalize_interpretation(self, interpretation, awkward0):
         if interpretation is None:
             interpretation = interpret(self, awkward0)
@@ -1157,7 +2040,8 @@ class TBranchMethods(object):
             raise ValueError("cannot interpret branch {0} as a Python type\n   in file: {1}".format(repr(self.name), self._context.sourcepath))
         if self._recoveredbaskets is None:
             self._tryrecover()
-        return sum(interpretation.numitems(key.border, self.basket_numentries(i)) for i, key in enumerate(self._threadsafe_iterate_keys(keycache, True)))
+        keytable = self._keytable(keycache)
+        return int(_numitems(interpretation, keytable["border"], numpy.diff(self._entryoffsets)).sum())
 
     @property
     def compression(self):
@@ -1170,7 +2054,7 @@ class TBranchMethods(object):
         if self._recoveredbaskets is None:
             self._tryrecover()
         if 0 <= i < self.numbaskets:
-            return self._entryoffsets[i]
+            return int(self._entryoffsets[i])
         else:
             raise IndexError("index {0} out of range for branch with {1} baskets".format(i, self.numbaskets))
 
@@ -1178,7 +2062,7 @@ class TBranchMethods(object):
         if self._recoveredbaskets is None:
             self._tryrecover()
         if 0 <= i < self.numbaskets:
-            return self._entryoffsets[i + 1]
+            return int(self._entryoffsets[i + 1])
         else:
             raise IndexError("index {0} out of range for branch with {1} baskets".format(i, self.numbaskets))
 
@@ -1186,70 +2070,80 @@ class TBranchMethods(object):
         if self._recoveredbaskets is None:
             self._tryrecover()
         if 0 <= i < self.numbaskets:
-            return self._entryoffsets[i + 1] - self._entryoffsets[i]
+            return int(self._entryoffsets[i + 1] - self._entryoffsets[i])
         else:
             raise IndexError("index {0} out of range for branch with {1} baskets".format(i, self.numbaskets))
 
     def basket_uncompressedbytes(self, i, keycache=None):
         if self._recoveredbaskets is None:
             self._tryrecover()
-        return self._threadsafe_key(i, keycache, False)._fObjlen
+        self._checkbasketindex(i)
+        return int(self._keytable(keycache, i, i + 1)["fObjlen"][i])
 
     def basket_compressedbytes(self, i, keycache=None):
         if self._recoveredbaskets is None:
             self._tryrecover()
-        key = self._threadsafe_key(i, keycache, False)
-        return key._fNbytes - key._fKeylen
+        self._checkbasketindex(i)
+        keytable = self._keytable(keycache, i, i + 1)
+        return int(keytable["fNbytes"][i] - keytable["fKeylen"][i])
 
     def basket_numitems(self, i, interpretation=None, keycache=None):
         if self._recoveredbaskets is None:
             self._tryrecover()
         awkward0 = _normalize_awkwardlib(None)
         interpretation = self._normalize_interpretation(interpretation, awkward0)
-        key = self._threadsafe_key(i, keycache, True)
-        return interpretation.numitems(key.border, self.basket_numentries(i))
+        self._checkbasketindex(i)
+        return interpretation.numitems(int(self._keytable(keycache, i, i + 1)["border"][i]), self.basket_numentries(i))
 
     def _localentries(self, i, entrystart, entrystop):
         local_entrystart = max(0, entrystart - self.basket_entrystart(i))
         local_entrystop  = max(0, min(entrystop - self.basket_entrystart(i), self.basket_entrystop(i) - self.basket_entrystart(i)))
         return local_entrystart, local_entrystop
 
-    def _basket(self, i, interpretation, local_entrystart, local_entrystop, awkward0, basketcache, keycache):
-        basketdata = None
+    def _basket(self, i, interpretation, local_entrystart, local_entrystop, awkward0, basketcache, keycache, basketdata=None):
         if basketcache is not None:
             basketcachekey = self._basketcachekey(i)
-            basketdata = basketcache.get(basketcachekey, None)
+            if basketdata is None:
+                basketdata = basketcache.get(basketcachekey, None)
 
-        key = self._threadsafe_key(i, keycache, True)
+        self._checkbasketindex(i)
+        keytable = self._keytable(keycache, i, i + 1)
+        fObjlen, fKeylen, fLast, border = int(keytable["fObjlen"][i]), int(keytable["fKeylen"][i]), int(keytable["fLast"][i]), int(keytable["border"][i])
 
         if basketdata is None:
-            basketdata = key.basketdata()
+            basketdata = self._basketdata(i, keytable)
 
         if basketcache is not None:
             basketcache[basketcachekey] = basketdata
 
-        if key._fObjlen == key.border:
-            data, byteoffsets = basketdata, None
+        byteoffsets = None
+        if fObjlen == border and self._generatesoffsets():
+            offsets = self._countbranch._countoffsets(self.basket_entrystart(i), self.basket_entrystop(i), keycache)
+            itemsize = 1
+            if isinstance(interpretation, asjagged):
+                itemsize = interpretation.content.fromdtype.itemsize
+            byteoffsets = awkward0.numpy.multiply(offsets, itemsize)
 
-            if self._countbranch is not None and awkward0.numpy.uint8(self._tree_iofeatures) & awkward0.numpy.uint8(uproot3.const.kGenerateOffsetMap) != 0:
-                counts = self._countbranch.array(entrystart=(local_entrystart + self.basket_entrystart(i)),
-                                                 entrystop=(local_entrystop + self.basket_entrystart(i)))
-                itemsize = 1
-                if isinstance(interpretation, asjagged):
-                    itemsize = interpretation.content.fromdtype.itemsize
-                awkward0.numpy.multiply(counts, itemsize, counts)
-                byteoffsets = awkward0.numpy.empty(len(counts) + 1, dtype=awkward0.numpy.int32)
-                byteoffsets[0] = 0
-                awkward0.numpy.cumsum(counts, out=byteoffsets[1:])
+        return _frombasketdata(interpretation, basketdata, fObjlen, fKeylen, fLast, border, local_entrystart, local_entrystop, byteoffsets)
 
-        else:
-            data = basketdata[:key.border]
-            byteoffsets = awkward0.numpy.empty((key._fObjlen - key.border - 4) // 4, dtype=awkward0.numpy.int32)  # native endian
-            byteoffsets[:-1] = basketdata[key.border + 4 : -4].view(">i4")                     # read as big-endian and convert
-            byteoffsets[-1] = key._fLast
-            awkward0.numpy.subtract(byteoffsets, key._fKeylen, byteoffsets)
+    def _generatesoffsets(self):
+        # baskets without offsets whose offsets are made from the counter branch (kGenerateOffsetMap)
+        return self._countbranch is not None and numpy.uint8(self._tree_iofeatures) & numpy.uint8(uproot3.const.kGenerateOffsetMap) != 0
 
-        return interpretation.fromroot(data, byteoffsets, local_entrystart, local_entrystop, key._fKeylen)
+    def _countoffsets(self, entrystart, entrystop, keycache):
+        # offsets made from this counter branch, shared through the keycache by all branches that it counts
+        cachekey = self._countoffsetscachekey(entrystart, entrystop)
+        offsets = None
+        if keycache is not None:
+            offsets = keycache.get(cachekey, None)
+        if offsets is None:
+            counts = self.array(entrystart=entrystart, entrystop=entrystop, keycache=keycache)
+            offsets = numpy.empty(len(counts) + 1, dtype=numpy.int32)
+            offsets[0] = 0
+            numpy.cumsum(counts, out=offsets[1:])
+            if keycache is not None:
+                keycache[cachekey] = offsets
+        return offsets
 
     def basket(self, i, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None):
         awkward0 = _normalize_awkwardlib(awkwardlib)
@@ -1266,7 +2160,6 @@ class TBranchMethods(object):
         local_entrystart, local_entrystop = self._localentries(i, entrystart, entrystop)
         entrystart = self.basket_entrystart(i) + local_entrystart
         entrystop = self.basket_entrystart(i) + local_entrystop
-        numentries = local_entrystop - local_entrystart
 
         if cache is not None:
             cachekey = self._cachekey(interpretation, entrystart, entrystop)
@@ -1278,6 +2171,10 @@ class TBranchMethods(object):
                     return out
 
         source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward0, basketcache, keycache)
+        return self._basketarray(interpretation, source, entrystart, entrystop, flatten, cache)
+
+    def _basketarray(self, interpretation, source, entrystart, entrystop, flatten, cache):
+        numentries = entrystop - entrystart
         numitems = interpretation.source_numitems(source)
 
         destination = interpretation.destination(numitems, numentries)
@@ -1285,26 +2182,23 @@ class TBranchMethods(object):
         out = interpretation.finalize(destination, self)
 
         if cache is not None:
-            cache[cachekey] = out
+            cache[self._cachekey(interpretation, entrystart, entrystop)] = out
         if flatten and isinstance(interpretation, asjagged):
             return out.content
         else:
             return out
 
     def _basketstartstop(self, entrystart, entrystop):
-        basketstart, basketstop = None, None
-        for i in range(self.numbaskets):
-            if basketstart is None:
-                if entrystart < self.basket_entrystop(i) and self.basket_entrystart(i) < entrystop:
-                    basketstart = i
-                    basketstop = i
-            else:
-                if self.basket_entrystart(i) < entrystop:
-                    basketstop = i
-
-        if basketstop is not None:
-            basketstop += 1    # stop is exclusive
-
+        if self._recoveredbaskets is None:
+            self._tryrecover()
+        if self.numbaskets == 0:
+            return None, None
+        # first basket that ends after entrystart, up to (exclusive) the first basket that starts at or after entrystop
+        starts, stops = self._entryoffsets[:-1], self._entryoffsets[1:]
+        basketstart = int(numpy.searchsorted(stops, entrystart, side="right"))
+        basketstop = int(numpy.searchsorted(starts, entrystop, side="left"))
+        if basketstart >= basketstop:
+            return None, None
         return basketstart, basketstop
 
     def baskets(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, reportentries=False, executor=None, blocking=True):
@@ -1328,11 +2222,14 @@ class TBranchMethods(object):
 
         out = [None] * (basketstop - basketstart)
 
-        def fill(j):
+        def fill(j, basketdata=None, source=None):
             try:
-                basket = self.basket(j + basketstart, interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache)
+                local_entrystart, local_entrystop = self._localentries(j + basketstart, entrystart, entrystop)
+                if source is None:
+                    basket = self.basket(j + basketstart, interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache)
+                else:
+                    basket = self._basketarray(interpretation, source, local_entrystart + self.basket_entrystart(j + basketstart), local_entrystop + self.basket_entrystart(j + basketstart), flatten, cache)
                 if reportentries:
-                    local_entrystart, local_entrystop = self._localentries(j + basketstart, entrystart, entrystop)
                     basket = (local_entrystart + self.basket_entrystart(j + basketstart),
                               local_entrystop + self.basket_entrystart(j + basketstart),
                               basket)
@@ -1346,6 +2243,8 @@ class TBranchMethods(object):
             for j in range(basketstop - basketstart):
                 _delayedraise(fill(j))
             excinfos = ()
+        elif _isprocesspool(executor):
+            excinfos = self._mapbaskets(executor, fill, numpy.arange(basketstart, basketstop), interpretation, entrystart, entrystop, keycache, basketcache)
         else:
             excinfos = executor.map(fill, range(basketstop - basketstart))
 
@@ -1383,26 +2282,32 @@ class TBranchMethods(object):
                         yield self.basket(i, interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkward0, cache=cache, basketcache=basketcache, keycache=keycache)
 
     def _basket_itemoffset(self, interpretation, basketstart, basketstop, keycache):
-        basket_itemoffset = [0]
-        for j, key in enumerate(self._threadsafe_iterate_keys(keycache, True, basketstart, basketstop)):
-            i = basketstart + j
-            numitems = interpretation.numitems(key.border, self.basket_numentries(i))
-            basket_itemoffset.append(basket_itemoffset[-1] + numitems)
-        return basket_itemoffset
+        keytable = self._keytable(keycache, basketstart, basketstop)
+        numitems = _numitems(interpretation, keytable["border"][basketstart:basketstop], numpy.diff(self._entryoffsets[basketstart:basketstop + 1]))
+        basket_itemoffset = numpy.zeros(basketstop - basketstart + 1, dtype=numpy.int64)
+        numpy.cumsum(numitems, out=basket_itemoffset[1:])
+        return basket_itemoffset.tolist()
 
     def _basket_entryoffset(self, basketstart, basketstop):
-        basket_entryoffset = [0]
-        for i in range(basketstart, basketstop):
-            basket_entryoffset.append(basket_entryoffset[-1] + self.basket_numentries(i))
-        return basket_entryoffset
+        return (self._entryoffsets[basketstart:basketstop + 1] - self._entryoffsets[basketstart]).tolist()
 
-    def array(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
+    def array(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True, entries=None, out=None):
         if self._recoveredbaskets is None:
             self._tryrecover()
         awkward0 = _normalize_awkwardlib(awkwardlib)
         interpretation = self._normalize_interpretation(interpretation, awkward0)
         if interpretation is None:
             raise ValueError("cannot interpret branch {0} as a Python type\n   in file: {1}".format(repr(self.name), self._context.sourcepath))
+        if out is not None:
+            if entries is not None:
+                raise ValueError("entries and out cannot be used together")
+            # the result is a view of out, which a cached array would not be
+            interpretation = self._outinterpretation(interpretation, out)
+            cache = None
+        if entries is not None:
+            if entrystart is not None or entrystop is not None:
+                raise ValueError("entries and entrystart/entrystop cannot be used together")
+            return self._entries_array(_normalize_entries(self.numentries, entries), interpretation, flatten, awkward0, cache, basketcache, keycache, executor, blocking)
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
         basketstart, basketstop = self._basketstartstop(entrystart, entrystop)
 
@@ -1436,11 +2341,12 @@ class TBranchMethods(object):
 
         destination = interpretation.destination(basket_itemoffset[-1], basket_entryoffset[-1])
 
-        def fill(j):
+        def fill(j, basketdata=None, source=None):
             try:
                 i = j + basketstart
                 local_entrystart, local_entrystop = self._localentries(i, entrystart, entrystop)
-                source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward0, basketcache, keycache)
+                if source is None:
+                    source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward0, basketcache, keycache, basketdata)
 
                 expecteditems = basket_itemoffset[j + 1] - basket_itemoffset[j]
                 source_numitems = interpretation.source_numitems(source)
@@ -1475,7 +2381,7 @@ class TBranchMethods(object):
                 _delayedraise(fill(j))
             excinfos = ()
         else:
-            excinfos = executor.map(fill, range(basketstop - basketstart))
+            excinfos = self._mapbaskets(executor, fill, numpy.arange(basketstart, basketstop), interpretation, entrystart, entrystop, keycache, basketcache)
 
         def wait():
             for excinfo in excinfos:
@@ -1500,6 +2406,150 @@ class TBranchMethods(object):
         else:
             return wait
 
+    def _mapbaskets(self, executor, fill, baskets, interpretation, entrystart, entrystop, keycache, basketcache):
+        # run fill(j) for each baskets[j], either on an ordinary executor or on a scheduler shared among branches
+        if isinstance(executor, uproot3.pipeline.Pipeline) or _isprocesspool(executor):
+            scheduler = _BasketScheduler(executor)
+            out = self._mapbaskets(scheduler, fill, baskets, interpretation, entrystart, entrystop, keycache, basketcache)
+            scheduler.run()
+            return out
+
+        elif isinstance(executor, _BasketScheduler) and executor._processes:
+            keytable = self._keytable(keycache, baskets=baskets)
+            seeks = numpy.zeros(len(baskets), dtype=numpy.int64)
+            good = baskets < self._numgoodbaskets
+            seeks[good] = self._fBasketSeek[baskets[good]]
+            remoteinterpretation = _remoteinterpretation(interpretation)
+            generatesoffsets = self._generatesoffsets()
+            sourcefactory = self._context.sourcefactory
+            if not _picklable(sourcefactory):
+                sourcefactory = None    # opened without uproot3.open or with a factory that can't be sent: read here
+            fileid = (self._context.uuid, self._context.tfile.get("_fEND", None))
+
+            def remote(j):
+                i = int(baskets[j])
+                if sourcefactory is None or remoteinterpretation is None:
+                    return None
+                if i >= self._numgoodbaskets or (generatesoffsets and keytable["fObjlen"][i] == keytable["border"][i]):
+                    return None    # needs more of this branch than the basket's key
+                if basketcache is not None and self._basketcachekey(i) in basketcache:
+                    return None
+                local_entrystart, local_entrystop = self._localentries(i, entrystart, entrystop)
+                key = tuple(keytable[n][i].item() for n in ("fNbytes", "fObjlen", "fKeylen", "fLast", "seek", "compressed", "border"))
+                return _ProcessBasket(sourcefactory, self._context.sourcepath, fileid, self.compression, key, remoteinterpretation, local_entrystart, local_entrystop, basketcache is not None)
+
+            def receive(j, shared):
+                # fill copies the interpreted arrays straight out of shared memory into the destination
+                def fillfrom(result):
+                    basketdata, source = result
+                    if basketdata is not None:
+                        basketdata = basketcache[self._basketcachekey(baskets[j])] = numpy.array(basketdata)
+                    return fill(j, basketdata, source)
+                return _withshared(shared, fillfrom)
+
+            return executor.map(fill, seeks, keytable["fObjlen"][baskets], remote=remote, receive=receive)
+
+        elif isinstance(executor, _BasketScheduler):
+            keytable = self._keytable(keycache, baskets=baskets)
+            seeks = numpy.zeros(len(baskets), dtype=numpy.int64)
+            good = baskets < self._numgoodbaskets
+            seeks[good] = self._fBasketSeek[baskets[good]]
+
+            def fetch(j):
+                if basketcache is not None and self._basketcachekey(baskets[j]) in basketcache:
+                    return None
+                return self._fetchbasket(baskets[j], keytable)
+
+            def decompress(j, fetched):
+                if fetched is None and baskets[j] < self._numgoodbaskets:
+                    return None    # already in the basketcache
+                return self._decompressbasket(baskets[j], keytable, fetched)
+
+            return executor.map(fill, seeks, keytable["fObjlen"][baskets], fetch, decompress)
+
+        else:
+            return executor.map(fill, range(len(baskets)))
+
+    def _entries_array(self, entries, interpretation, flatten, awkward0, cache, basketcache, keycache, executor, blocking):
+        if cache is not None:
+            cachekey = self._cachekey(interpretation, "entries", hashlib.sha1(entries.tobytes()).hexdigest())
+            out = cache.get(cachekey, None)
+            if out is not None:
+                if flatten and isinstance(interpretation, asjagged):
+                    out = out.content
+                if blocking:
+                    return out
+                else:
+                    return lambda: out
+
+        if len(entries) == 0:
+            if blocking:
+                return interpretation.empty()
+            else:
+                return lambda: interpretation.empty()
+
+        if keycache is None:
+            keycache = {}
+
+        # only the baskets that contain at least one selected entry are read, back to back in the destination
+        baskets = numpy.searchsorted(self._entryoffsets, entries, side="right") - 1
+        needed, inverse = numpy.unique(baskets, return_inverse=True)
+        if self._source.parent() is not None:
+            self._source.parent().preload([self._fBasketSeek[i] for i in needed if i < self._numgoodbaskets])
+
+        keytable = self._keytable(keycache, baskets=needed)
+        numentries = self._entryoffsets[needed + 1] - self._entryoffsets[needed]
+        basket_entryoffset = numpy.zeros(len(needed) + 1, dtype=numpy.int64)
+        numpy.cumsum(numentries, out=basket_entryoffset[1:])
+        basket_itemoffset = numpy.zeros(len(needed) + 1, dtype=numpy.int64)
+        numpy.cumsum(_numitems(interpretation, keytable["border"][needed], numentries), out=basket_itemoffset[1:])
+
+        # position of each selected entry among the entries of the baskets that were read
+        index = entries - self._entryoffsets[needed][inverse] + basket_entryoffset[:-1][inverse]
+
+        destination = interpretation.destination(int(basket_itemoffset[-1]), int(basket_entryoffset[-1]))
+
+        def fill(j, basketdata=None, source=None):
+            try:
+                if source is None:
+                    source = self._basket(int(needed[j]), interpretation, 0, int(numentries[j]), awkward0, basketcache, keycache, basketdata)
+                interpretation.fill(source,
+                                    destination,
+                                    int(basket_itemoffset[j]),
+                                    int(basket_itemoffset[j + 1]),
+                                    int(basket_entryoffset[j]),
+                                    int(basket_entryoffset[j + 1]))
+            except Exception:
+                return sys.exc_info()
+
+        if executor is None:
+            for j in range(len(needed)):
+                _delayedraise(fill(j))
+            excinfos = ()
+        else:
+            excinfos = self._mapbaskets(executor, fill, needed, interpretation, 0, self.numentries, keycache, basketcache)
+
+        def wait():
+            for excinfo in excinfos:
+                _delayedraise(excinfo)
+
+            clipped = interpretation.clip(destination, 0, int(basket_itemoffset[-1]), 0, int(basket_entryoffset[-1]))
+            out = interpretation.finalize(clipped, self)[index]
+            if isinstance(interpretation, asjagged):
+                out = out.compact()
+
+            if cache is not None:
+                cache[cachekey] = out
+            if flatten and isinstance(interpretation, asjagged):
+                return out.content
+            else:
+                return out
+
+        if blocking:
+            return wait()
+        else:
+            return wait
+
     def _step_array(self, interpretation, basket_itemoffset, basket_entryoffset, entrystart, entrystop, awkward0, basketcache, keycache, executor, explicit_basketcache):
         if interpretation is None:
             raise ValueError("cannot interpret branch {0} as a Python type\n   in file: {1}".format(repr(self.name), self._context.sourcepath))
@@ -1513,11 +2563,12 @@ class TBranchMethods(object):
 
         destination = interpretation.destination(basket_itemoffset[-1], basket_entryoffset[-1])
 
-        def fill(j):
+        def fill(j, basketdata=None, source=None):
             try:
                 i = j + basketstart
                 local_entrystart, local_entrystop = self._localentries(i, entrystart, entrystop)
-                source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward0, basketcache, keycache)
+                if source is None:
+                    source = self._basket(i, interpretation, local_entrystart, local_entrystop, awkward0, basketcache, keycache, basketdata)
 
                 expecteditems = basket_itemoffset[j + 1] - basket_itemoffset[j]
                 source_numitems = interpretation.source_numitems(source)
@@ -1552,7 +2603,7 @@ class TBranchMethods(object):
                 _delayedraise(fill(j))
             excinfos = ()
         else:
-            excinfos = executor.map(fill, range(basketstop - basketstart))
+            excinfos = self._mapbaskets(executor, fill, numpy.arange(basketstart, basketstop), interpretation, entrystart, entrystop, keycache, basketcache)
 
         def wait():
             for excinfo in excinfos:
@@ -1587,15 +2638,7 @@ class TBranchMethods(object):
         if not linear:
             raise NotImplementedError("non-linear mempartition has not been implemented")
 
-        relevant_numbytes = 0.0
-        if self._recoveredbaskets is None:
-            self._tryrecover()
-        for i, key in enumerate(self._threadsafe_iterate_keys(keycache, False)):
-            start, stop = self._entryoffsets[i], self._entryoffsets[i + 1]
-            if entrystart < stop and start < entrystop:
-                this_numbytes = key._fObjlen * (min(stop, entrystop) - max(start, entrystart)) / float(stop - start)
-                assert this_numbytes >= 0.0
-                relevant_numbytes += this_numbytes
+        relevant_numbytes = self._relevant_numbytes(entrystart, entrystop, keycache)
 
         entrysteps = max(1, round(math.ceil((entrystop - entrystart) * numbytes / relevant_numbytes)))
 
@@ -1606,6 +2649,50 @@ class TBranchMethods(object):
                 yield start, stop
             start = stop
 
+    def _estimated_objlen(self, keycache):
+        # uncompressed bytes of each basket without reading any keys: fBasketBytes less an estimated key length, scaled by
+        # the branch's compression ratio (fTotBytes and fZipBytes count the same keys); exact where keys are in keycache
+        if self._recoveredbaskets is None:
+            self._tryrecover()
+        numgood = self._numgoodbaskets
+        out = numpy.empty(self.numbaskets, dtype=numpy.float64)
+
+        # TKey with 64-bit seeks (34 bytes), "TBasket" (8), name and title strings (the branch and tree names), TBasket header (19)
+        keylen = 63 + len(self.name) + len(self._context.treename)
+        totbytes = getattr(self, "_fTotBytes", 0) - numgood * keylen
+        zipbytes = getattr(self, "_fZipBytes", 0) - numgood * keylen
+        ratio = max(1.0, float(totbytes) / zipbytes) if totbytes > 0 and zipbytes > 0 else 1.0
+        out[:numgood] = numpy.maximum(self._fBasketBytes[:numgood] - keylen, 0) * ratio
+
+        for i, basket in enumerate(self._recoveredbaskets):
+            out[numgood + i] = basket._fObjlen
+
+        if keycache is not None:
+            table = keycache.get(self._keycachekey(), None)
+            if table is not None and len(table) == self.numbaskets:
+                loaded = table["loaded"]
+                out[loaded] = table["fObjlen"][loaded]
+        return out
+
+    def _cumulative_numbytes(self, entries, keycache):
+        # uncompressed bytes before each of the given entries, assuming uniform entry sizes within each basket
+        if self.numbaskets == 0:
+            return numpy.zeros(len(entries), dtype=numpy.float64)
+        objlen = self._estimated_objlen(keycache)
+        cumulative = numpy.zeros(len(objlen) + 1, dtype=numpy.float64)
+        numpy.cumsum(objlen, out=cumulative[1:])
+        return numpy.interp(entries, self._entryoffsets, cumulative)
+
+    def _relevant_numbytes(self, entrystart, entrystop, keycache):
+        # uncompressed bytes in [entrystart, entrystop), assuming uniform entry sizes within each basket
+        if self.numbaskets == 0:
+            return 0.0
+        objlen = self._estimated_objlen(keycache)
+        starts, stops = self._entryoffsets[:-1], self._entryoffsets[1:]
+        relevant = (entrystart < stops) & (starts < entrystop) & (starts < stops)
+        overlap = numpy.minimum(stops, entrystop)[relevant] - numpy.maximum(starts, entrystart)[relevant]
+        return float((objlen[relevant] * overlap / (stops - starts)[relevant].astype(numpy.float64)).sum())
+
     def _normalize_entrysteps(self, entrysteps, entrystart, entrystop, keycache):
         numbytes = _memsize(entrysteps)
         if numbytes is not None:
@@ -1616,7 +2703,11 @@ class TBranchMethods(object):
         if entrysteps is None:
             if self._recoveredbaskets is None:
                 self._tryrecover()
-            return [(self._entryoffsets[i], self._entryoffsets[i + 1]) for i in range(self.numbaskets) if entrystart < self._entryoffsets[i + 1] and entrystop >= self._entryoffsets[i]]
+            if self.numbaskets == 0:
+                return []
+            starts, stops = self._entryoffsets[:-1], self._entryoffsets[1:]
+            relevant = (entrystart < stops) & (entrystop >= starts)
+            return list(zip(starts[relevant].tolist(), stops[relevant].tolist()))
 
         elif entrysteps == float("inf"):
             return [(entrystart, min(entrystop, self.numentries))]
@@ -1638,6 +2729,9 @@ class TBranchMethods(object):
                 raise TypeError("entrysteps must be None for cluster iteration, a positive integer for equal steps in number of entries (inf for maximal), a memory size string (number followed by B/kB/MB/GB/etc.), or an iterable of 2-tuples for explicit entry starts (inclusive) and stops (exclusive)")
             return entrysteps
 
+    def array_async(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, entries=None, out=None):
+        return _arrayasync(lambda executor: self.array(interpretation=interpretation, entrystart=entrystart, entrystop=entrystop, flatten=flatten, awkwardlib=awkwardlib, cache=cache, basketcache=basketcache, keycache=keycache, executor=executor, blocking=False, entries=entries, out=out), executor)
+
     def lazyarray(self, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False, chunked=True):
         if self._recoveredbaskets is None:
             self._tryrecover()
@@ -1683,56 +2777,15 @@ class TBranchMethods(object):
             return out
 
     class _BasketKey(object):
-        def __init__(self, source, cursor, compression, complete):
-            start = cursor.index
-            self._fNbytes, self._fVersion, self._fObjlen, self._fDatime, self._fKeylen, self._fCycle, self._fSeekKey, self._fSeekPdir = cursor.fields(source, TBranchMethods._BasketKey._format_small)
-
-            if self._fVersion > 1000:
-                cursor.index = start
-                self._fNbytes, self._fVersion, self._fObjlen, self._fDatime, self._fKeylen, self._fCycle, self._fSeekKey, self._fSeekPdir = cursor.fields(source, TBranchMethods._BasketKey._format_big)
-
-            if complete:
-                cursor.index = start + self._fKeylen - TBranchMethods._BasketKey._format_complete.size - 1
-                self._fVersion, self._fBufferSize, self._fNevBufSize, self._fNevBuf, self._fLast = cursor.fields(source, TBranchMethods._BasketKey._format_complete)
-
-                self.border = self._fLast - self._fKeylen
-
-                if source.size() is not None:
-                    if source.size() - self._fSeekKey < self._fNbytes:
-                        s = source
-                        while s.parent() is not None and s.parent() is not s:
-                            s = s.parent()
-                        raise ValueError("TKey declares that object has {0} bytes but only {1} remain in the file\n   in file: {2}".format(self._fNbytes, source.size() - self._fSeekKey, s.path))
-
-                if self._fObjlen != self._fNbytes - self._fKeylen:
-                    self.source = uproot3.source.compressed.CompressedSource(compression, source, Cursor(self._fSeekKey + self._fKeylen), self._fNbytes - self._fKeylen, self._fObjlen)
-                    self.cursor = Cursor(0)
-                else:
-                    self.source = source
-                    self.cursor = Cursor(self._fSeekKey + self._fKeylen)
-
-        _format_small = struct.Struct(">ihiIhhii")
-        _format_big = struct.Struct(">ihiIhhqq")
-        _format_complete = struct.Struct(">Hiiii")
-
-        @property
-        def fName(self):
-            return "TBranchMethods._BasketKey"
-
-        @property
-        def fTitle(self):
-            return "TBranchMethods._BasketKey"
-
-        @property
-        def fClassName(self):
-            return "TBasket"
-
-        def basketdata(self):
-            datasource = self.source.threadlocal()
-            try:
-                return self.cursor.copied().bytes(datasource, self._fObjlen)
-            finally:
-                datasource.dismiss()
+        # TKey header (small and big formats share the first 18 bytes) and the TBasket fields at the end of the key
+        _dtype_header = numpy.dtype({"names": ["fNbytes", "fVersion", "fObjlen", "fKeylen", "fSeekKey_small", "fSeekKey_big"],
+                                     "formats": [">i4", ">i2", ">i4", ">i2", ">i4", ">i8"],
+                                     "offsets": [0, 4, 6, 14, 18, 18],
+                                     "itemsize": 34})
+        _dtype_complete = numpy.dtype({"names": ["fVersion", "fBufferSize", "fNevBufSize", "fNevBuf", "fLast"],
+                                       "formats": [">u2", ">i4", ">i4", ">i4", ">i4"],
+                                       "offsets": [0, 2, 6, 10, 14],
+                                       "itemsize": 18})
 
     class _RecoveredTBasket(uproot3.rootio.ROOTObject):
         @classmethod
@@ -1794,7 +2847,7 @@ class TBranchMethods(object):
         if entryoffsets[-1] == self.numentries:
             with self._recoverylock:
                 self._recoveredbaskets = recoveredbaskets
-                self._entryoffsets = entryoffsets
+                self._entryoffsets = numpy.array(entryoffsets, dtype=numpy.int64)
         else:
             if self.interpretation is None:
                 self._recoveredbaskets = []
@@ -1805,14 +2858,8 @@ class TBranchMethods(object):
         if self._recoveredbaskets is None:
             self._recover()
 
-    def _basketkey(self, source, i, complete):
-        if 0 <= i < self._numgoodbaskets:
-            return self._BasketKey(source.parent(), Cursor(self._fBasketSeek[i]), self.compression, complete)
-
-        elif self._numgoodbaskets <= i < self.numbaskets:
-            return self._recoveredbaskets[i - self._numgoodbaskets]
-
-        else:
+    def _checkbasketindex(self, i):
+        if not 0 <= i < self.numbaskets:
             raise IndexError("index {0} out of range for branch with {1} baskets".format(i, self.numbaskets))
 
     def _format(self, foldnames, indent="", strip=""):
@@ -2148,3 +3195,110 @@ def _numentries(paths, treepath, total, localsource, xrootdsource, httpsource, e
         return wait()
     else:
         return wait
+
+def partition(path, treepath, branches=None, target_bytes="100 MB", localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, executor=None, blocking=True, **options):
+    numbytes = _memsize(target_bytes)
+    if numbytes is None:
+        numbytes = target_bytes
+    if numbytes <= 0:
+        raise ValueError("target_bytes must be positive")
+
+    if isinstance(path, string_types):
+        paths = _filename_explode(path)
+    else:
+        paths = [y for x in path for y in _filename_explode(x)]
+
+    out = [None] * len(paths)
+
+    def fill(i):
+        try:
+            file = uproot3.rootio.open(paths[i], localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)
+        except Exception:
+            return sys.exc_info()
+        else:
+            try:
+                try:
+                    tree = file[treepath]
+                except KeyError:
+                    out[i] = []
+                else:
+                    out[i] = [(paths[i], start, stop) for start, stop in tree._bytepartitions(numbytes, branches, {})]
+            except Exception:
+                return sys.exc_info()
+            else:
+                return None
+            finally:
+                file._context.source.close()
+
+    if executor is None:
+        for i in range(len(paths)):
+            _delayedraise(fill(i))
+        excinfos = ()
+    else:
+        excinfos = executor.map(fill, range(len(paths)))
+
+    def wait():
+        for excinfo in excinfos:
+            _delayedraise(excinfo)
+        return [task for tasks in out for task in tasks]
+
+    if blocking:
+        return wait()
+    else:
+        return wait
+
+# the TTree last opened by mapreduce in this process (or thread); consecutive tasks usually come from the same file
+_mapreduce_local = threading.local()
+
+def _mapreduce_task(fcn, treepath, path, entrystart, entrystop, localsource, xrootdsource, httpsource, options):
+    if getattr(_mapreduce_local, "key", None) != (path, treepath):
+        _mapreduce_local.key = None
+        _mapreduce_local.tree = uproot3.rootio.open(path, localsource=localsource, xrootdsource=xrootdsource, httpsource=httpsource, **options)[treepath]
+        _mapreduce_local.key = (path, treepath)
+    return fcn(_mapreduce_local.tree, entrystart, entrystop)
+
+def mapreduce(tasks, treepath, fcn, reduce, executor=None, numworkers=None, localsource=MemmapSource.defaults, xrootdsource=XRootDSource.defaults, httpsource=HTTPSource.defaults, **options):
+    try:
+        import concurrent.futures
+    except ImportError:
+        raise ImportError("Install futures package (for mapreduce) with:\n    pip install futures\nor\n    conda install -c conda-forge futures")
+
+    ownexecutor = executor is None
+    if ownexecutor:
+        executor = concurrent.futures.ProcessPoolExecutor(numworkers)
+    if numworkers is None:
+        numworkers = getattr(executor, "_max_workers", None) or multiprocessing.cpu_count()
+
+    # workers take the next task as soon as they finish one, so a slow task doesn't hold up the others; a bounded
+    # number of tasks is in flight and results are reduced as they arrive
+    tasks = iter(tasks)
+    inflight = set()
+    def submitnext():
+        task = next(tasks, None)
+        if task is not None:
+            path, entrystart, entrystop = task
+            inflight.add(executor.submit(_mapreduce_task, fcn, treepath, path, entrystart, entrystop, localsource, xrootdsource, httpsource, options))
+
+    out = None
+    first = True
+    try:
+        for i in range(2 * numworkers):
+            submitnext()
+        while len(inflight) > 0:
+            done, notdone = concurrent.futures.wait(inflight, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                inflight.remove(future)
+                result = future.result()
+                if first:
+                    out = result
+                    first = False
+                else:
+                    out = reduce(out, result)
+                submitnext()
+        return out
+
+    finally:
+        for future in inflight:
+            future.cancel()
+        if ownexecutor:
+            executor.shutdown()